@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+asyncio 크롤 백엔드
+crawl_date → crawl_game_detail → crawl_single_game 팬아웃을 비동기로 실행한다.
+HTTP 요청/파싱 자체는 SimpleCrawler의 동기 메서드를 스레드에서 재사용하고,
+호스트별 세마포어로 동시성을 제한하며 날짜 단위 타임아웃 시 남은 작업을 취소한다.
+"""
+
+import asyncio
+from urllib.parse import urlsplit
+
+
+class AsyncCrawlBackend:
+    """SimpleCrawler의 파싱 로직을 공유하는 asyncio 팬아웃 엔진"""
+
+    def __init__(self, crawler, per_host_limit=3, date_timeout=120.0, max_concurrent_dates=None):
+        self.crawler = crawler
+        self.logger = crawler.logger
+        self.per_host_limit = max(1, int(per_host_limit))
+        self.date_timeout = date_timeout
+        # 동시에 진행할 날짜 수 (타임아웃은 슬롯을 잡은 뒤부터 계산)
+        self.max_concurrent_dates = max(1, int(max_concurrent_dates or self.per_host_limit))
+        self._semaphores = {}
+
+    def _semaphore(self, url):
+        # asyncio.Semaphore는 이벤트 루프마다 새로 만들어야 하므로 crawl_*_sync 진입 시 초기화됨
+        host = urlsplit(url).netloc.lower()
+        sem = self._semaphores.get(host)
+        if sem is None:
+            sem = asyncio.Semaphore(self.per_host_limit)
+            self._semaphores[host] = sem
+        return sem
+
+    async def _call(self, url, func, *args, **kwargs):
+        """호스트 슬롯을 잡은 상태로 동기 함수를 스레드에서 실행"""
+        async with self._semaphore(url):
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def _fetch_soup(self, url, target_date, archive_key, page_type):
+        return await self._call(url, self.crawler.fetch_soup, url, wait_css='table',
+                                final_since=self.crawler.final_since(target_date),
+                                archive_key=archive_key, page_type=page_type)
+
+    async def crawl_single_game(self, game_url, target_date):
+        soup = await self._fetch_soup(game_url, target_date, self.crawler.game_archive_key(game_url, target_date), 'npb_game')
+        if soup is None:
+            self.logger.warning(f"⚠️ Failed to crawl single game: {game_url} - no response")
+            return None
+        return self.crawler.crawl_single_game(game_url, target_date, soup=soup)
+
+    async def crawl_game_detail(self, target_date):
+        url = self.crawler.npb_scores_url(target_date)
+        self.logger.info(f"🔍 Checking game details: {target_date.strftime('%Y-%m-%d')}")
+        try:
+            soup = await self._fetch_soup(url, target_date, ('npb', target_date, None), 'npb_day')
+            if soup is None:
+                return []
+            game_urls = self.crawler.extract_game_links(soup, target_date)
+            # 경기별 상세 페이지를 동시에 요청하고 페이지 순서대로 결과 정리
+            results = await asyncio.gather(*(self.crawl_single_game(u, target_date) for u in game_urls))
+            return [game for game in results if game]
+        except Exception as e:
+            # 동기 경로와 같이 실패한 날짜는 빈 목록 → 닛칸스포츠로 폴백 (취소는 그대로 전파)
+            self.logger.error(f"❌ Failed to crawl games for {target_date.strftime('%Y-%m-%d')}: {e}")
+            return []
+
+    async def crawl_date(self, target_date):
+        self.logger.info(f"🔍 Crawling: {target_date.strftime('%Y-%m-%d')}")
+        if self.crawler.hedge_delay is not None and self.crawler.source_available('npb'):
+            games = await self.crawl_date_hedged(target_date)
+        else:
+            # npb.jp 서킷이 열려 있으면 바로 닛칸스포츠로
+            games = await self.crawl_game_detail(target_date) if self.crawler.source_available('npb') else []
+            if not games:
+                games = await self._crawl_nikkansports(target_date)
+        self.crawler.log_date_games(target_date, games)
+        return games
+
+    async def _crawl_nikkansports(self, target_date):
+        url = self.crawler.nikkansports_url(target_date)
+        return await self._call(url, self.crawler.crawl_from_nikkansports, target_date)
+
+    async def crawl_date_hedged(self, target_date):
+        """NPB가 hedge_delay 안에 끝나지 않으면 닛칸스포츠도 시작해 먼저 경기 목록을 준 쪽 사용"""
+        primary = asyncio.create_task(self.crawl_game_detail(target_date))
+        done, _ = await asyncio.wait({primary}, timeout=self.crawler.hedge_delay or 0)
+        if primary in done:
+            return primary.result() or await self._crawl_nikkansports(target_date)
+
+        self.crawler.record_hedge('fired')
+        secondary = asyncio.create_task(self._crawl_nikkansports(target_date))
+        sources = {primary: 'npb', secondary: 'nikkansports'}
+        pending = set(sources)
+        games = []
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if not task.cancelled() and task.exception() is None and task.result():
+                        self.crawler.record_hedge(sources[task])
+                        return task.result()
+        finally:
+            # 진 쪽은 취소 (이미 스레드에서 실행 중인 요청은 끝까지 가고 결과만 버림)
+            for task in pending:
+                task.cancel()
+        return games
+
+    async def _crawl_date_with_timeout(self, target_date, date_slots, on_result=None):
+        try:
+            async with date_slots:
+                games = await asyncio.wait_for(self.crawl_date(target_date), timeout=self.date_timeout)
+        except asyncio.TimeoutError:
+            self.logger.error(f"⏱️ Crawl timed out after {self.date_timeout:.0f}s: {target_date.strftime('%Y-%m-%d')}")
+            games = []
+        except Exception as e:
+            self.logger.error(f"❌ Async crawl failed for {target_date.strftime('%Y-%m-%d')}: {e}")
+            games = []
+        if on_result:
+            # 저널 기록(fsync)은 블로킹이므로 스레드에서
+            await asyncio.to_thread(on_result, target_date, games)
+        return games
+
+    async def crawl_dates(self, dates, on_result=None):
+        """여러 날짜를 동시에 크롤링 - 결과는 입력 순서대로 반환"""
+        date_slots = asyncio.Semaphore(self.max_concurrent_dates)
+        return list(await asyncio.gather(*(self._crawl_date_with_timeout(d, date_slots, on_result) for d in dates)))
+
+    # ===== 동기 래퍼 (main(), backfill_dates.py 등 기존 호출부용) =====
+    def crawl_dates_sync(self, dates, on_result=None):
+        self._semaphores = {}
+        return asyncio.run(self.crawl_dates(list(dates), on_result=on_result))
+
+    def crawl_date_sync(self, target_date):
+        return self.crawl_dates_sync([target_date])[0]
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+크롤 저널 (JSONL)
+날짜 하나를 끝낼 때마다 결과를 한 줄씩 추가하고 fsync 해, 프로세스가 중간에
+종료되어도 이미 받은 날짜를 --resume 으로 이어받을 수 있게 한다.
+최종 병합(games_raw.txt 저장)이 끝나면 저널을 비운다.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+
+class CrawlJournal:
+    """data/cache/crawl_journal.jsonl - {"date", "games", "at"} 한 줄 = 완료된 날짜 하나"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._tail_checked = False
+
+    def load(self):
+        """날짜 → 경기 목록 (같은 날짜가 여러 번 있으면 마지막 기록 사용)
+        강제 종료로 마지막 줄이 잘렸으면 그 줄만 무시한다."""
+        entries = {}
+        if not self.path.exists():
+            return entries
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(entry, dict) and entry.get('date'):
+                    entries[entry['date']] = entry.get('games') or []
+        return entries
+
+    def append(self, date_str, games):
+        """완료된 날짜 기록 - 한 줄 쓰기 후 flush + fsync
+        이 저널에 처음 쓸 때 잘린 마지막 줄이 있으면 먼저 잘라낸다."""
+        line = json.dumps({'date': date_str, 'games': games or [], 'at': time.time()}, ensure_ascii=False)
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if not self._tail_checked:
+                self._drop_partial_tail()
+                self._tail_checked = True
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _drop_partial_tail(self):
+        """강제 종료로 잘린 마지막 줄(개행 없음)을 지운다 - 그대로 두면 다음 기록이 그 뒤에 붙어 함께 버려진다"""
+        try:
+            f = open(self.path, 'rb+')
+        except FileNotFoundError:
+            return
+        with f:
+            size = f.seek(0, os.SEEK_END)
+            if not size:
+                return
+            f.seek(size - 1)
+            if f.read(1) == b'\n':
+                return
+            # 마지막 개행 위치를 뒤에서부터 찾아 그 뒤를 잘라낸다
+            end = size
+            while end > 0:
+                start = max(0, end - 65536)
+                f.seek(start)
+                idx = f.read(end - start).rfind(b'\n')
+                if idx >= 0:
+                    end = start + idx + 1
+                    break
+                end = start
+            f.truncate(end)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def clear(self):
+        with self._lock:
+            try:
+                self.path.unlink()
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+증분 크롤 플래너
+기존 games_raw.txt를 읽어 날짜별 상태(확정/예정/연기/없음)를 분류하고
+아직 바뀔 수 있는 날짜만 크롤 대상으로 남긴다.
+경기가 없던 날(휴식일)은 data/cache/crawl_planner.json에 기록해 다시 요청하지 않는다.
+"""
+
+import json
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from games_txt import iter_games
+
+FINAL = 'final'
+SCHEDULED = 'scheduled'
+POSTPONED = 'postponed'
+MISSING = 'missing'
+EMPTY = 'empty'
+RECENT = 'recent'
+
+# 크롤이 필요 없는 상태
+SKIP_STATUSES = (FINAL, EMPTY)
+
+
+def merge_status(current, new):
+    """날짜 상태는 가장 '덜 확정된' 경기 기준 (연기 > 예정 > 확정)"""
+    order = {FINAL: 0, SCHEDULED: 1, POSTPONED: 2}
+    if current is None or order[new] > order[current]:
+        return new
+    return current
+
+
+class CrawlPlanner:
+    """games_raw.txt 기반 날짜별 크롤 필요 여부 판단"""
+
+    def __init__(self, games_file, state_file=None, final_after_days=2, logger=None):
+        self.games_file = Path(games_file)
+        self.state_file = Path(state_file) if state_file else None
+        self.final_after_days = final_after_days
+        self.logger = logger
+        self.date_status = {}
+        self.empty_dates = set()
+        self._loaded = False
+
+    def load(self):
+        """games_raw.txt(가독/파이프 형식)와 휴식일 기록을 읽어 날짜별 상태 구성"""
+        self.date_status = {}
+        if self.games_file.exists():
+            for game in iter_games(self.games_file):
+                status = game.status if game.status in (SCHEDULED, POSTPONED) else FINAL
+                self.date_status[game.date] = merge_status(self.date_status.get(game.date), status)
+
+        self.empty_dates = set()
+        if self.state_file and self.state_file.exists():
+            try:
+                with open(self.state_file, 'r', encoding='utf-8') as f:
+                    self.empty_dates = set(json.load(f).get('empty_dates', []))
+            except (OSError, ValueError):
+                self.empty_dates = set()
+        self._loaded = True
+        return self
+
+    def is_settled(self, target_date, now=None):
+        """경기일로부터 final_after_days가 지나야 결과 변경(진행 중 점수 등) 가능성이 없다고 본다"""
+        now = now or datetime.now()
+        day = datetime(target_date.year, target_date.month, target_date.day)
+        return day + timedelta(days=self.final_after_days) <= now
+
+    def classify(self, target_date, now=None):
+        """날짜 상태: final/empty는 건너뛰고 나머지는 크롤 대상"""
+        if not self._loaded:
+            self.load()
+        key = target_date.strftime('%Y-%m-%d')
+        status = self.date_status.get(key)
+        if status is None:
+            status = EMPTY if key in self.empty_dates else MISSING
+        if status in SKIP_STATUSES and not self.is_settled(target_date, now):
+            # 최근 날짜의 결과는 진행 중 점수(inprogress)일 수 있어 다시 확인
+            return RECENT
+        return status
+
+    def plan(self, dates, force=False, now=None):
+        """크롤이 필요한 날짜만 입력 순서대로 반환"""
+        if force:
+            if self.logger:
+                self.logger.info(f"🧭 Crawl plan: --force, crawling all {len(dates)} dates")
+            return list(dates)
+
+        counts = {}
+        todo = []
+        for target_date in dates:
+            status = self.classify(target_date, now)
+            counts[status] = counts.get(status, 0) + 1
+            if status not in SKIP_STATUSES:
+                todo.append(target_date)
+
+        if self.logger:
+            summary = ', '.join(f"{name}={counts[name]}" for name in (FINAL, EMPTY, RECENT, SCHEDULED, POSTPONED, MISSING) if name in counts)
+            self.logger.info(f"🧭 Crawl plan: {len(todo)}/{len(dates)} dates to crawl ({summary})")
+        return todo
+
+    def record_empty_dates(self, date_strs, now=None):
+        """확정 기간이 지났고 경기 없음이 확인된 날짜(YYYY-MM-DD)를 휴식일로 기록"""
+        if not self.state_file:
+            return
+        if not self._loaded:
+            self.load()
+        new_dates = {
+            d for d in date_strs
+            if d not in self.empty_dates and d not in self.date_status
+            and self.is_settled(datetime.strptime(d, '%Y-%m-%d'), now)
+        }
+        if not new_dates:
+            return
+        self.empty_dates |= new_dates
+        try:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.state_file.with_name(self.state_file.name + f".tmp{os.getpid()}")
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'empty_dates': sorted(self.empty_dates)}, f, ensure_ascii=False, indent=2)
+            os.replace(tmp, self.state_file)
+        except OSError as e:
+            if self.logger:
+                self.logger.warning(f"⚠️ Failed to save crawl planner state: {e}")
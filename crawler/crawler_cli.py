@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+simple_crawler.py 명령행 처리
+인자를 먼저 검증하고, 실제로 크롤할 때만 crawler_core(SimpleCrawler)를 import한다.
+--help나 잘못된 인자는 크롤러 본체를 읽지 않고 바로 끝난다.
+"""
+
+import sys
+from datetime import datetime
+
+def pop_option(argv, name):
+    """argv에서 '--name VALUE' 형태 옵션을 꺼내 값 반환 (없으면 None)"""
+    if name not in argv:
+        return None
+    idx = argv.index(name)
+    value = argv[idx + 1] if idx + 1 < len(argv) else None
+    del argv[idx:idx + 2]
+    return value
+
+def print_usage():
+    print("  --full-season    : Crawl entire season")
+    print("  --test           : Test crawl (3 days)")
+    print("  --quick          : Quick crawl (1 day)")
+    print("  --upcoming       : Upcoming games (30 days)")
+    print("  --reparse-from-archive : Rebuild games_raw.txt from data/raw/html (no network)")
+    print("  --date YYYY-MM-DD : Crawl a single date")
+    print("  <number>         : Crawl specific number of days")
+    print("  --workers N      : Crawl dates in parallel with N workers")
+    print("  --backend async  : Use the asyncio crawl backend")
+    print("  --force          : Re-crawl dates already final in games_raw.txt")
+    print("  --resume         : Continue an interrupted crawl from its journal")
+    print("  --hedge SECONDS  : Also fetch Nikkansports if NPB is slower than SECONDS")
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if '--help' in argv or '-h' in argv:
+        print("Usage: python3 crawler/simple_crawler.py [command] [options]")
+        print_usage()
+        return 0
+    workers = pop_option(argv, '--workers')
+    if workers is not None:
+        try:
+            workers = int(workers)
+        except ValueError:
+            workers = 0
+        if workers < 1:
+            print("❌ Invalid --workers value. Please use a positive integer.")
+            return 1
+    
+    backend = pop_option(argv, '--backend')
+    if backend is not None and backend not in ('thread', 'async'):
+        print("❌ Invalid --backend value. Use 'thread' or 'async'.")
+        return 1
+    
+    hedge_delay = pop_option(argv, '--hedge')
+    if hedge_delay is not None:
+        try:
+            hedge_delay = float(hedge_delay)
+        except ValueError:
+            print("❌ Invalid --hedge value. Use seconds (0 = fetch both sources at once).")
+            return 1
+    
+    # --force: 증분 플래너를 무시하고 범위 내 모든 날짜 크롤
+    force = '--force' in argv
+    if force:
+        argv.remove('--force')
+    # --resume: 중단된 크롤의 저널(data/cache/crawl_journal.jsonl)에서 이어받기
+    resume = '--resume' in argv
+    if resume:
+        argv.remove('--resume')
+    
+    # 크롤러(HTTP 세션, 플래너, 로그 파일)를 만들기 전에 명령 검증
+    command = argv[0] if argv else None
+    target_date = None
+    days = 7
+    if command == '--date' and len(argv) > 1:
+        try:
+            target_date = datetime.strptime(argv[1], '%Y-%m-%d')
+        except ValueError:
+            print("❌ Invalid date format. Please use YYYY-MM-DD.")
+            return 1
+    elif command not in (None, '--full-season', '--test', '--quick', '--reparse-from-archive', '--upcoming'):
+        try:
+            days = int(command)
+        except ValueError:
+            print("❌ Invalid argument. Available options:")
+            print_usage()
+            return 1
+    
+    # 여기까지 통과한 실행만 크롤러 본체(crawler_core)를 import
+    from crawler_core import SimpleCrawler
+
+    crawler = SimpleCrawler(workers=workers, backend=backend, force=force, resume=resume, hedge_delay=hedge_delay)
+    
+    if command == '--full-season':
+        # 전체 시즌 크롤링 (3월 28일부터)
+        games_count = crawler.crawl_full_season("2025-03-28")
+        print(f"\n🏆 Full season crawl completed: {games_count} games collected")
+    elif command == '--test':
+        games_count = crawler.crawl_multiple_days(3)
+        print(f"\n✅ Test crawl completed: {games_count} games collected")
+    elif command == '--quick':
+        games_count = crawler.crawl_multiple_days(1)
+        print(f"\n⚡ Quick crawl completed: {games_count} games collected")
+    elif command == '--reparse-from-archive':
+        # 네트워크 없이 아카이브 원본만으로 재파싱
+        games_count = crawler.reparse_from_archive()
+        print(f"\n🗄️ Archive re-parse completed: {games_count} games collected")
+    elif command == '--upcoming':
+        # 예정 경기 크롤링 (기본 30일)
+        upcoming_games = crawler.crawl_upcoming_games(30)
+        games_count = len(upcoming_games)
+        print(f"\n📅 Upcoming games crawl completed: {games_count} games found")
+    elif target_date is not None:
+        games = crawler.crawl_date(target_date)
+        if games:
+            crawler.save_games_to_txt(games)
+        games_count = len(games)
+        print(f"\n✅ Crawl for date {argv[1]} completed: {games_count} games collected")
+    elif command is not None:
+        games_count = crawler.crawl_multiple_days(days)
+        print(f"\n✅ Crawl completed: {games_count} games collected")
+    else:
+        # 기본: 7일
+        games_count = crawler.crawl_multiple_days(days)
+        print(f"\n✅ Default crawl completed: {games_count} games collected")
+
+    crawler.log_network_summary()
+    crawler.close()
+
+    if games_count is None:
+        return 1
+
+    if isinstance(games_count, int) and games_count < 0:
+        return 1
+
+    if games_count == 0:
+        print("\nℹ️ No games were collected for the requested window. Keeping existing data.")
+        return 0
+
+    return 0
@@ -0,0 +1,1696 @@
+#!/usr/bin/env python3
+"""
+NPB Simple Crawler 본체 - 직접 TXT 저장 방식
+크롤링 → TXT 저장 → JSON 변환(txt_to_json)
+실행 진입점은 simple_crawler.py, 인자 처리는 crawler_cli.py
+"""
+
+import importlib.util
+
+# 크롤 의존성(requests, beautifulsoup4와 이를 쓰는 http_client/http_cache/html_parsing)은
+# SimpleCrawler를 만들 때 load_crawling_modules()로 처음 import한다.
+# --help, 인자 검증 등 크롤하지 않는 실행은 이 비용 없이 바로 시작한다.
+CRAWLING_ENABLED = all(importlib.util.find_spec(name) is not None for name in ('requests', 'bs4'))
+if not CRAWLING_ENABLED:
+    print("⚠️ Web crawling dependencies not available (requests, beautifulsoup4)")
+    print("📄 Using existing data conversion instead...")
+requests = None
+HttpClient = None
+HttpCache = None
+HtmlParser = None
+
+# Optional Selenium support (dynamic pages) - 첫 브라우저 폴백 때 import
+SELENIUM_AVAILABLE = all(importlib.util.find_spec(name) is not None for name in ('selenium', 'webdriver_manager'))
+
+
+def load_crawling_modules():
+    """requests/bs4 기반 모듈을 import해 모듈 전역에 연결 (처음 한 번만, 실패하면 CRAWLING_ENABLED = False)"""
+    global CRAWLING_ENABLED, requests, HttpClient, HttpCache, HtmlParser
+    if not CRAWLING_ENABLED or requests is not None:
+        return CRAWLING_ENABLED
+    try:
+        import requests as requests_module
+        from http_client import HttpClient as http_client_cls
+        from http_cache import HttpCache as http_cache_cls
+        from html_parsing import HtmlParser as html_parser_cls
+    except ImportError:
+        print("⚠️ Web crawling dependencies not available (requests, beautifulsoup4)")
+        print("📄 Using existing data conversion instead...")
+        CRAWLING_ENABLED = False
+        return False
+    HttpClient, HttpCache, HtmlParser = http_client_cls, http_cache_cls, html_parser_cls
+    requests = requests_module
+    return True
+
+import atexit
+import json
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+import time
+import logging
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+
+from crawl_planner import CrawlPlanner
+from crawl_journal import CrawlJournal
+from selenium_pool import DriverPool, NegativeCache
+from rate_limit import HostRateLimiter
+from resilience import RetryPolicy, CircuitBreaker, CircuitOpenError, is_retryable_status
+from html_archive import HtmlArchive
+from team_resolver import TeamResolver
+import teams
+import games_txt
+from game_record import Game, intern_team
+from games_index import index_file_for
+import parsing_primitives as pp
+from score_table import PageInfoIndex, ScoreTableView, detect_completion, detect_game_status, has_draw_keyword
+
+class DeferredFileHandler(logging.FileHandler):
+    """첫 로그 기록 때 디렉토리를 만들고 파일을 여는 FileHandler (로그 없이 끝나는 실행은 아무것도 만들지 않음)"""
+
+    def __init__(self, filename):
+        super().__init__(filename, delay=True)
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
+class SimpleCrawler:
+    def __init__(self, pool_size=None, workers=None, backend=None, force=False, resume=False, hedge_delay=None):
+        self.project_root = Path(__file__).parent.parent
+        self.data_dir = self.project_root / "data" / "simple"
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        
+        self.setup_logging()
+        
+        # 팀 정보는 teams 레지스트리 (표시명 → Team은 별칭 트라이 해석기)
+        self.team_resolver = TeamResolver()
+        # Selenium driver holder
+        # Selenium 폴백: 드라이버 풀(SELENIUM_POOL_SIZE, SELENIUM_MAX_PAGES) + 실패 URL 네거티브 캐시
+        self._driver_pool = None
+        self._driver_lock = threading.Lock()
+        self.negative_cache = NegativeCache(
+            self.project_root / "data" / "cache" / "selenium_negative.json",
+            ttl=float(os.environ.get('SELENIUM_NEGATIVE_TTL', str(6 * 3600))),
+        )
+        self.use_selenium = (os.environ.get('USE_SELENIUM') == '1') and SELENIUM_AVAILABLE
+        # 날짜 병렬 크롤 워커 수 (1 = 기존 순차 방식)
+        if workers is None:
+            workers = int(os.environ.get('CRAWLER_WORKERS', '1'))
+        self.workers = max(1, int(workers))
+        # 크롤 백엔드: 'thread'(기본, 동기/스레드 풀) 또는 'async'(asyncio 팬아웃)
+        self.backend = (backend or os.environ.get('CRAWLER_BACKEND') or 'thread').lower()
+        self._async_backend = None
+        # NPB 월별 캘린더 인덱스 캐시: (year, month) → (로드 시각, day → 경기 목록)
+        self._calendar_index = {}
+        self._calendar_lock = threading.Lock()
+        self.calendar_ttl = float(os.environ.get('CALENDAR_TTL', '600'))
+        # 소스 기본 URL (로컬 대역 서버로 교체 가능)
+        self.npb_base_url = os.environ.get('NPB_BASE_URL', 'https://npb.jp').rstrip('/')
+        self.nikkansports_base_url = os.environ.get('NIKKANSPORTS_BASE_URL', 'https://www.nikkansports.com').rstrip('/')
+        # 호스트별 keep-alive 세션 풀 (모든 크롤 경로가 공유)
+        if pool_size is None:
+            pool_size = int(os.environ.get('CRAWLER_POOL_SIZE', '10'))
+        max_per_host = int(os.environ.get('CRAWLER_MAX_PER_HOST', '3'))
+        # 디스크 HTTP 캐시 (HTTP_CACHE=0 으로 비활성화)
+        # 경기일로부터 CACHE_FINAL_AFTER_DAYS일이 지난 뒤 받아 둔 페이지는 재요청 없이 사용
+        self.final_after_days = int(os.environ.get('CACHE_FINAL_AFTER_DAYS', '2'))
+        cache = None
+        load_crawling_modules()
+        if CRAWLING_ENABLED and os.environ.get('HTTP_CACHE', '1') != '0':
+            cache = HttpCache(self.project_root / "data" / "cache" / "http")
+        # 호스트별 토큰 버킷: CRAWLER_RATE(초당 요청 수), CRAWLER_BURST(연속 허용 수)
+        # 429/5xx·Retry-After에 맞춰 자동으로 속도를 낮춤 (고정 sleep 대체)
+        self.limiter = None
+        if CRAWLING_ENABLED:
+            self.limiter = HostRateLimiter(
+                rate=float(os.environ.get('CRAWLER_RATE', '3')),
+                burst=int(os.environ.get('CRAWLER_BURST', '6')),
+            )
+        self.http = HttpClient(pool_size=pool_size, max_per_host=max_per_host, cache=cache, limiter=self.limiter) if CRAWLING_ENABLED else None
+        # 소스 헤지: CRAWLER_HEDGE_DELAY초 안에 NPB가 끝나지 않으면 닛칸스포츠도 요청 (0 = 동시 시작, 미설정 = 끔)
+        if hedge_delay is None and os.environ.get('CRAWLER_HEDGE_DELAY'):
+            hedge_delay = float(os.environ['CRAWLER_HEDGE_DELAY'])
+        self.hedge_delay = None if hedge_delay is None else max(0.0, float(hedge_delay))
+        self.hedge_stats = {'fired': 0, 'npb': 0, 'nikkansports': 0}
+        self._hedge_lock = threading.Lock()
+        # 일시적 오류 재시도 (CRAWLER_RETRIES회, CRAWLER_BACKOFF초 기준 지수 백오프 + 지터)
+        # 소스별 서킷 브레이커: 연속 CRAWLER_BREAKER_THRESHOLD회 실패 시 CRAWLER_BREAKER_RESET초 동안 요청 중단
+        self.retry_policy = None
+        self.breakers = {}
+        if CRAWLING_ENABLED:
+            self.retry_policy = RetryPolicy(
+                attempts=int(os.environ.get('CRAWLER_RETRIES', '3')),
+                base_delay=float(os.environ.get('CRAWLER_BACKOFF', '0.5')),
+            )
+            for source in ('npb', 'nikkansports'):
+                self.breakers[source] = CircuitBreaker(
+                    source,
+                    failure_threshold=int(os.environ.get('CRAWLER_BREAKER_THRESHOLD', '3')),
+                    reset_timeout=float(os.environ.get('CRAWLER_BREAKER_RESET', '300')),
+                )
+        # HTML 파서: HTML_PARSER=auto|lxml|html.parser, HTML_STRAINER=0 이면 전체 페이지 파싱
+        self.parser = None
+        if CRAWLING_ENABLED:
+            self.parser = HtmlParser(
+                backend=os.environ.get('HTML_PARSER', 'auto'),
+                use_strainers=os.environ.get('HTML_STRAINER', '1') != '0',
+                profile=os.environ.get('PARSE_PROFILE') == '1',
+                logger=self.logger,
+            )
+        # 원본 HTML gzip 아카이브 (ARCHIVE_HTML=0 으로 비활성화)
+        self.archive = None
+        if CRAWLING_ENABLED and os.environ.get('ARCHIVE_HTML', '1') != '0':
+            self.archive = HtmlArchive(self.project_root / "data" / "raw" / "html")
+        # 증분 크롤: games_raw.txt에서 이미 확정된 날짜는 건너뜀 (--force 로 전체 크롤)
+        self.force = force
+        self.planner = CrawlPlanner(
+            self.data_dir / "games_raw.txt",
+            state_file=self.project_root / "data" / "cache" / "crawl_planner.json",
+            final_after_days=self.final_after_days,
+            logger=self.logger,
+        )
+        # 날짜별 결과 저널 (중단 후 --resume 으로 이어받기)
+        self.resume = resume
+        self.journal = CrawlJournal(self.project_root / "data" / "cache" / "crawl_journal.jsonl")
+        # 스코어 페이지가 404였던 날짜 (휴식일 기록용, 빈 페이지는 차단일 수 있어 제외)
+        self.no_game_dates = set()
+    
+    def setup_logging(self):
+        log_dir = self.project_root / "logs" / "simple_crawler"
+        log_file = log_dir / f"crawler_{datetime.now().strftime('%Y%m%d')}.log"
+        log_format = '%(asctime)s - %(levelname)s - %(message)s'
+        # 파이프라인처럼 이미 로깅을 설정한 프로세스 안에서 돌면 그 핸들러로 흘려보내고
+        # 크롤러 일별 로그 파일만 추가로 붙인다
+        embedded = bool(logging.getLogger().handlers)
+        
+        logging.basicConfig(
+            level=logging.INFO,
+            format=log_format,
+            handlers=[
+                DeferredFileHandler(log_file),
+                logging.StreamHandler()
+            ]
+        )
+        self.logger = logging.getLogger('simple_crawler')
+        if embedded and not any(isinstance(h, DeferredFileHandler) for h in self.logger.handlers):
+            file_handler = DeferredFileHandler(log_file)
+            file_handler.setFormatter(logging.Formatter(log_format))
+            self.logger.addHandler(file_handler)
+
+    # ===== Selenium helpers =====
+    def create_driver(self):
+        """헤드리스 Chrome 하나 기동 (DriverPool factory)"""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options as ChromeOptions
+        from selenium.webdriver.chrome.service import Service as ChromeService
+        from webdriver_manager.chrome import ChromeDriverManager
+        options = ChromeOptions()
+        options.add_argument('--headless=new')
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--disable-gpu')
+        options.add_argument('--window-size=1280,800')
+        service = ChromeService(ChromeDriverManager().install())
+        driver = webdriver.Chrome(service=service, options=options)
+        self.logger.info('🧭 Selenium Chrome driver initialized')
+        return driver
+
+    def driver_pool(self):
+        """Selenium 드라이버 풀 (지연 생성, 프로세스 종료 시 자동 close)"""
+        with self._driver_lock:
+            if self._driver_pool is None:
+                self._driver_pool = DriverPool(
+                    self.create_driver,
+                    size=int(os.environ.get('SELENIUM_POOL_SIZE', '1')),
+                    max_pages=int(os.environ.get('SELENIUM_MAX_PAGES', '50')),
+                    logger=self.logger,
+                )
+                atexit.register(self._driver_pool.close)
+            return self._driver_pool
+
+    def fetch_soup(self, url, wait_css=None, timeout=15, final_since=None, archive_key=None, page_type=None):
+        """Fetch URL and return BeautifulSoup; try requests first, fallback to Selenium when configured/needed.
+        archive_key=(source, target_date, slug)이면 받은 원본을 아카이브에 저장한다.
+        page_type은 html_parsing.STRAINERS 키 (필요한 요소만 파싱)."""
+        # Try requests (재시도 + 서킷 브레이커)
+        try:
+            resp = self.resilient_get(url, timeout=timeout, final_since=final_since)
+            if resp.status_code == 200 and resp.content:
+                self.archive_page(archive_key, resp)
+                return self.parse_html(resp, page_type)
+            if is_retryable_status(resp.status_code):
+                # 서버 장애 중에는 Selenium도 같은 서버를 부르므로 생략
+                self.logger.info(f"ℹ️ requests returned {resp.status_code} for {url} after retries, skipping Selenium")
+                return None
+            self.logger.info(f"ℹ️ requests returned {resp.status_code} for {url}, considering Selenium fallback")
+        except CircuitOpenError:
+            return None
+        except (requests.ConnectionError, requests.Timeout) as e:
+            self.logger.info(f"ℹ️ requests failed for {url} after retries: {e}")
+            return None
+        except Exception as e:
+            self.logger.info(f"ℹ️ requests failed for {url}: {e}")
+
+        # Fallback to Selenium when available/desired
+        if not SELENIUM_AVAILABLE:
+            return None
+        # 이전에 브라우저로도 실패한 URL은 다시 띄우지 않음
+        if self.negative_cache.contains(url):
+            return None
+        from selenium.common.exceptions import TimeoutException
+        final = final_since is not None and time.time() >= final_since
+        try:
+            with self.driver_pool().driver() as driver:
+                if driver is None:
+                    return None
+                try:
+                    self.limiter.acquire(url)
+                    driver.get(url)
+                    if wait_css:
+                        from selenium.webdriver.common.by import By
+                        from selenium.webdriver.support import expected_conditions as EC
+                        from selenium.webdriver.support.ui import WebDriverWait
+                        WebDriverWait(driver, timeout).until(EC.presence_of_element_located((By.CSS_SELECTOR, wait_css)))
+                    html = driver.page_source
+                except TimeoutException as e:
+                    # 페이지에 기다린 요소가 없음 - 드라이버는 정상이므로 풀에 돌려주고 URL만 기록
+                    self.logger.warning(f"⚠️ Selenium fetch timed out: {e}")
+                    self.negative_cache.add(url, final=final)
+                    return None
+        except Exception as e:
+            # WebDriverException 등은 driver() 컨텍스트를 빠져나가며 드라이버를 broken으로 반납 → 다음 폴백은 새 브라우저
+            self.logger.warning(f"⚠️ Selenium fetch failed: {e}")
+            self.negative_cache.add(url, final=final)
+            return None
+        if archive_key and self.archive is not None:
+            self.archive.store(*archive_key, content=html.encode('utf-8'))
+        return self.parser.parse(html, page_type)
+    
+    def close(self):
+        """브라우저/세션 정리 및 네거티브 캐시 저장"""
+        if self._driver_pool is not None:
+            self._driver_pool.close()
+        self.negative_cache.save()
+        if self.http is not None:
+            self.http.close()
+
+    def log_network_summary(self):
+        """크롤 실행 종료 시 호스트별 연결 재사용/캐시 현황 로그"""
+        if self.http is None:
+            return
+        stats = self.http.connection_stats()
+        if stats:
+            self.logger.info("🔌 **HTTP CONNECTION SUMMARY**:")
+            for host, entry in sorted(stats.items()):
+                self.logger.info(
+                    f"  {host}: {entry['requests']} requests, {entry['connections']} connections opened, {entry['reused']} reused"
+                )
+        if self.http.cache is not None:
+            cs = self.http.cache.stats
+            self.logger.info(
+                f"💾 HTTP cache: {cs['hits']} hits (no network), {cs['revalidated']} revalidated (304), "
+                f"{cs['misses']} misses, {cs['bytes_saved'] / 1024:.1f}KB saved"
+            )
+        if self.limiter is not None:
+            for host, entry in sorted(self.limiter.stats().items()):
+                self.logger.info(
+                    f"🚦 {host}: {entry['requests']} paced requests, waited {entry['waited']:.1f}s, "
+                    f"throttled {entry['throttled']}x, rate {entry['rate']:.2f}/s"
+                )
+        if self.retry_policy is not None and self.retry_policy.stats['retries']:
+            self.logger.info(f"🔁 Retried {self.retry_policy.stats['retries']} requests with backoff")
+        for source, breaker in sorted(self.breakers.items()):
+            if breaker.stats['failures']:
+                bs = breaker.stats
+                self.logger.info(
+                    f"🔌 {source} circuit: {breaker.state}, {bs['failures']} failures, "
+                    f"opened {bs['opened']}x, {bs['short_circuited']} requests skipped"
+                )
+        if self.hedge_stats['fired']:
+            hs = self.hedge_stats
+            self.logger.info(
+                f"🏁 Hedged {hs['fired']} dates: NPB won {hs['npb']}, Nikkansports won {hs['nikkansports']}"
+            )
+        if self._driver_pool is not None or self.negative_cache.stats['skipped']:
+            ds = self._driver_pool.stats if self._driver_pool is not None else {'launches': 0, 'page_loads': 0, 'recycled': 0}
+            ns = self.negative_cache.stats
+            self.logger.info(
+                f"🧭 Selenium: {ds['launches']} browser launches, {ds['page_loads']} page loads, "
+                f"{ds['recycled']} recycled, {ns['skipped']} skipped (negative cache), {ns['added']} newly cached"
+            )
+        if self.parser is not None and self.parser.stats:
+            self.logger.info(f"⏱️ **PARSE SUMMARY** ({self.parser.backend}, strainers={'on' if self.parser.use_strainers else 'off'}):")
+            for page_type, entry in sorted(self.parser.stats.items()):
+                avg_ms = entry['seconds'] * 1000 / entry['pages']
+                self.logger.info(
+                    f"  {page_type}: {entry['pages']} pages, avg {avg_ms:.1f}ms, max peak {entry['peak_bytes'] / 1024:.0f}KB"
+                )
+        if self.archive is not None and self.archive.stats['stored']:
+            st = self.archive.stats
+            self.logger.info(
+                f"🗄️ Archived {st['stored']} pages ({st['bytes_raw'] / 1024:.1f}KB → {st['bytes_compressed'] / 1024:.1f}KB gz)"
+            )
+
+    def source_of(self, url):
+        """URL의 크롤 소스 이름 (서킷 브레이커 키)"""
+        host = HttpClient.host_of(url)
+        if host == HttpClient.host_of(self.npb_base_url):
+            return 'npb'
+        if host == HttpClient.host_of(self.nikkansports_base_url):
+            return 'nikkansports'
+        return host
+
+    def source_available(self, source):
+        """소스의 서킷이 열려 있으면 False (해당 소스 단계를 건너뜀)"""
+        breaker = self.breakers.get(source)
+        return breaker is None or not breaker.is_open()
+
+    def resilient_get(self, url, **kwargs):
+        """self.http.get + 지수 백오프 재시도 + 소스별 서킷 브레이커
+        서킷이 열려 있으면 CircuitOpenError, 재시도 후에도 연결 실패면 마지막 예외를 그대로 올린다."""
+        source = self.source_of(url)
+        breaker = self.breakers.get(source)
+        if breaker is not None and not breaker.allow():
+            raise CircuitOpenError(f"{source} circuit is open")
+        try:
+            response = self.retry_policy.call(
+                lambda: self.http.get(url, **kwargs),
+                retry_exceptions=(requests.ConnectionError, requests.Timeout),
+                retry_result=lambda r: is_retryable_status(r.status_code),
+            )
+        except Exception:
+            # 재시도는 연결 실패/타임아웃만, 실패 기록은 모든 예외 (TooManyRedirects 등)
+            # half-open 시험 요청이 어떤 예외로 끝나도 서킷이 열린 채로 남지 않도록
+            self.record_source_failure(breaker)
+            raise
+        if breaker is None:
+            return response
+        if getattr(response, 'offline', False):
+            breaker.record_skipped()
+        elif is_retryable_status(response.status_code):
+            self.record_source_failure(breaker)
+        else:
+            breaker.record_success()
+        return response
+
+    def record_source_failure(self, breaker):
+        if breaker is not None and breaker.record_failure():
+            self.logger.warning(
+                f"🔌 {breaker.name} circuit opened after {breaker.failures} failures; skipping it for {breaker.reset_timeout:.0f}s"
+            )
+
+    def parse_html(self, response, page_type=None):
+        """HTTP 응답 본문을 선언된 charset으로 파싱"""
+        return self.parser.parse(response.content, page_type, response.headers.get('Content-Type'))
+
+    def archive_page(self, archive_key, response):
+        """HTTP 응답 원본을 아카이브 (캐시에서 온 응답은 기존 파일이 없을 때만 저장)"""
+        if not archive_key or self.archive is None:
+            return
+        source, target_date, slug = archive_key
+        self.archive.store(source, target_date, response.content, slug=slug,
+                           overwrite=not getattr(response, 'from_cache', False))
+
+    def final_since(self, target_date):
+        """target_date 페이지가 더 이상 바뀌지 않는다고 볼 수 있는 시각(epoch)"""
+        day = datetime(target_date.year, target_date.month, target_date.day)
+        return (day + timedelta(days=self.final_after_days)).timestamp()
+
+    def get_team_info(self, team_name):
+        """팀명으로 레지스트리 Team 찾기 (정확 일치 → 가장 왼쪽·가장 긴 별칭)"""
+        return self.team_resolver.resolve(team_name)
+    
+    def convert_existing_data_to_txt(self):
+        """기존 JSON → TXT 역변환 (크롤링 불가 시 fallback)"""
+        self.logger.info("📄 Converting existing JSON data to TXT format (fallback)...")
+        
+        try:
+            # Use existing json_to_txt_converter script
+            json_to_txt = self.project_root / 'scripts' / 'json_to_txt_converter.py'
+            if json_to_txt.exists():
+                # 별도 python3 프로세스 대신 스크립트 모듈을 불러와 같은 프로세스에서 실행
+                spec = importlib.util.spec_from_file_location('json_to_txt_converter', json_to_txt)
+                converter = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(converter)
+                games_count = converter.create_full_season_data()
+                self.logger.info(f"✅ JSON to TXT conversion completed ({games_count} games)")
+                return True
+            else:
+                # If converter not present, try to proceed with existing TXT files
+                games_txt = self.data_dir / 'games_raw.txt'
+                teams_txt = self.data_dir / 'teams_raw.txt'
+                if games_txt.exists() and teams_txt.exists():
+                    self.logger.info("⚠️ Converter not found, but TXT files already exist. Proceeding.")
+                    return True
+                self.logger.error("❌ JSON to TXT converter not found and TXT files missing")
+                return False
+                
+        except Exception as e:
+            self.logger.error(f"❌ JSON→TXT conversion error: {e}")
+            return False
+
+    def crawl_date(self, target_date):
+        """특정 날짜의 경기 결과 크롤링"""
+        if not CRAWLING_ENABLED:
+            return []  # Skip actual crawling if dependencies unavailable
+        
+        if self.backend == 'async':
+            return self.async_backend().crawl_date_sync(target_date)
+            
+        self.logger.info(f"🔍 Crawling: {target_date.strftime('%Y-%m-%d')}")
+        
+        if self.hedge_delay is not None and self.source_available('npb'):
+            # 헤지 모드: NPB가 hedge_delay 안에 끝나지 않으면 닛칸스포츠를 동시에 시작
+            games = self.crawl_date_hedged(target_date)
+        else:
+            # 1. NPB 공식 사이트에서 경기 정보 시도 (npb.jp 서킷이 열려 있으면 생략)
+            games = self.crawl_game_detail(target_date) if self.source_available('npb') else []
+            
+            # 2. NPB에서 정보를 가져오지 못했으면 닛칸스포츠에서 시도
+            if not games:
+                games = self.crawl_from_nikkansports(target_date)
+        
+        # 3. 경기 상태 로그 출력
+        self.log_date_games(target_date, games)
+        return games
+
+    def crawl_date_hedged(self, target_date):
+        """NPB와 닛칸스포츠 중 먼저 경기 목록을 돌려준 쪽을 사용 (늦은 쪽은 취소)"""
+        cancelled = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='hedge')
+        try:
+            primary = executor.submit(self.crawl_game_detail, target_date, cancelled)
+            try:
+                games = primary.result(timeout=self.hedge_delay) if self.hedge_delay else None
+            except FuturesTimeoutError:
+                games = None
+            if games is not None:
+                # hedge_delay 안에 NPB가 끝남 - 기존 순서와 동일
+                return games or self.crawl_from_nikkansports(target_date)
+
+            self.record_hedge('fired')
+            secondary = executor.submit(self.crawl_from_nikkansports, target_date)
+            sources = {primary: 'npb', secondary: 'nikkansports'}
+            games = []
+            for future in as_completed(sources):
+                try:
+                    games = future.result()
+                except Exception as e:
+                    self.logger.error(f"❌ Hedged {sources[future]} fetch failed: {e}")
+                    games = []
+                if games:
+                    self.record_hedge(sources[future])
+                    break
+            return games
+        finally:
+            # 진 쪽 NPB 경기 페이지 루프는 다음 경기 전에 멈추고, 결과는 버린다
+            cancelled.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def record_hedge(self, key):
+        with self._hedge_lock:
+            self.hedge_stats[key] += 1
+
+    def log_date_games(self, target_date, games):
+        """날짜별 수집 결과 로그 출력"""
+        for game in games:
+            if game.status == 'completed':
+                self.logger.info(f"✅ Completed: {game.away.abbr} {game.away_score}-{game.home_score} {game.home.abbr}")
+            elif game.status == 'postponed':
+                self.logger.info(f"⏸️ Postponed: {game.away.abbr} vs {game.home.abbr}")
+            else:
+                self.logger.info(f"📅 Scheduled: {game.away.abbr} vs {game.home.abbr}")
+        
+        self.logger.info(f"✅ Found {len(games)} games on {target_date.strftime('%Y-%m-%d')}")
+
+    def async_backend(self):
+        """asyncio 크롤 백엔드 (지연 생성)"""
+        if self._async_backend is None:
+            from async_backend import AsyncCrawlBackend
+            self._async_backend = AsyncCrawlBackend(
+                self,
+                per_host_limit=self.http.max_per_host,
+                date_timeout=float(os.environ.get('CRAWLER_DATE_TIMEOUT', '120')),
+                max_concurrent_dates=max(self.workers, self.http.max_per_host),
+            )
+        return self._async_backend
+        
+    def nikkansports_url(self, target_date):
+        """닛칸스포츠 스코어 페이지 URL"""
+        # URL 형식: https://www.nikkansports.com/baseball/professional/score/2025/pf-score-20250328.html
+        date_str = target_date.strftime("%Y%m%d")
+        year = target_date.strftime("%Y")
+        return f"{self.nikkansports_base_url}/baseball/professional/score/{year}/pf-score-{date_str}.html"
+
+    def crawl_from_nikkansports(self, target_date):
+        """닛칸스포츠에서 경기 결과 크롤링 (기존 방식)"""
+        url = self.nikkansports_url(target_date)
+        
+        self.logger.info(f"📰 Trying Nikkansports: {target_date.strftime('%Y-%m-%d')}")
+        
+        try:
+            response = self.resilient_get(url, timeout=15, final_since=self.final_since(target_date))
+            response.raise_for_status()
+            # 헤더/meta에 선언된 charset으로 디코딩, scoreTable·h5만 파싱
+            soup = self.parse_html(response, 'nikkansports')
+            # 레이아웃/차단 이슈로 비어 있을 때 한 번 재시도 (캐시 무시)
+            if not soup.find('table', class_='scoreTable'):
+                response = self.resilient_get(url, timeout=20, cache='refresh')
+                response.raise_for_status()
+                soup = self.parse_html(response, 'nikkansports')
+            self.archive_page(('nikkansports', target_date, None), response)
+            return self.parse_nikkansports_page(soup, target_date)
+            
+        except Exception as e:
+            if isinstance(e, requests.HTTPError) and e.response is not None and e.response.status_code == 404:
+                # 경기 없는 날은 스코어 페이지 자체가 없음
+                self.no_game_dates.add(target_date.strftime('%Y-%m-%d'))
+            self.logger.error(f"❌ Failed to crawl from Nikkansports {target_date.strftime('%Y-%m-%d')}: {e}")
+            return []
+
+    def parse_nikkansports_page(self, soup, target_date):
+        """닛칸스포츠 스코어 페이지(soup)에서 경기 목록 파싱 (네트워크 없음)"""
+        # Keep track of parsed games to prevent duplicates while preferring richer entries
+        strict_games = {}
+        symmetric_map = {}
+
+        # scoreTable 클래스의 테이블들에서 경기 결과 파싱
+        score_tables = soup.find_all('table', class_='scoreTable')
+        # 구장/경기 정보는 페이지당 한 번만 수집
+        page_index = PageInfoIndex(score_tables)
+        
+        for table in score_tables:
+            try:
+                # 테이블 텍스트/셀은 여기서 한 번만 추출
+                view = ScoreTableView.from_table(table)
+                if len(view.rows) < 3:  # 헤더 + 2팀 최소 필요
+                    continue
+                
+                # 팀명 추출 (두 번째 행: away, 세 번째 행: home), 공백 제거 후 매핑
+                away_team_text = (view.cell_text(1, 'team') or '').replace('\xa0', '')
+                home_team_text = (view.cell_text(2, 'team') or '').replace('\xa0', '')
+                
+                away_team = self.get_team_info(away_team_text)
+                home_team = self.get_team_info(home_team_text)
+                
+                if not away_team or not home_team:
+                    self.logger.warning(f"⚠️ Team not found: {away_team_text} vs {home_team_text}")
+                    continue
+                
+                # totalScore 클래스에서 총점 추출
+                away_score_text = view.cell_text(1, 'totalScore')
+                home_score_text = view.cell_text(2, 'totalScore')
+                
+                if away_score_text is None or home_score_text is None:
+                    self.logger.warning(f"⚠️ Could not find totalScore cells")
+                    continue
+
+                # 풀와이드 숫자 포함, 숫자가 없으면 None
+                away_score = pp.convert_jp_number(away_score_text)
+                home_score = pp.convert_jp_number(home_score_text)
+
+                # 경기 상태 정보 추출을 먼저 수행해 중도 취소 등을 감지
+                game_status_info = detect_game_status(view)
+                status = game_status_info['status']
+
+                if status != 'postponed' and pp.is_postponed_score(away_score_text, home_score_text):
+                    status = 'postponed'
+                    game_status_info['status'] = 'postponed'
+
+                # 진행 중인 경기는 저장하지 않음
+                if status == 'inprogress':
+                    if game_status_info['inning'] is not None:
+                        self.logger.info(f"🔄 In-progress game detected: {game_status_info['inning']}회 {game_status_info['inning_half']}")
+                    self.logger.info(f"⏭️ Skipping in-progress game: {away_team.abbr} vs {home_team.abbr}")
+                    continue
+
+                if status == 'postponed':
+                    away_score = None
+                    home_score = None
+                elif away_score is None or home_score is None:
+                    self.logger.info(
+                        f"⏭️  Skipping unparsed/unfinished game: {away_team.abbr} vs {home_team.abbr} (away='{away_score_text}', home='{home_score_text}')"
+                    )
+                    continue
+
+                # 리그 판단: 교류전 확인 후 분류
+                home_league = home_team.league
+                away_league = away_team.league
+
+                if home_league == away_league:
+                    # 같은 리그 내 경기
+                    league = home_league
+                else:
+                    # 교류전: 홈팀 리그로 분류
+                    league = home_league
+
+                # 점수가 있으면서 상태가 불분명할 때만 추가 확인
+                if home_score is not None and away_score is not None and status == 'scheduled':
+                    # 더 정확한 완료 상태 판단
+                    status = detect_completion(view, game_status_info)
+
+                # 상세 경기 정보 수집 (완료된 경기는 더 많은 정보 수집)
+                detailed_info = {}
+                if status == 'completed':
+                    detailed_info = self.extract_detailed_game_info(table, away_team, home_team, view, page_index)
+
+                # 무승부 판정(강화): 완료 && 동점 → 무승부로 간주
+                # 키워드 보강(로그용): 引き分け/引分/規定により引き分け など
+                is_draw = False
+                final_inning = None
+                if status == 'completed' and home_score is not None and away_score is not None:
+                    innings_home = detailed_info.get('inning_scores_home') or []
+                    innings_away = detailed_info.get('inning_scores_away') or []
+                    final_inning = max(len(innings_home), len(innings_away)) if (innings_home or innings_away) else None
+                    if home_score == away_score:
+                        is_draw = True
+                        if has_draw_keyword(view):
+                            self.logger.info("🤝 Draw detected by keyword")
+                        elif final_inning is not None:
+                            self.logger.info(f"🤝 Draw detected by equal score @ {final_inning}回")
+
+                # 경기 정보 (팀은 레지스트리 Team, 이닝별 점수는 압축 배열)
+                game = Game(
+                    target_date.strftime('%Y-%m-%d'), home_team, away_team,
+                    home_score, away_score, league, status, is_draw,
+                    detailed_info.get('inning_scores_away'), detailed_info.get('inning_scores_home'),
+                    inning=game_status_info.get('inning'),
+                    inning_half=game_status_info.get('inning_half'),
+                    game_time=game_status_info.get('game_time'),
+                    final_inning=final_inning,
+                    # 확장 필드들
+                    stadium=detailed_info.get('stadium'),
+                    game_duration=detailed_info.get('game_duration'),
+                    attendance=detailed_info.get('attendance'),
+                    hits_away=detailed_info.get('hits_away'),
+                    hits_home=detailed_info.get('hits_home'),
+                    errors_away=detailed_info.get('errors_away'),
+                    errors_home=detailed_info.get('errors_home'),
+                    weather=detailed_info.get('weather'),
+                    temperature=detailed_info.get('temperature'),
+                )
+
+                strict_key = (game.date, home_team.id, away_team.id)
+                symmetric_key = pp.symmetric_key(game)
+
+                existing_game = strict_games.get(strict_key)
+                if existing_game:
+                    if self.is_game_data_better(game, existing_game):
+                        strict_games[strict_key] = game
+                        self.logger.info(f"🔄 Updated duplicate game with richer data: {away_team.abbr} vs {home_team.abbr}")
+                    else:
+                        self.logger.info(f"⏭️ Duplicate game skipped (existing data richer): {away_team.abbr} vs {home_team.abbr}")
+                    continue
+
+                mirrored_key = symmetric_map.get(symmetric_key)
+                if mirrored_key is not None:
+                    existing_game = strict_games.get(mirrored_key)
+                    if existing_game and self.is_game_data_better(game, existing_game):
+                        strict_games[mirrored_key] = game
+                        self.logger.info(f"🔄 Replaced mirrored duplicate with richer data: {away_team.abbr} vs {home_team.abbr}")
+                    else:
+                        self.logger.info(f"⏭️ Mirrored duplicate skipped: {away_team.abbr} vs {home_team.abbr}")
+                    continue
+
+                strict_games[strict_key] = game
+                symmetric_map[symmetric_key] = strict_key
+
+                score_log = f"{away_score}-{home_score}" if (home_score is not None and away_score is not None) else "--"
+                status_text = f" [{game.status.upper()}]" if game.status != 'completed' else ""
+                self.logger.info(f"✅ Parsed: {away_team.abbr} {score_log} {home_team.abbr}{status_text}")
+                
+            except Exception as e:
+                self.logger.warning(f"⚠️ Failed to parse table: {e}")
+                continue
+        
+        games = list(strict_games.values())
+        return games
+    
+    def extract_detailed_game_info(self, table, away_team, home_team, view=None, page_index=None):
+        """완료된 경기의 상세 정보 추출 (view/page_index: 페이지 파싱 중 이미 만든 ScoreTableView/PageInfoIndex)"""
+        detailed_info = {}
+        
+        try:
+            view = view or ScoreTableView.from_table(table)
+            # 1. 이닝별 득점 추출
+            if len(view.rows) >= 3:
+                # Find the index of the total score column ('R' or '計')
+                total_col_idx = -1
+                for i, cell in enumerate(view.rows[0]):
+                    if cell.text == 'R' or cell.text == '計':
+                        total_col_idx = i
+                        break
+                
+                away_cells = [c.text for c in view.tds(1)]  # 원정팀
+                home_cells = [c.text for c in view.tds(2)]  # 홈팀
+
+                # Slice inning cells based on the location of the 'R' column
+                # It starts after the team name (index 0)
+                if total_col_idx != -1:
+                    inning_cells_away = away_cells[1:total_col_idx]
+                    inning_cells_home = home_cells[1:total_col_idx]
+                else:
+                    # Fallback to old logic if 'R' is not found
+                    inning_cells_away = away_cells[1:-3] if len(away_cells) > 4 else away_cells[1:]
+                    inning_cells_home = home_cells[1:-3] if len(home_cells) > 4 else home_cells[1:]
+
+                # 최대 15회까지만
+                away_innings = [pp.parse_inning_cell(text) for text in inning_cells_away[:15]]
+                home_innings = [pp.parse_inning_cell(text) for text in inning_cells_home[:15]]
+                
+                detailed_info['inning_scores_away'] = away_innings
+                detailed_info['inning_scores_home'] = home_innings
+                
+                # 2. R(득점), H(안타), E(실책) 정보 추출
+                # 보통 테이블의 마지막 3개 컬럼이 R, H, E
+                try:
+                    away_rhe = away_cells[-3:]
+                    home_rhe = home_cells[-3:]
+                    
+                    if len(away_rhe) >= 3:
+                        detailed_info['hits_away'] = int(away_rhe[1]) if away_rhe[1].isdigit() else None
+                        detailed_info['errors_away'] = int(away_rhe[2]) if away_rhe[2].isdigit() else None
+                    
+                    if len(home_rhe) >= 3:
+                        detailed_info['hits_home'] = int(home_rhe[1]) if home_rhe[1].isdigit() else None
+                        detailed_info['errors_home'] = int(home_rhe[2]) if home_rhe[2].isdigit() else None
+                        
+                except ValueError:
+                    pass
+            
+            # 3. 구장 정보 (같은 컨테이너의 구장명, 없으면 홈 구장으로 추정)
+            # 4. 추가 경기 정보 (시간, 관중, 날씨, 기온)
+            page_info = (page_index or PageInfoIndex([table])).lookup(table)
+            detailed_info['stadium'] = page_info['stadium'] or home_team.stadium or '구장미정'
+            for key in ('game_duration', 'attendance', 'weather', 'temperature'):
+                if key in page_info:
+                    detailed_info[key] = page_info[key]
+            
+            self.logger.info(f"📊 Collected detailed info: stadium={detailed_info.get('stadium', 'N/A')}, innings={len(detailed_info.get('inning_scores_away', []))}")
+            
+        except Exception as e:
+            self.logger.warning(f"⚠️ Error extracting detailed game info: {e}")
+        
+        return detailed_info
+    
+    def validate_game_data(self, game):
+        """경기 데이터 유효성 검사"""
+        # 필수 필드 확인
+        for field in ('date', 'home', 'away', 'league'):
+            if getattr(game, field) is None:
+                self.logger.warning(f"⚠️ Missing required field: {field}")
+                return False
+        for side in ('home', 'away'):
+            team = getattr(game, side)
+            if team.id is None or team.abbr is None:
+                self.logger.warning(f"⚠️ Missing required field: {side}_team_{'id' if team.id is None else 'abbr'}")
+                return False
+        
+        # 날짜 형식 검사
+        try:
+            datetime.strptime(game.date, '%Y-%m-%d')
+        except ValueError:
+            self.logger.warning(f"⚠️ Invalid date format: {game.date}")
+            return False
+        
+        # 팀 ID 검사 (레지스트리 1-12)
+        if teams.by_id(game.home.id) is None or teams.by_id(game.away.id) is None:
+            self.logger.warning(f"⚠️ Invalid team IDs: home={game.home.id}, away={game.away.id}")
+            return False
+        
+        # 같은 팀 경기 검사
+        if game.home.id == game.away.id:
+            self.logger.warning(f"⚠️ Same team playing: {game.home.abbr}")
+            return False
+        
+        # 스코어 검사 (있으면 0 이상)
+        if game.home_score is not None:
+            if not isinstance(game.home_score, int) or game.home_score < 0:
+                self.logger.warning(f"⚠️ Invalid home score: {game.home_score}")
+                return False
+        
+        if game.away_score is not None:
+            if not isinstance(game.away_score, int) or game.away_score < 0:
+                self.logger.warning(f"⚠️ Invalid away score: {game.away_score}")
+                return False
+        
+        # 리그 검사
+        if game.league not in teams.LEAGUES:
+            self.logger.warning(f"⚠️ Invalid league: {game.league}")
+            return False
+        
+        return True
+    
+    def is_game_data_better(self, new_game, existing_game):
+        """새 게임 데이터가 기존 데이터보다 더 완전한지 판단"""
+        # 0) 기존 데이터가 명백히 잘못된 경우(약어/리그) 새 데이터 우선
+        def is_valid_game(g):
+            return (
+                isinstance(g.home.abbr, str) and g.home.abbr in teams.BY_ABBR and
+                isinstance(g.away.abbr, str) and g.away.abbr in teams.BY_ABBR and
+                g.league in teams.LEAGUES
+            )
+
+        existing_valid = is_valid_game(existing_game)
+        new_valid = is_valid_game(new_game)
+        if new_valid and not existing_valid:
+            return True
+        if existing_valid and not new_valid:
+            return False
+
+        # 1. 완료된 경기가 미완료 경기보다 우선
+        new_status = new_game.status
+        existing_status = existing_game.status
+        
+        if new_status == 'completed' and existing_status != 'completed':
+            return True
+        elif existing_status == 'completed' and new_status != 'completed':
+            return False
+        
+        # 2. 스코어가 있는 경기가 없는 경기보다 우선
+        new_has_scores = (new_game.home_score is not None and 
+                         new_game.away_score is not None)
+        existing_has_scores = (existing_game.home_score is not None and 
+                              existing_game.away_score is not None)
+        
+        if new_has_scores and not existing_has_scores:
+            return True
+        elif existing_has_scores and not new_has_scores:
+            return False
+        
+        # 3. 이닝 정보가 더 많은 데이터를 우선
+        new_innings_len = len(new_game.inning_scores_home)
+        existing_innings_len = len(existing_game.inning_scores_home)
+        if new_innings_len > existing_innings_len:
+            return True
+        if existing_innings_len > new_innings_len:
+            return False
+
+        # 4. 더 많은 정보가 있는 경기 우선 (기존 로직)
+        info_keys = [
+            'inning', 'game_time', 'hits_home', 'hits_away', 'errors_home', 'errors_away',
+            'stadium', 'game_duration', 'attendance', 'weather'
+        ]
+        new_info_count = sum(1 for key in info_keys if getattr(new_game, key) is not None)
+        existing_info_count = sum(1 for key in info_keys if getattr(existing_game, key) is not None)
+        
+        return new_info_count > existing_info_count
+    
+    def save_games_to_txt(self, games, filename="games_raw.txt"):
+        """경기 결과를 TXT 파일로 저장 - 날짜별 그룹화 형태
+        upcoming_games_raw.txt의 경우, 구장/경기시간 필드를 끝에 추가하고 전체 파일을 재작성합니다.
+        """
+        if not games:
+            return
+        
+        file_path = self.data_dir / filename
+        is_upcoming = (filename == "upcoming_games_raw.txt")
+        
+        # upcoming도 새로운 날짜별 그룹화 형식으로 저장
+        if is_upcoming:
+            self.save_upcoming_games_grouped_by_date(games, file_path)
+            return
+
+        # games_raw.txt는 새로운 날짜별 그룹화 형식으로 저장
+        self.save_games_grouped_by_date(games, file_path)
+        
+    def existing_game_record(self, entry):
+        """games_raw.txt에서 읽은 TxtGame → 병합 비교용 Game (팀 해석 실패 시 None)
+        두 번째 값은 원래 줄을 그대로 다시 써도 되는지 (리그 보정 등 수정이 없었는지)"""
+        league = entry.league
+        # 파이프 형식 줄은 가독 형식으로 다시 쓴다
+        untouched = not entry.pipe
+        if entry.away_id is not None and entry.home_id is not None:
+            # 메타/파이프 정보 우선, 이름이 비었으면 표기로 보충
+            away_abbr = entry.away_abbr or getattr(teams.by_id(entry.away_id), 'abbr', '')
+            home_abbr = entry.home_abbr or getattr(teams.by_id(entry.home_id), 'abbr', '')
+            away_name, home_name = entry.away_name, entry.home_name
+            if not away_name:
+                away_info = self.team_resolver.resolve(entry.away_label)
+                away_name = away_info.name if away_info else entry.away_label
+            if not home_name:
+                home_info = self.team_resolver.resolve(entry.home_label)
+                home_name = home_info.name if home_info else entry.home_label
+        else:
+            if not entry.resolve_teams(self.team_resolver):
+                return None, False
+            away_abbr, home_abbr = entry.away_abbr, entry.home_abbr
+            away_name, home_name = entry.away_name, entry.home_name
+            if league not in teams.LEAGUES:
+                league = self.team_resolver.resolve(entry.home_label).league
+                untouched = False
+        return Game(
+            entry.date, intern_team(entry.home_id, home_abbr, home_name), intern_team(entry.away_id, away_abbr, away_name),
+            entry.home_score, entry.away_score, league, entry.status, entry.is_draw,
+        ), untouched
+
+    def merge_date_games(self, date, existing_entries, new_games, rewrite=False):
+        """한 날짜의 기존 경기(TxtGame)와 새 경기(Game) 병합 → 쓸 경기 목록
+        새 데이터로 바뀌지 않은 기존 경기는 TxtGame 그대로 두어 원래 줄(구장, 이닝별 점수 포함)을 유지한다."""
+        merged = {}
+        # game_key → 원래 줄을 그대로 쓸 수 있는 기존 경기 (Game, TxtGame)
+        preserved = {}
+        if not rewrite:
+            for entry in existing_entries:
+                game_data, untouched = self.existing_game_record(entry)
+                if game_data is None:
+                    self.logger.warning(f"Failed to parse existing game line without metadata: {entry.lines[0].strip()}")
+                    continue
+                game_key = (game_data.home.id, game_data.away.id)
+                merged[game_key] = game_data
+                if untouched:
+                    preserved[game_key] = (game_data, entry)
+                else:
+                    preserved.pop(game_key, None)
+
+        # 중복 제거 및 병합
+        for game in new_games:
+            game_key = (game.home.id, game.away.id)
+            
+            # 중복 확인 및 더 완전한 데이터 선택
+            if game_key in merged:
+                existing = merged[game_key]
+                # 새 데이터가 더 완전하면 교체
+                if self.is_game_data_better(game, existing):
+                    merged[game_key] = game
+                    self.logger.info(f"🔄 Updated game: {game.away.abbr} vs {game.home.abbr} on {date}")
+            else:
+                merged[game_key] = game
+
+        games = []
+        for game_key, game in merged.items():
+            kept = preserved.get(game_key)
+            games.append(kept[1] if kept is not None and kept[0] is game else game)
+        return games
+
+    def save_games_grouped_by_date(self, new_games, file_path):
+        """경기를 날짜별로 그룹화해서 예쁘게 저장
+        새 경기가 있는 날짜 블록만 다시 쓰고 나머지 줄은 그대로 복사한다 (임시 파일 → os.replace)."""
+        # 새 게임 데이터 검증 및 날짜별 그룹화
+        new_by_date = {}
+        for game in new_games:
+            if self.validate_game_data(game):
+                new_by_date.setdefault(game.date, []).append(game)
+            else:
+                away = game.away.abbr if game.away else 'UNK'
+                home = game.home.abbr if game.home else 'UNK'
+                self.logger.warning(f"⚠️ Invalid game data skipped: {away} vs {home} on {game.date or 'UNK'}")
+        if not new_by_date:
+            return
+        
+        # REWRITE_DATES 모드: 새 게임이 포함된 날짜의 기존 레코드를 모두 제거
+        try:
+            rewrite_flag = os.environ.get('REWRITE_DATES', '').upper()
+        except Exception:
+            rewrite_flag = ''
+        rewrite = rewrite_flag in ('AUTO', 'ALL', '1', 'TRUE', 'YES')
+
+        if file_path.exists() and games_txt.has_legacy_pipe_lines(file_path):
+            self.convert_legacy_games_file(new_by_date, file_path, rewrite)
+            return
+
+        stats = games_txt.rewrite_dates(
+            file_path, new_by_date.keys(),
+            lambda date, existing: self.merge_date_games(date, existing, new_by_date[date], rewrite),
+            index_file=index_file_for(file_path, self.project_root / "data" / "cache"),
+        )
+        self.logger.info(
+            f"📄 Saved {stats['games']} games on {stats['rewritten'] + stats['inserted']} dates to {file_path} "
+            f"({stats['rewritten']} rewritten, {stats['inserted']} new, {stats['copied']} dates unchanged)"
+        )
+
+    def convert_legacy_games_file(self, new_by_date, file_path, rewrite=False):
+        """구(파이프) 형식 파일 → 날짜별 가독 형식으로 전체 변환하면서 새 경기 병합"""
+        existing_by_date = {}
+        for entry in games_txt.iter_games(file_path):
+            existing_by_date.setdefault(entry.date, []).append(entry)
+
+        tmp = file_path.with_name(file_path.name + f".tmp{os.getpid()}")
+        with open(tmp, 'w', encoding='utf-8', newline='') as f:
+            writer = games_txt.GamesTxtWriter(f)
+            writer.write_file_header()
+            for date in sorted(set(existing_by_date) | set(new_by_date)):
+                writer.write_date(date)
+                for game in self.merge_date_games(date, existing_by_date.get(date, []), new_by_date.get(date, []),
+                                                  rewrite and date in new_by_date):
+                    writer.write_game(game)
+        os.replace(tmp, file_path)
+        self.logger.info(f"📄 Converted pipe-format file: saved {writer.games} games grouped by {writer.dates} dates to {file_path}")
+    
+    def save_upcoming_games_grouped_by_date(self, games, file_path):
+        """예정 경기를 날짜별로 그룹화해서 저장 (구장/시간 정보 포함)"""
+        # 날짜별로 그룹화
+        games_by_date = {}
+        for game in games:
+            date = game.date
+            if date not in games_by_date:
+                games_by_date[date] = []
+            games_by_date[date].append(game)
+        
+        # 새 형식으로 파일 쓰기
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write("# NPB SCHEDULED GAMES DATA\n")
+            f.write(f"# UPDATED: {datetime.now().isoformat()}\n")
+            f.write("# FORMAT: Date-grouped scheduled games with venue and time info\n")
+            f.write("#\n")
+            
+            # 날짜순 정렬
+            for date in sorted(games_by_date.keys()):
+                f.write(f"\n# {date}\n")
+                
+                for game in games_by_date[date]:
+                    # 팀 레이블(일본어 짧은 표기) 준비
+                    away, home = game.away, game.home
+                    away_label = games_txt.team_label(away)
+                    home_label = games_txt.team_label(home)
+                    # 구장 정보 가져오기 (없으면 홈팀 기본 구장)
+                    stadium = game.stadium
+                    if not stadium:
+                        home_known = teams.BY_ABBR.get(home.abbr)
+                        stadium = home_known.stadium if home_known else '구장미정'
+                    
+                    # 경기 시간
+                    game_time = game.game_time
+                    
+                    # 예정 경기 라인: ヤクルト vs 巨人 (Central) [SCHEDULED] @ 明治神宮野球場 18:00
+                    game_line = f"{away_label} vs {home_label} ({game.league}) [SCHEDULED] @ {stadium} {game_time}"
+                    
+                    # 메타데이터 주석 - 어웨이팀이 먼저
+                    meta_line = f"# {away.id}|{home.id}|{away.name}|{home.name}"
+                    
+                    f.write(f"{game_line}\n")
+                    f.write(f"{meta_line}\n")
+        
+        total_games = sum(len(games) for games in games_by_date.values())
+        self.logger.info(f"📄 Saved {total_games} scheduled games grouped by {len(games_by_date)} dates to {file_path}")
+    
+    def save_teams_to_txt(self):
+        """팀 정보를 TXT 파일로 저장"""
+        # Skip writing unless explicitly enabled
+        try:
+            if str(os.environ.get('WRITE_TEAMS_TXT', '')).lower() not in ('1','true','yes'):
+                self.logger.info("⏭️ Skipping teams_raw.txt write (WRITE_TEAMS_TXT not set)")
+                return
+        except Exception:
+            return
+        file_path = self.data_dir / "teams_raw.txt"
+        
+        lines = []
+        lines.append("# NPB_TEAMS_DATA")
+        lines.append(f"# UPDATED: {datetime.now().isoformat()}")
+        lines.append("# FORMAT: TEAM_ID|TEAM_ABBR|TEAM_NAME|LEAGUE")
+        
+        # 레지스트리 12팀만 출력 (id 오름차순)
+        for team in teams.ALL_TEAMS:
+            lines.append("|".join([str(team.id), team.abbr, team.name, team.league]))
+        
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines))
+        
+        self.logger.info(f"📄 Saved teams to {file_path}")
+    
+    def crawl_dates(self, dates, on_result=None):
+        """여러 날짜 크롤링 - workers > 1이면 스레드 풀로 병렬 처리
+        결과는 입력 날짜 순서대로 이어 붙여 병합 결과가 실행마다 동일하도록 유지한다.
+        on_result(target_date, games)는 날짜 하나가 끝날 때마다 (완료 순서대로) 호출된다.
+        """
+        total_days = len(dates)
+        results = [None] * total_days
+
+        def report(done, target_date, games):
+            if games:
+                self.logger.info(f"📅 {target_date.strftime('%Y-%m-%d')}: {len(games)} games")
+            # 진행률 표시
+            if done % 10 == 0 or done == total_days:
+                progress = (done / total_days) * 100 if total_days else 100.0
+                self.logger.info(f"🔄 Progress: {done}/{total_days} days ({progress:.1f}%)")
+
+        if self.backend == 'async':
+            self.logger.info(f"⚡ Crawling {total_days} dates with asyncio backend")
+            results = self.async_backend().crawl_dates_sync(dates, on_result=on_result)
+            for idx, target_date in enumerate(dates):
+                report(idx + 1, target_date, results[idx])
+        elif self.workers <= 1:
+            for idx, target_date in enumerate(dates):
+                results[idx] = self.crawl_date(target_date)
+                if on_result:
+                    on_result(target_date, results[idx])
+                report(idx + 1, target_date, results[idx])
+        else:
+            self.logger.info(f"🧵 Crawling {total_days} dates with {self.workers} workers")
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='crawl') as executor:
+                futures = {executor.submit(self.crawl_date, d): idx for idx, d in enumerate(dates)}
+                done = 0
+                for future in as_completed(futures):
+                    idx = futures[future]
+                    try:
+                        results[idx] = future.result()
+                    except Exception as e:
+                        self.logger.error(f"❌ Worker failed for {dates[idx].strftime('%Y-%m-%d')}: {e}")
+                        results[idx] = []
+                    if on_result:
+                        on_result(dates[idx], results[idx])
+                    done += 1
+                    report(done, dates[idx], results[idx])
+
+        all_games = []
+        for games in results:
+            all_games.extend(games or [])
+        return all_games
+
+    def crawl_planned_dates(self, dates):
+        """플래너가 남긴(아직 바뀔 수 있는) 날짜만 크롤하고 휴식일을 기록
+        날짜별 결과는 저널에 바로 기록되며, --resume 이면 저널에 경기가 있는 날짜는 다시 받지 않는다.
+        반환값은 저널 재생 결과(이번 범위의 날짜 순서)이고, 저장이 끝나면 finish_journal()로 비운다.
+        """
+        planned = self.planner.plan(dates, force=self.force)
+        if self.resume:
+            journaled = self.journal.load()
+            remaining = [d for d in planned if not journaled.get(d.strftime('%Y-%m-%d'))]
+            self.logger.info(f"⏯️ Resuming: {len(planned) - len(remaining)} dates restored from journal, {len(remaining)} left")
+            planned = remaining
+        else:
+            self.journal.clear()
+
+        # 저널은 JSON이라 dict로 기록
+        self.crawl_dates(planned, on_result=lambda d, games: self.journal.append(
+            d.strftime('%Y-%m-%d'), [game.to_dict() for game in games or []]))
+        self.planner.record_empty_dates(self.no_game_dates)
+
+        # 최종 병합은 저널 재생으로 (이전 실행에서 받아 둔 날짜 포함)
+        journaled = self.journal.load()
+        all_games = []
+        for target_date in dates:
+            all_games.extend(Game.from_dict(game) for game in journaled.get(target_date.strftime('%Y-%m-%d'), []))
+        return all_games
+
+    def finish_journal(self):
+        """games_raw.txt 병합이 끝난 뒤 저널 삭제"""
+        self.journal.clear()
+
+    def reparse_from_archive(self, start=None, end=None, processes=None):
+        """아카이브된 원본으로 games_raw.txt 재생성 (네트워크 없음, 멀티프로세스)
+        날짜마다 crawl_date와 같은 순서: NPB 일자/경기 페이지 → 없거나 경기가 없으면 닛칸스포츠 페이지"""
+        if self.archive is None:
+            self.logger.error("❌ HTML archive is disabled (ARCHIVE_HTML=0) or crawling dependencies are missing")
+            return -1
+
+        dates = sorted({
+            page_date
+            for source in ('npb', 'nikkansports')
+            for page_date, _ in self.archive.iter_pages(source, start=start, end=end)
+        })
+        if not dates:
+            self.logger.warning(f"⚠️ No archived NPB/Nikkansports pages under {self.archive.root}")
+            return 0
+
+        processes = processes or os.cpu_count() or 1
+        self.logger.info(f"🗄️ Re-parsing {len(dates)} archived dates with {processes} processes...")
+        started = time.perf_counter()
+
+        all_games = []
+        date_texts = [page_date.strftime('%Y-%m-%d') for page_date in dates]
+        if processes <= 1:
+            results = (_reparse_archived_date(date_text, self) for date_text in date_texts)
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            executor = ProcessPoolExecutor(max_workers=processes, initializer=_reparse_worker_init)
+            results = executor.map(_reparse_archived_date, date_texts, chunksize=8)
+        try:
+            # map은 입력(날짜) 순서를 유지하므로 병합 결과가 결정적
+            for date_text, games in zip(date_texts, results):
+                if games:
+                    all_games.extend(games)
+                    self.logger.info(f"📅 {date_text}: {len(games)} games")
+        finally:
+            if processes > 1:
+                executor.shutdown()
+
+        if all_games:
+            self.save_games_to_txt(all_games)
+
+        elapsed = time.perf_counter() - started
+        self.logger.info(f"🏆 Re-parsed {len(all_games)} games from {len(dates)} archived dates in {elapsed:.1f}s")
+        return len(all_games)
+
+    def reparse_npb_archive(self, target_date):
+        """아카이브된 NPB 일자 페이지의 경기 링크마다 경기 페이지 아카이브를 crawl_single_game으로 파싱
+        반환: (경기 목록, 모든 경기 페이지가 아카이브에 있었는지)"""
+        day_path = self.archive.path_for('npb', target_date)
+        if not day_path.exists():
+            return [], False
+        day_soup = self.parser.parse(HtmlArchive.read(day_path), 'npb_day')
+        games = []
+        complete = True
+        for game_url in self.extract_game_links(day_soup, target_date):
+            path = self.archive.path_for(*self.game_archive_key(game_url, target_date))
+            if not path.exists():
+                complete = False
+                continue
+            game = self.crawl_single_game(game_url, target_date, soup=self.parser.parse(HtmlArchive.read(path), 'npb_game'))
+            if game:
+                games.append(game)
+        return games, complete
+
+    def crawl_full_season(self, start_date="2025-03-28"):
+        """NPB 시즌 전체 크롤링 (3월 28일부터)"""
+        self.logger.info(f"🚀 Starting full NPB season crawl from {start_date}...")
+        
+        if not CRAWLING_ENABLED:
+            self.logger.error("❌ Web crawling dependencies (requests, beautifulsoup4) are not installed. Cannot crawl.")
+            self.logger.error("Please install them using: pip install -r crawler/requirements.txt")
+            return -1  # Indicate failure
+        
+        start = datetime.strptime(start_date, "%Y-%m-%d")
+        today = datetime.now()
+        
+        # 당일 경기도 포함 (완료된 경기는 수집)
+        end_date = today
+        total_days = (end_date - start).days + 1
+        
+        self.logger.info(f"📅 Crawling {total_days} days from {start_date} to {today.strftime('%Y-%m-%d')}")
+        
+        dates = [start + timedelta(days=i) for i in range(total_days)]
+        all_games = self.crawl_planned_dates(dates)
+        
+        # 경기 결과 저장 (병합이 끝나면 저널 정리)
+        if all_games:
+            self.save_games_to_txt(all_games)
+        self.finish_journal()
+
+        # 예정 경기 업데이트 (기본 30일)
+        try:
+            self.crawl_upcoming_games(30)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Upcoming games crawl skipped: {e}")
+
+        # 팀 정보 저장
+        self.save_teams_to_txt()
+        
+        self.logger.info(f"🏆 **FULL SEASON CRAWL SUMMARY**")
+        self.logger.info(f"Total games: {len(all_games)}")
+        self.logger.info(f"Draws: {sum(1 for g in all_games if g.is_draw)}")
+        self.logger.info(f"Period: {start_date} to {today.strftime('%Y-%m-%d')}")
+        
+        # 시즌 통계
+        if all_games:
+            teams_count = {}
+            for game in all_games:
+                home_team = game.home.abbr
+                away_team = game.away.abbr
+                teams_count[home_team] = teams_count.get(home_team, 0) + 1
+                teams_count[away_team] = teams_count.get(away_team, 0) + 1
+            
+            self.logger.info("📊 **TEAM GAMES COUNT**:")
+            for team, count in sorted(teams_count.items()):
+                self.logger.info(f"  {team}: {count} games")
+        
+        return len(all_games)
+
+    def crawl_multiple_days(self, days=7):
+        """여러 날짜 크롤링"""
+        self.logger.info(f"🚀 Starting simple crawl for last {days} days...")
+        
+        if not CRAWLING_ENABLED:
+            self.logger.error("❌ Web crawling dependencies (requests, beautifulsoup4) are not installed. Cannot crawl.")
+            self.logger.error("Please install them using: pip install -r crawler/requirements.txt")
+            return -1  # Indicate failure
+        
+        today = datetime.now()
+        
+        # 오늘부터 시작
+        dates = [today - timedelta(days=i) for i in range(0, days)]
+        all_games = self.crawl_planned_dates(dates)
+        
+        # 경기 결과 저장 (병합이 끝나면 저널 정리)
+        if all_games:
+            self.save_games_to_txt(all_games)
+        self.finish_journal()
+
+        # 예정 경기도 최신화 (기본 30일)
+        try:
+            self.crawl_upcoming_games(30)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Upcoming games crawl skipped: {e}")
+
+        # 팀 정보 저장
+        self.save_teams_to_txt()
+        
+        self.logger.info(f"🏆 **SIMPLE CRAWL SUMMARY**")
+        self.logger.info(f"Total games: {len(all_games)}")
+        self.logger.info(f"Draws: {sum(1 for g in all_games if g.is_draw)}")
+        
+        return len(all_games)
+
+
+
+    def crawl_upcoming_games(self, days_ahead=3):
+        """예정 경기 크롤링 (NPB 공식 사이트에서)"""
+        if not CRAWLING_ENABLED:
+            return []
+            
+        self.logger.info(f"🔍 Crawling upcoming games for next {days_ahead} days...")
+        
+        all_upcoming_games = []
+        today = datetime.now()
+        
+        # 월별 캘린더는 load_month_calendar가 한 번만 받아 두므로 날짜별 대기 없이 조회
+        for i in range(days_ahead):
+            target_date = today + timedelta(days=i)
+            games = self.crawl_upcoming_date(target_date)
+            all_upcoming_games.extend(games)
+        
+        if all_upcoming_games:
+            self.save_games_to_txt(all_upcoming_games, "upcoming_games_raw.txt")
+        
+        self.logger.info(f"📅 Found {len(all_upcoming_games)} upcoming games")
+        return all_upcoming_games
+
+    def npb_scores_url(self, target_date):
+        """NPB 공식 일자별 스코어 페이지 URL"""
+        # NPB 공식 스코어 페이지 형식: https://npb.jp/scores/2025/0908/
+        return f"{self.npb_base_url}/scores/{target_date.year}/{target_date.strftime('%m%d')}/"
+
+    def extract_game_links(self, soup, target_date):
+        """NPB 일자별 스코어 페이지에서 경기별 페이지 URL 목록 추출 (페이지 순서 유지)"""
+        urls = []
+        # NPB 스코어 페이지에서 각 경기 링크 찾기
+        game_links = soup.find_all('a', href=lambda x: x and '/scores/' in x and target_date.strftime('%Y') in x)
+        for link in game_links:
+            href = link.get('href')
+            if href and 'detail' not in href:  # 상세 페이지가 아닌 메인 경기 링크만
+                urls.append(f"{self.npb_base_url}{href}" if href.startswith('/') else href)
+        return urls
+
+    def game_archive_key(self, game_url, target_date):
+        """경기별 페이지 아카이브 키 (URL 마지막 경로를 slug로 사용)"""
+        return ('npb-game', target_date, game_url.rstrip('/').rsplit('/', 1)[-1])
+
+    def crawl_game_detail(self, target_date, cancelled=None):
+        """특정 날짜의 경기 상세 정보 크롤링 (NPB 공식 사이트)
+        cancelled(threading.Event)가 설정되면 남은 경기 페이지를 받지 않고 중단"""
+        if not CRAWLING_ENABLED:
+            return []
+            
+        url = self.npb_scores_url(target_date)
+        
+        self.logger.info(f"🔍 Checking game details: {target_date.strftime('%Y-%m-%d')}")
+        
+        try:
+            soup = self.fetch_soup(url, wait_css='table', final_since=self.final_since(target_date),
+                                   archive_key=('npb', target_date, None), page_type='npb_day')
+            if soup is None:
+                return []
+            game_urls = self.extract_game_links(soup, target_date)
+            if not game_urls:
+                return []
+
+            def crawl_one(full_url):
+                if cancelled is not None and cancelled.is_set():
+                    return None
+                return self.crawl_single_game(full_url, target_date)
+
+            # 경기별 상세 페이지는 호스트 동시성 한도(max_per_host) 안에서 동시에 요청하고
+            # map으로 페이지 순서를 유지
+            max_workers = min(len(game_urls), self.http.max_per_host)
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='game') as executor:
+                details = list(executor.map(crawl_one, game_urls))
+            if cancelled is not None and cancelled.is_set():
+                return []
+            return [game for game in details if game]
+            
+        except Exception as e:
+            self.logger.error(f"❌ Failed to crawl games for {target_date.strftime('%Y-%m-%d')}: {e}")
+            return []
+
+    def crawl_single_game(self, game_url, target_date, soup=None):
+        """단일 경기의 상세 정보 크롤링 (soup이 주어지면 네트워크 요청 생략)"""
+        try:
+            if soup is None:
+                soup = self.fetch_soup(game_url, wait_css='table', final_since=self.final_since(target_date),
+                                       archive_key=self.game_archive_key(game_url, target_date), page_type='npb_game')
+            
+            # 경기 정보 추출
+            game_info = {
+                'date': target_date.strftime('%Y-%m-%d'),
+                'status': 'scheduled',  # 기본값을 scheduled로 설정
+                'inning': None,
+                'inning_half': None,
+                'inning_scores': {'away': [], 'home': []},
+                'current_situation': {}
+            }
+            
+            # 1. 팀 정보 및 최종 스코어 추출
+            score_table = soup.find('table', class_='score-table')
+            if score_table:
+                rows = score_table.find_all('tr')
+                if len(rows) >= 3:  # 헤더 + away + home
+                    away_row = rows[1]
+                    home_row = rows[2]
+                    
+                    # 팀명 추출
+                    away_team_cell = away_row.find('td', class_='team')
+                    home_team_cell = home_row.find('td', class_='team')
+                    
+                    if away_team_cell and home_team_cell:
+                        away_team_text = away_team_cell.get_text(strip=True)
+                        home_team_text = home_team_cell.get_text(strip=True)
+                        
+                        away_team = self.get_team_info(away_team_text)
+                        home_team = self.get_team_info(home_team_text)
+                        
+                        if away_team and home_team:
+                            game_info['away_team_id'] = away_team.id
+                            game_info['away_team_abbr'] = away_team.abbr
+                            game_info['away_team_name'] = away_team.name
+                            game_info['home_team_id'] = home_team.id
+                            game_info['home_team_abbr'] = home_team.abbr
+                            game_info['home_team_name'] = home_team.name
+                            # 리그 판단: 교류전 확인 후 분류
+                            home_league = home_team.league
+                            away_league = away_team.league
+                            
+                            if home_league == away_league:
+                                # 같은 리그 내 경기
+                                game_info['league'] = home_league
+                            else:
+                                # 교류전: 홈팀 리그로 분류
+                                game_info['league'] = home_league
+                            
+                            # 최종 스코어 추출
+                            away_total = away_row.find('td', class_='total')
+                            home_total = home_row.find('td', class_='total')
+                            
+                            if away_total and home_total:
+                                away_score_text = away_total.get_text(strip=True)
+                                home_score_text = home_total.get_text(strip=True)
+                                
+                                # 스코어 데이터는 항상 수집 (진행중이든 완료든)
+                                try:
+                                    game_info['away_score'] = int(away_score_text)
+                                    game_info['home_score'] = int(home_score_text)
+                                    game_info['is_draw'] = game_info['away_score'] == game_info['home_score']
+                                    game_info['winner'] = 'home' if game_info['home_score'] > game_info['away_score'] else ('away' if game_info['away_score'] > game_info['home_score'] else 'draw')
+                                except ValueError:
+                                    self.logger.warning(f"⚠️ Could not parse scores: away='{away_score_text}', home='{home_score_text}'")
+                                    return None
+                            
+                            # 이닝별 스코어 추출
+                            inning_cells_away = away_row.find_all('td', class_='inning')
+                            inning_cells_home = home_row.find_all('td', class_='inning')
+                            
+                            for cell in inning_cells_away:
+                                score_text = cell.get_text(strip=True)
+                                if score_text.isdigit():
+                                    game_info['inning_scores']['away'].append(int(score_text))
+                                elif score_text == 'X':
+                                    game_info['inning_scores']['away'].append(None)  # 하위팀 9회말은 X
+                            
+                            for cell in inning_cells_home:
+                                score_text = cell.get_text(strip=True)
+                                if score_text.isdigit():
+                                    game_info['inning_scores']['home'].append(int(score_text))
+                                elif score_text == 'X':
+                                    game_info['inning_scores']['home'].append(None)
+            
+            # 2. 경기 상태 정보 추출
+            status_section = soup.find('div', class_=['game-status'])
+            if status_section:
+                status_text = status_section.get_text(strip=True)
+
+                # 경기 완료 상태만 확인 (진행중이면 상태 변경 안함)
+                completion_keywords = ['試合終了', '終了', 'ゲーム終了', 'GAME SET', 'FINAL', '最終', '結果']
+                if any(keyword in status_text for keyword in completion_keywords):
+                    game_info['status'] = 'completed'
+                elif any(keyword in status_text for keyword in ['延期', '中止', '雨天中止']):
+                    game_info['status'] = 'postponed'
+                # 진행중이거나 기타 상태면 기본값(scheduled) 유지
+            
+            # 3. 추가 게임 시간 정보
+            game_time_elem = soup.find(['span', 'div'], class_=['game-time', 'start-time'])
+            if game_time_elem:
+                game_info['game_time'] = game_time_elem.get_text(strip=True)
+            
+            return Game.from_dict(game_info)
+            
+        except Exception as e:
+            self.logger.warning(f"⚠️ Failed to crawl single game: {game_url} - {e}")
+            return None
+
+    def calendar_url(self, year, month):
+        """NPB 월별 캘린더 페이지 URL"""
+        # NPB 공식 사이트 URL 형식 (일본어)
+        # https://npb.jp/bis/2025/calendar/index_09.html (월별)
+        return f"{self.npb_base_url}/bis/{year}/calendar/index_{month:02d}.html"
+
+    def load_month_calendar(self, year, month):
+        """월별 캘린더를 한 번만 받아 파싱한 day → [예정 경기] 인덱스 반환 (CALENDAR_TTL 동안 재사용)
+        실패 시 None (캐시하지 않음)"""
+        key = (year, month)
+        with self._calendar_lock:
+            cached = self._calendar_index.get(key)
+            if cached is not None and time.monotonic() - cached[0] < self.calendar_ttl:
+                return cached[1]
+
+            url = self.calendar_url(year, month)
+            self.logger.info(f"🗓️ Loading NPB calendar: {year}-{month:02d}")
+            try:
+                response = self.resilient_get(url, timeout=10)
+                response.raise_for_status()
+                soup = self.parse_html(response, 'calendar')
+            except Exception as e:
+                self.logger.error(f"❌ Failed to load NPB calendar {year}-{month:02d}: {e}")
+                return None
+
+            index = self.parse_calendar_page(soup, year, month)
+            self._calendar_index[key] = (time.monotonic(), index)
+            return index
+
+    def parse_calendar_page(self, soup, year, month):
+        """캘린더 페이지 전체를 한 번에 파싱해 day → [Game(날짜 없음)] 인덱스 생성"""
+        index = {}
+        
+        # NPB 캘린더 테이블
+        calendar_table = soup.find('table', class_='tetblmain')
+        if not calendar_table:
+            self.logger.warning(f"⚠️ Calendar table not found for {year}-{month:02d}")
+            return index
+        
+        # 모든 날짜 셀 찾기
+        date_cells = calendar_table.find_all('td', class_='stschedule')
+        
+        for cell in date_cells:
+            # 날짜 확인
+            date_div = cell.find('div', class_='teschedate')
+            if not date_div:
+                continue
+                
+            # 날짜 텍스트에서 숫자만 추출 (링크가 있을 수 있음)
+            date_text = date_div.get_text(strip=True)
+            try:
+                cell_day = int(date_text)
+            except ValueError:
+                continue
+            if cell_day in index:
+                continue  # 같은 날짜는 처음 찾은 셀만 사용
+            
+            games = []
+            # 해당 날짜의 경기 정보 추출
+            for game_div in cell.find_all('div', class_='stvsteam'):
+                for game_text_div in game_div.find_all('div'):
+                    game_text = game_text_div.get_text(strip=True)
+                    self.logger.debug(f"📅 Day {cell_day} game text: '{game_text}'")
+                    
+                    # 경기 시간이 있는 예정 경기만 처리 (18:00, 14:00 등)
+                    if '：' in game_text and ('-' in game_text or 'vs' in game_text):
+                        try:
+                            game = self.parse_calendar_game_text(game_text)
+                        except Exception as e:
+                            self.logger.warning(f"⚠️ Failed to parse game: {game_text} - {e}")
+                            continue
+                        if game:
+                            games.append(game)
+            index[cell_day] = games
+        
+        return index
+
+    def parse_calendar_game_text(self, game_text):
+        """캘린더 경기 텍스트 (예: "巨 - ヤ　18：00") → 예정 경기 Game (날짜 없음)"""
+        # 팀명과 시간 분리
+        parts = game_text.split('　')
+        if len(parts) < 2:
+            return None
+        team_part = parts[0].strip()
+        time_part = parts[1].strip()
+        
+        # 팀명 추출
+        if '-' in team_part:
+            team_names = team_part.split('-')
+        elif 'vs' in team_part:
+            team_names = team_part.split('vs')
+        else:
+            self.logger.warning(f"⚠️ No separator found in team part: {team_part}")
+            return None
+        if len(team_names) < 2:
+            return None
+            
+        away_team_text = team_names[0].strip()
+        home_team_text = team_names[1].strip()
+        away_team = self.get_team_info(away_team_text)
+        home_team = self.get_team_info(home_team_text)
+        if not (away_team and home_team):
+            self.logger.warning(f"⚠️ Team not found: away='{away_team_text}', home='{home_team_text}'")
+            return None
+        
+        # 리그 판단: 교류전은 홈팀 리그로 분류
+        league = home_team.league
+        
+        # 예정 경기는 점수 없음
+        return Game(None, home_team, away_team, league=league, status='scheduled', game_time=time_part)
+
+    def crawl_upcoming_date(self, target_date):
+        """특정 날짜의 예정 경기 크롤링 (NPB 공식 사이트 월별 캘린더 인덱스 사용)"""
+        if not CRAWLING_ENABLED:
+            return []
+        
+        self.logger.info(f"🔍 Checking upcoming games: {target_date.strftime('%Y-%m-%d')}")
+        
+        index = self.load_month_calendar(target_date.year, target_date.month)
+        if index is None:
+            return []
+        
+        date_str = target_date.strftime('%Y-%m-%d')
+        games = [game.copy(date=date_str) for game in index.get(target_date.day, [])]
+        for game in games:
+            self.logger.info(f"📅 Scheduled: {game.away.abbr} vs {game.home.abbr} at {game.game_time}")
+        return games
+
+# ===== 아카이브 재파싱 워커 (ProcessPoolExecutor용 모듈 수준 함수) =====
+_reparse_crawler = None
+
+def _reparse_worker_init():
+    global _reparse_crawler
+    _reparse_crawler = SimpleCrawler()
+    # 워커는 테이블별 INFO 로그를 생략해 파싱에 집중
+    _reparse_crawler.logger.setLevel(logging.WARNING)
+
+def _reparse_archived_date(date_text, crawler=None):
+    """아카이브된 날짜 하나를 crawl_date와 같은 파싱 로직·소스 순서로 처리"""
+    crawler = crawler or _reparse_crawler
+    target_date = datetime.strptime(date_text, '%Y-%m-%d')
+    try:
+        games, complete = crawler.reparse_npb_archive(target_date)
+        if games and complete:
+            return games
+        # NPB 페이지가 없거나 일부 경기 페이지가 빠졌으면 닛칸스포츠 원본 (없으면 NPB에서 읽은 경기라도 사용)
+        path = crawler.archive.path_for('nikkansports', target_date)
+        if path.exists():
+            soup = crawler.parser.parse(HtmlArchive.read(path), 'nikkansports')
+            return crawler.parse_nikkansports_page(soup, target_date) or games
+        return games
+    except Exception as e:
+        crawler.logger.error(f"❌ Failed to re-parse archived pages for {date_text}: {e}")
+        return []
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+경기 레코드 (__slots__)
+크롤러가 만들던 32개 키짜리 경기 dict 대신 쓰는 고정 필드 객체.
+home/away는 teams 레지스트리의 Team 객체 그대로 (레지스트리 밖 팀은 (id, 약어, 이름)마다 하나만 intern),
+이닝별 점수는 원정·홈을 이어 붙인 array('b') 하나에 담는다 (끝내기 'X'는 -1).
+dict 변환(to_dict/from_dict)은 크롤 저널처럼 JSON으로 나가는 곳에서만 쓴다.
+"""
+
+import sys
+from array import array
+
+from teams import intern_team
+
+_X = -1  # 이닝 칸 'X' (끝내기로 공격하지 않은 말)
+
+
+def _pack_innings(away, home):
+    scores = list(away or ()) + list(home or ())
+    if not scores:
+        return None
+    try:
+        return array('b', [_X if s is None else s for s in scores])
+    except (OverflowError, TypeError):
+        # 한 칸에 127점을 넘는 등 비정상 값은 그대로 보관
+        return tuple(scores)
+
+
+def _unpack_innings(packed):
+    if isinstance(packed, array):
+        return [None if s == _X else s for s in packed]
+    return list(packed)
+
+
+class Game:
+    """경기 하나 - home/away는 Team, 이닝별 점수는 inning_scores_away/inning_scores_home (None = 'X')"""
+
+    # 값이 없을 때가 많은 상세 필드 (생성자 키워드 인자, 기본 None)
+    DETAIL_FIELDS = (
+        'inning', 'inning_half', 'game_time', 'final_inning',
+        'stadium', 'game_duration', 'attendance', 'weather', 'temperature',
+        'hits_away', 'hits_home', 'errors_away', 'errors_home',
+        'winning_pitcher', 'losing_pitcher', 'save_pitcher', 'home_runs',
+    )
+
+    __slots__ = ('date', 'home', 'away', 'home_score', 'away_score', 'league', 'status', 'is_draw',
+                 '_innings', '_away_innings') + DETAIL_FIELDS
+
+    def __init__(self, date, home, away, home_score=None, away_score=None, league=None, status='scheduled',
+                 is_draw=False, inning_scores_away=None, inning_scores_home=None, **details):
+        # 같은 날짜 문자열은 하나만 보관
+        self.date = sys.intern(date) if isinstance(date, str) else date
+        self.home = home
+        self.away = away
+        self.home_score = home_score
+        self.away_score = away_score
+        self.league = league
+        self.status = status
+        self.is_draw = is_draw
+        for name in self.DETAIL_FIELDS:
+            setattr(self, name, details.pop(name, None))
+        if details:
+            raise TypeError(f"Unknown game fields: {', '.join(sorted(details))}")
+        self.set_innings(inning_scores_away, inning_scores_home)
+
+    def set_innings(self, away, home):
+        self._innings = _pack_innings(away, home)
+        self._away_innings = len(away or ())
+
+    @property
+    def inning_scores_away(self):
+        if self._innings is None:
+            return []
+        return _unpack_innings(self._innings[:self._away_innings])
+
+    @property
+    def inning_scores_home(self):
+        if self._innings is None:
+            return []
+        return _unpack_innings(self._innings[self._away_innings:])
+
+    @property
+    def winner(self):
+        if self.home_score is None or self.away_score is None:
+            return None
+        if self.home_score > self.away_score:
+            return 'home'
+        if self.away_score > self.home_score:
+            return 'away'
+        return 'draw'
+
+    def copy(self, **changes):
+        """필드 일부만 바꾼 새 경기"""
+        fields = {name: getattr(self, name) for name in self.DETAIL_FIELDS}
+        fields.update(
+            date=self.date, home=self.home, away=self.away, home_score=self.home_score,
+            away_score=self.away_score, league=self.league, status=self.status, is_draw=self.is_draw,
+            inning_scores_away=self.inning_scores_away, inning_scores_home=self.inning_scores_home,
+        )
+        fields.update(changes)
+        return Game(**fields)
+
+    def to_dict(self):
+        """기존 크롤러 경기 dict와 같은 키 (저널 등 JSON 경계용)"""
+        home, away = self.home, self.away
+        return {
+            'date': self.date,
+            'home_team_id': home.id if home else None,
+            'home_team_name': home.name if home else None,
+            'home_team_abbr': home.abbr if home else None,
+            'away_team_id': away.id if away else None,
+            'away_team_name': away.name if away else None,
+            'away_team_abbr': away.abbr if away else None,
+            'home_score': self.home_score,
+            'away_score': self.away_score,
+            'league': self.league,
+            'status': self.status,
+            'inning': self.inning,
+            'inning_half': self.inning_half,
+            'game_time': self.game_time,
+            'is_draw': self.is_draw,
+            'winner': self.winner,
+            'stadium': self.stadium,
+            'game_duration': self.game_duration,
+            'attendance': self.attendance,
+            'inning_scores_away': self.inning_scores_away,
+            'inning_scores_home': self.inning_scores_home,
+            'hits_away': self.hits_away,
+            'hits_home': self.hits_home,
+            'errors_away': self.errors_away,
+            'errors_home': self.errors_home,
+            'winning_pitcher': self.winning_pitcher,
+            'losing_pitcher': self.losing_pitcher,
+            'save_pitcher': self.save_pitcher,
+            'home_runs': self.home_runs or [],
+            'weather': self.weather,
+            'temperature': self.temperature,
+            'final_inning': self.final_inning,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """크롤러 경기 dict(저널 등) → Game (팀 키가 없으면 home/away는 None, 모르는 키는 무시)"""
+        teams = {}
+        for side in ('home', 'away'):
+            team_id = data.get(f'{side}_team_id')
+            teams[side] = None if team_id is None else intern_team(
+                team_id, data.get(f'{side}_team_abbr'), data.get(f'{side}_team_name'))
+        # NPB 상세 페이지 형식: {'inning_scores': {'away': [...], 'home': [...]}}
+        nested = data.get('inning_scores') or {}
+        return cls(
+            data.get('date'), teams['home'], teams['away'],
+            data.get('home_score'), data.get('away_score'), data.get('league'),
+            data.get('status', 'scheduled'), bool(data.get('is_draw', False)),
+            data.get('inning_scores_away') or nested.get('away'),
+            data.get('inning_scores_home') or nested.get('home'),
+            **{name: data.get(name) for name in cls.DETAIL_FIELDS},
+        )
+
+    def __repr__(self):
+        away = self.away.abbr if self.away else '?'
+        home = self.home.abbr if self.home else '?'
+        score = f"{self.away_score}-{self.home_score}" if self.home_score is not None else 'vs'
+        return f"Game({self.date} {away} {score} {home} {self.status})"
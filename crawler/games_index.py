@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+games_raw.txt 날짜 블록 바이트 오프셋 인덱스 + mmap 리더
+'# YYYY-MM-DD' 헤더마다 (오프셋, 길이)를 사이드카 JSON(data/cache/games_raw.txt.idx.json)에 기록하고,
+원본의 크기나 mtime이 바뀌었으면 다시 만든다. 날짜/기간 조회는 정렬된 날짜 목록에서 이분 탐색 후
+해당 바이트 구간만 mmap에서 잘라 읽으므로 파일(시즌 수)이 커져도 조회 비용은 그대로다.
+"""
+
+import bisect
+import json
+import mmap
+import os
+import re
+from pathlib import Path
+
+INDEX_VERSION = 1
+# games_txt.DATE_HEADER_RE와 같은 헤더를 바이트 단위로 (앞뒤 공백/CR 허용)
+DATE_HEADER_BYTES_RE = re.compile(rb'^[ \t]*#[ \t]*(\d{4}-\d{2}-\d{2})[ \t\r]*$', re.M)
+
+
+def _has_pipe_games(data):
+    """머리말에 구 파이프 형식 경기 줄(12칸 이상)이 있는지"""
+    for line in data.splitlines():
+        s = line.strip()
+        if s and not s.startswith(b'#') and s.count(b'|') >= 11:
+            return True
+    return False
+
+
+class GamesIndex:
+    """games_raw.txt 날짜 인덱스 (index_file이 None이면 메모리에서만 만들고 저장하지 않음)
+    - blocks: 파일 순서의 (date, offset, length), preamble: 첫 날짜 헤더 전 바이트 수
+    - legacy: 머리말에 구 파이프 형식 경기가 있음 (날짜 블록 밖이라 조회 시 전체를 봐야 함)
+    열린 mmap은 load 시점의 파일을 가리키므로, 중간에 파일이 교체되어도 같은 스냅샷을 읽는다."""
+
+    def __init__(self, games_file, index_file=None):
+        self.games_file = Path(games_file)
+        self.index_file = Path(index_file) if index_file else None
+        self.blocks = []
+        self.preamble = 0
+        self.legacy = False
+        self.size = 0
+        self.rebuilt = False
+        self._dates = []
+        self._spans = []
+        self._file = None
+        self._mm = None
+
+    def __enter__(self):
+        return self.load()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def load(self):
+        """원본을 mmap으로 열고 사이드카가 최신이면 읽고, 아니면 다시 만들어 저장"""
+        self.close()
+        self.blocks, self.preamble, self.legacy, self.size, self.rebuilt = [], 0, False, 0, False
+        if self.games_file.exists():
+            self._file = open(self.games_file, 'rb')
+            st = os.fstat(self._file.fileno())
+            self.size = st.st_size
+            if self.size:
+                self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if not self._load_sidecar(st):
+                self._build()
+                self._save_sidecar(st)
+                self.rebuilt = True
+        # 날짜순 조회용 (같은 날짜 블록이 여러 개면 파일 순서 유지)
+        order = sorted(range(len(self.blocks)), key=lambda i: self.blocks[i][0])
+        self._dates = [self.blocks[i][0] for i in order]
+        self._spans = [self.blocks[i] for i in order]
+        return self
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _build(self):
+        data = self._mm if self._mm is not None else b''
+        starts = [(m.start(), m.group(1).decode('ascii')) for m in DATE_HEADER_BYTES_RE.finditer(data)]
+        self.preamble = starts[0][0] if starts else self.size
+        self.blocks = [
+            (date, offset, (starts[i + 1][0] if i + 1 < len(starts) else self.size) - offset)
+            for i, (offset, date) in enumerate(starts)
+        ]
+        self.legacy = _has_pipe_games(data[:self.preamble])
+
+    def _load_sidecar(self, st):
+        if self.index_file is None or not self.index_file.exists():
+            return False
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            if (saved.get('version') != INDEX_VERSION or saved.get('size') != st.st_size
+                    or saved.get('mtime_ns') != st.st_mtime_ns):
+                return False
+            self.preamble = saved['preamble']
+            self.legacy = saved['legacy']
+            self.blocks = [(date, offset, length) for date, offset, length in saved['blocks']]
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        return True
+
+    def _save_sidecar(self, st):
+        if self.index_file is None:
+            return
+        payload = {
+            'version': INDEX_VERSION,
+            'source': str(self.games_file),
+            'size': st.st_size,
+            'mtime_ns': st.st_mtime_ns,
+            'preamble': self.preamble,
+            'legacy': self.legacy,
+            'blocks': [list(block) for block in self.blocks],
+        }
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.index_file.with_name(self.index_file.name + f".tmp{os.getpid()}")
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(tmp, self.index_file)
+        except OSError:
+            # 인덱스는 캐시일 뿐이라 저장 실패해도 조회는 계속
+            pass
+
+    def text(self, offset, length):
+        """바이트 구간 → 문자열 (줄 끝 그대로)"""
+        if self._mm is None or length <= 0:
+            return ''
+        return self._mm[offset:offset + length].decode('utf-8')
+
+    def preamble_text(self):
+        return self.text(0, self.preamble)
+
+    def _bounds(self, start, end):
+        lo = 0 if start is None else bisect.bisect_left(self._dates, start)
+        hi = len(self._dates) if end is None else bisect.bisect_right(self._dates, end)
+        return lo, hi
+
+    def dates(self, start=None, end=None):
+        """start <= date <= end 인 파일의 날짜 (정렬, 중복 제거)"""
+        lo, hi = self._bounds(start, end)
+        return sorted(set(self._dates[lo:hi]))
+
+    def __contains__(self, date):
+        i = bisect.bisect_left(self._dates, date)
+        return i < len(self._dates) and self._dates[i] == date
+
+    def iter_range(self, start=None, end=None):
+        """start <= date <= end 블록의 (date, 블록 문자열)을 날짜순으로 (None은 열린 구간)"""
+        lo, hi = self._bounds(start, end)
+        for date, offset, length in self._spans[lo:hi]:
+            yield date, self.text(offset, length)
+
+    def block_text(self, date):
+        """날짜 하나의 블록 문자열 (헤더 포함, 없으면 '')"""
+        return ''.join(text for _, text in self.iter_range(date, date))
+
+
+def index_file_for(games_file, cache_dir):
+    """games_raw.txt → <cache_dir>/games_raw.txt.idx.json"""
+    return Path(cache_dir) / f"{Path(games_file).name}.idx.json"
@@ -0,0 +1,446 @@
+#!/usr/bin/env python3
+"""
+games_raw.txt 읽기/쓰기 (날짜별 가독 형식 + 구 파이프 형식)
+- iter_entries: 파일을 한 줄씩 읽어 DateHeader / TxtGame(메타·이닝 줄 포함) / Line을 순서대로 반환
+  (파일 전체를 메모리에 올리지 않음). 각 항목은 원래 줄을 그대로 갖고 있어
+  읽은 항목을 GamesTxtWriter로 다시 쓰면 바이트 단위로 같은 파일이 된다.
+- GamesTxtWriter: 크롤러 경기(game_record.Game)는 가독 형식으로, 읽은 항목은 원래 줄 그대로 쓴다.
+- rewrite_dates: 바뀐 날짜 블록만 다시 쓰고 나머지 줄은 그대로 복사한 임시 파일로 교체 (원자적)
+- iter_games_between: GamesIndex(날짜 → 바이트 오프셋)로 날짜/기간 경기만 읽기
+"""
+
+import io
+import os
+import re
+from datetime import datetime
+from pathlib import Path
+
+from games_index import GamesIndex
+from teams import BY_ABBR
+
+GAME_LINE_RE = re.compile(r'^(.+?)\s+((\d+)-(\d+)|vs)\s+(.+?)\s+\(([^)]+)\)(.*)$')
+META_LINE_RE = re.compile(r'^#\s*(\d+)\|(\d+)\|([^|]+)\|([^|]+)$')
+DATE_HEADER_RE = re.compile(r'^#\s*(\d{4}-\d{2}-\d{2})\s*$')
+INNING_LINE_PREFIX = '# 📊 이닝별:'
+INNING_RE = re.compile(r'(\d+)회\((\d+|X)-(\d+|X)\)')
+_TAG_RE = re.compile(r'\s*\[([A-Z]+)\]')
+
+FILE_FORMAT = 'Date-grouped games with readable format'
+
+
+class Line:
+    """경기가 아닌 줄 (머리말 주석, 빈 줄, 해석할 수 없는 줄)"""
+
+    kind = 'line'
+
+    def __init__(self, raw):
+        self.lines = [raw]
+
+
+class DateHeader:
+    """'# YYYY-MM-DD' 날짜 헤더"""
+
+    kind = 'date'
+
+    def __init__(self, date, raw):
+        self.date = date
+        self.lines = [raw]
+
+
+class TxtGame:
+    """경기 줄 하나 + 뒤따르는 '#' 상세 줄(메타, 이닝별 점수 등)
+    - away_label/home_label: 파일에 적힌 팀 표기 (파이프 형식은 약어)
+    - away_id/home_id/away_name/home_name: 메타 줄(또는 파이프 형식)에 있을 때만 값
+    - status: 'completed' / 'scheduled' / 'postponed', is_draw: [DRAW] 표시
+    - info: 태그 뒤 나머지 ('@ 구장 ⏱️3:05 👥41,234명' 등)
+    - innings_away/innings_home: 이닝별 점수 (끝내기 'X'는 None), 이닝 줄이 없으면 None
+    - pipe: 구 파이프 형식 줄에서 읽었는지"""
+
+    kind = 'game'
+
+    def __init__(self, date, away_label, home_label, away_score, home_score, league,
+                 status, is_draw=False, info='', lines=None):
+        self.date = date
+        self.away_label = away_label
+        self.home_label = home_label
+        self.away_score = away_score
+        self.home_score = home_score
+        self.league = league
+        self.status = status
+        self.is_draw = is_draw
+        self.info = info
+        self.away_id = self.home_id = None
+        self.away_name = self.home_name = None
+        self.away_abbr = self.home_abbr = None
+        self.innings_away = self.innings_home = None
+        self.pipe = False
+        self.lines = lines if lines is not None else []
+
+    @classmethod
+    def from_match(cls, date, match, raw):
+        away_label, score_part, away_score, home_score, home_label, league, rest = match.groups()
+        tags = []
+        pos = 0
+        while True:
+            tag = _TAG_RE.match(rest, pos)
+            if not tag:
+                break
+            tags.append(tag.group(1))
+            pos = tag.end()
+        has_score = score_part != 'vs'
+        if 'POSTPONED' in tags:
+            status = 'postponed'
+        elif 'SCHEDULED' in tags or not has_score:
+            status = 'scheduled'
+        else:
+            status = 'completed'
+        return cls(
+            date, away_label.strip(), home_label.strip(),
+            int(away_score) if has_score else None, int(home_score) if has_score else None,
+            league.strip(), status, 'DRAW' in tags, rest[pos:].strip(), [raw],
+        )
+
+    @classmethod
+    def from_pipe(cls, parts, raw):
+        """date|home_id|home_abbr|home_name|away_id|away_abbr|away_name|home_score|away_score|league|status|is_draw"""
+        game = cls(
+            parts[0], parts[5], parts[2],
+            None if parts[8] == 'NULL' else int(parts[8]), None if parts[7] == 'NULL' else int(parts[7]),
+            parts[9], parts[10], parts[11] == '1', '', [raw],
+        )
+        game.home_id, game.home_abbr, game.home_name = int(parts[1]), parts[2], parts[3]
+        game.away_id, game.away_abbr, game.away_name = int(parts[4]), parts[5], parts[6]
+        game.pipe = True
+        return game
+
+    def attach(self, raw, line):
+        """경기 줄 뒤의 '#' 상세 줄 추가 - 바로 다음 줄이 메타면 팀 ID/이름 기록"""
+        if len(self.lines) == 1:
+            meta = META_LINE_RE.match(line)
+            if meta:
+                self.away_id, self.home_id = int(meta.group(1)), int(meta.group(2))
+                self.away_name, self.home_name = meta.group(3), meta.group(4)
+        if line.startswith(INNING_LINE_PREFIX):
+            innings = INNING_RE.findall(line)
+            self.innings_away = [None if a == 'X' else int(a) for _, a, _ in innings]
+            self.innings_home = [None if h == 'X' else int(h) for _, _, h in innings]
+        self.lines.append(raw)
+
+    def resolve_teams(self, resolver):
+        """팀 id/abbr/name 채우기 - 메타/파이프의 ID가 있으면 ID로, 없으면 표기로 해석 (둘 다 찾으면 True)"""
+        for side in ('away', 'home'):
+            team_id = getattr(self, f'{side}_id')
+            team = resolver.by_id(team_id) if team_id is not None else resolver.resolve(getattr(self, f'{side}_label'))
+            if team is None:
+                return False
+            if team_id is None:
+                setattr(self, f'{side}_id', team.id)
+            if getattr(self, f'{side}_abbr') is None:
+                setattr(self, f'{side}_abbr', team.abbr)
+            if not getattr(self, f'{side}_name'):
+                setattr(self, f'{side}_name', team.name)
+        return True
+
+
+def _open(source):
+    # newline=''로 줄 끝(\r\n 포함)을 그대로 보존
+    return open(source, 'r', encoding='utf-8', newline='')
+
+
+def iter_entries(source):
+    """경로 또는 텍스트 파일 객체에서 항목을 순서대로 생성"""
+    if isinstance(source, (str, os.PathLike)):
+        with _open(source) as f:
+            yield from iter_entries(f)
+        return
+
+    current_date = None
+    game = None
+    for raw in source:
+        line = raw.strip()
+        header = DATE_HEADER_RE.match(line) if line.startswith('#') else None
+        if game is not None:
+            if line.startswith('#') and not header:
+                game.attach(raw, line)
+                continue
+            yield game
+            game = None
+        if header:
+            current_date = header.group(1)
+            yield DateHeader(current_date, raw)
+            continue
+        if line and not line.startswith('#'):
+            if '|' in line:
+                parts = line.split('|')
+                if len(parts) >= 12:
+                    try:
+                        yield TxtGame.from_pipe(parts, raw)
+                        continue
+                    except ValueError:
+                        pass
+            elif current_date:
+                match = GAME_LINE_RE.match(line)
+                if match:
+                    game = TxtGame.from_match(current_date, match, raw)
+                    continue
+        yield Line(raw)
+    if game is not None:
+        yield game
+
+
+def iter_games(source, resolver=None):
+    """경기 항목만 생성 - resolver가 있으면 메타 없는 경기의 팀 id/abbr/name도 채운다"""
+    for entry in iter_entries(source):
+        if entry.kind != 'game':
+            continue
+        if resolver is not None:
+            entry.resolve_teams(resolver)
+        yield entry
+
+
+def team_label(team):
+    """파일에 쓸 일본어 표기 (레지스트리 팀이 아니면 이름 앞 두 글자)"""
+    known = BY_ABBR.get(team.abbr)
+    return known.short if known else ((team.name or '')[:2] or team.abbr)
+
+
+def format_game_lines(game):
+    """크롤러 경기(game_record.Game) → 경기 줄 (+ 이닝별 점수 주석 줄)
+    구장명이 없으면 홈팀의 기본 구장 (teams 레지스트리)"""
+    away, home = game.away, game.home
+    away_label = team_label(away)
+    home_label = team_label(home)
+    if game.home_score is not None and game.away_score is not None:
+        score = f"{game.away_score}-{game.home_score}"
+    else:
+        score = "vs"
+
+    draw_mark = " [DRAW]" if game.is_draw else ""
+    status_mark = ""
+    if game.status == 'scheduled':
+        status_mark = " [SCHEDULED]"
+    elif game.status == 'postponed':
+        status_mark = " [POSTPONED]"
+
+    # 日本ハム 0-0 阪神 (League) [DRAW] @ Stadium
+    game_line = f"{away_label} {score} {home_label} ({game.league}){draw_mark}{status_mark}"
+
+    home_known = BY_ABBR.get(home.abbr)
+    stadium = game.stadium or (home_known.stadium if home_known else '')
+    info_tokens = []
+    if stadium:
+        info_tokens.append(f"@ {stadium}")
+    # 경기 시간/소요 시간/관중 정보는 존재 시 덧붙임
+    if game.game_time and game.status != 'completed':
+        info_tokens.append(game.game_time)
+    if game.game_duration:
+        info_tokens.append(f"⏱️{game.game_duration}")
+    if game.attendance:
+        try:
+            info_tokens.append(f"👥{int(game.attendance):,}명")
+        except Exception:
+            info_tokens.append(f"👥{game.attendance}")
+    if info_tokens:
+        game_line += " " + " ".join(info_tokens)
+    lines = [f"{game_line}\n"]
+
+    away_innings = game.inning_scores_away
+    home_innings = game.inning_scores_home
+    max_innings = max(len(away_innings), len(home_innings))
+    if max_innings > 0:
+        parts = []
+        for idx in range(max_innings):
+            away_score = away_innings[idx] if idx < len(away_innings) else None
+            home_score = home_innings[idx] if idx < len(home_innings) else None
+            parts.append(f"{idx + 1}회({'X' if away_score is None else away_score}-{'X' if home_score is None else home_score})")
+        lines.append(f"{INNING_LINE_PREFIX} {' '.join(parts)}\n")
+    return lines
+
+
+class GamesTxtWriter:
+    """날짜별 가독 형식 쓰기 (f: 텍스트 파일 객체, newline='' 권장)"""
+
+    def __init__(self, f):
+        self.f = f
+        self.games = 0
+        self.dates = 0
+        self._needs_newline = False
+
+    def _write(self, text):
+        if not text:
+            return
+        if self._needs_newline:
+            self.f.write('\n')
+        self.f.write(text)
+        self._needs_newline = not text.endswith('\n')
+
+    def write_file_header(self, updated=None):
+        updated = updated or datetime.now().isoformat()
+        self._write(f"# NPB GAMES DATA\n# UPDATED: {updated}\n# FORMAT: {FILE_FORMAT}\n#\n")
+
+    def write_date(self, date):
+        self.dates += 1
+        self._write(f"\n# {date}\n")
+
+    def write_game(self, game):
+        """크롤러 경기(Game) 또는 읽은 TxtGame"""
+        self.games += 1
+        if isinstance(game, TxtGame):
+            self._write(''.join(game.lines))
+        else:
+            self._write(''.join(format_game_lines(game)))
+
+    def write_raw(self, lines):
+        self._write(''.join(lines))
+
+    def write_entry(self, entry):
+        """읽은 항목을 원래 줄 그대로 (마지막 줄에 줄바꿈이 없었어도 다음 항목 앞에서 보충)"""
+        if entry.kind == 'game':
+            self.write_game(entry)
+        else:
+            if entry.kind == 'date':
+                self.dates += 1
+            self._write(''.join(entry.lines))
+
+
+def copy_entries(entries, f):
+    """항목을 그대로 다시 쓴다 (수정 없는 읽기→쓰기는 원본과 바이트 단위로 동일)"""
+    writer = GamesTxtWriter(f)
+    for entry in entries:
+        writer.write_entry(entry)
+    return writer
+
+
+def iter_blocks(source):
+    """(date, 원래 줄 목록) - '# YYYY-MM-DD' 헤더부터 다음 헤더 직전까지 (첫 헤더 전 머리말은 date=None)
+    경기 줄은 해석하지 않고 날짜 헤더만 찾는다."""
+    if isinstance(source, (str, os.PathLike)):
+        with _open(source) as f:
+            yield from iter_blocks(f)
+        return
+
+    date = None
+    lines = []
+    for raw in source:
+        if raw.lstrip().startswith('#'):
+            header = DATE_HEADER_RE.match(raw.strip())
+            if header:
+                if lines:
+                    yield date, lines
+                date, lines = header.group(1), [raw]
+                continue
+        lines.append(raw)
+    if lines:
+        yield date, lines
+
+
+def has_legacy_pipe_lines(source):
+    """첫 날짜 헤더 전에 구 파이프 형식 경기가 있는지 (가독 형식 파일은 머리말만 읽고 끝)"""
+    for date, lines in iter_blocks(source):
+        return date is None and any(entry.kind == 'game' for entry in iter_entries(lines))
+    return False
+
+
+def _with_updated(lines, updated):
+    out = []
+    for raw in lines:
+        if raw.startswith('# UPDATED:'):
+            ending = raw[len(raw.rstrip('\r\n')):]
+            raw = f"# UPDATED: {updated}{ending}"
+        out.append(raw)
+    return out
+
+
+def _lines(text):
+    # 문자열을 파일처럼 한 줄씩 (_open과 같은 줄 끝 규칙)
+    return io.StringIO(text, newline='')
+
+
+def iter_games_between(index, start=None, end=None, resolver=None):
+    """GamesIndex로 start <= date <= end 경기만 읽는다 (해당 날짜 블록만 mmap에서 잘라 해석)
+    머리말에 구 파이프 형식 경기가 있는 파일은 날짜 블록이 없으므로 전체를 읽어 날짜로 거른다."""
+    if index.legacy:
+        for game in iter_games(index.games_file, resolver):
+            if (start is None or game.date >= start) and (end is None or game.date <= end):
+                yield game
+        return
+    for _, text in index.iter_range(start, end):
+        yield from iter_games(_lines(text), resolver)
+
+
+def rewrite_dates(path, dates, merge, updated=None, index_file=None):
+    """dates 블록만 다시 쓰고 나머지는 원래 바이트 그대로 복사한 뒤 임시 파일과 원자적으로 교체
+    merge(date, games)는 기존 경기(TxtGame 목록, 파일에 없던 날짜는 [])를 받아 그 날짜에 쓸 경기
+    (Game 또는 TxtGame) 목록을 반환한다. 파일에 없던 날짜는 날짜순 위치에 새 블록으로 넣는다.
+    바뀌지 않은 연속 블록은 GamesIndex 오프셋으로 한 번에 복사한다. index_file이 있으면 최신 사이드카를
+    읽어 오프셋을 얻고(다시 만들지 않음), 교체 후 새 파일 기준으로 다시 기록한다.
+    반환: {'rewritten', 'inserted', 'copied', 'games'} (games: 다시 쓴 블록의 경기 수)"""
+    path = Path(path)
+    updated = updated or datetime.now().isoformat()
+    pending = sorted(set(dates))
+    stats = {'rewritten': 0, 'inserted': 0, 'copied': 0, 'games': 0}
+
+    def write_games(writer, date, existing):
+        games = merge(date, existing)
+        for game in games:
+            writer.write_game(game)
+        stats['games'] += len(games)
+
+    tmp = path.with_name(path.name + f".tmp{os.getpid()}")
+    try:
+        # 사이드카가 최신이면 읽기만 하고 다시 만들지 않는다 (낡았으면 여기서 다시 만들어 저장)
+        with GamesIndex(path, index_file) as index, open(tmp, 'w', encoding='utf-8', newline='') as out:
+            writer = GamesTxtWriter(out)
+            if path.exists():
+                writer.write_raw(_with_updated(_lines(index.preamble_text()), updated))
+                # 그대로 복사할 연속 구간 [run_start, run_end)
+                run_start = run_end = None
+                for date, offset, length in index.blocks:
+                    if not pending or pending[0] > date:
+                        if run_start is None:
+                            run_start = offset
+                        run_end = offset + length
+                        stats['copied'] += 1
+                        continue
+                    if run_start is not None:
+                        writer.write_raw([index.text(run_start, run_end - run_start)])
+                        run_start = None
+                    # 이 블록보다 앞선 새 날짜: 앞 블록의 빈 줄 뒤에 "# 날짜 / 경기 / 빈 줄"
+                    while pending and pending[0] < date:
+                        new_date = pending.pop(0)
+                        writer.write_raw([f"# {new_date}\n"])
+                        write_games(writer, new_date, [])
+                        writer.write_raw(["\n"])
+                        stats['inserted'] += 1
+                    if pending and pending[0] == date:
+                        pending.pop(0)
+                        entries = list(iter_entries(_lines(index.text(offset, length))))
+                        writer.write_entry(entries[0])
+                        write_games(writer, date, [e for e in entries[1:] if e.kind == 'game'])
+                        # 블록 끝 빈 줄 등 경기가 아닌 줄은 유지
+                        for entry in entries[1:]:
+                            if entry.kind != 'game':
+                                writer.write_entry(entry)
+                        stats['rewritten'] += 1
+                    else:
+                        writer.write_raw([index.text(offset, length)])
+                        stats['copied'] += 1
+                if run_start is not None:
+                    writer.write_raw([index.text(run_start, run_end - run_start)])
+            else:
+                writer.write_file_header(updated)
+            # 마지막 블록 뒤에 붙는 새 날짜
+            for new_date in pending:
+                writer.write_date(new_date)
+                write_games(writer, new_date, [])
+                stats['inserted'] += 1
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    if index_file is not None:
+        GamesIndex(path, index_file).load().close()
+    return stats
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+원본 HTML 압축 아카이브
+data/raw/html/YYYY/MM/<source>_<YYYY-MM-DD>[_<slug>].html.gz 형태로 저장해
+파서 수정 시 네트워크 재크롤 없이 재파싱할 수 있도록 한다.
+"""
+
+import gzip
+import os
+import re
+import threading
+from datetime import datetime
+from pathlib import Path
+
+FILENAME_RE = re.compile(r'^(?P<source>[a-z0-9-]+)_(?P<date>\d{4}-\d{2}-\d{2})(?:_(?P<slug>[^.]+))?\.html\.gz$')
+
+
+class HtmlArchive:
+    """소스/날짜별 gzip HTML 저장소"""
+
+    FILENAME_RE = FILENAME_RE
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.stats = {'stored': 0, 'bytes_raw': 0, 'bytes_compressed': 0}
+        self._lock = threading.Lock()
+
+    def path_for(self, source, target_date, slug=None):
+        name = f"{source}_{target_date.strftime('%Y-%m-%d')}"
+        if slug:
+            name += '_' + re.sub(r'[^A-Za-z0-9-]+', '-', slug).strip('-')
+        return self.root / target_date.strftime('%Y') / target_date.strftime('%m') / f"{name}.html.gz"
+
+    def store(self, source, target_date, content, slug=None, overwrite=True):
+        """페이지 원본(bytes)을 압축 저장 - 실패해도 크롤은 계속 진행"""
+        if not content:
+            return None
+        path = self.path_for(source, target_date, slug)
+        if not overwrite and path.exists():
+            return path
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(path.name + f".tmp{os.getpid()}_{threading.get_ident()}")
+            with gzip.open(tmp, 'wb', compresslevel=6) as f:
+                f.write(content)
+            os.replace(tmp, path)
+            compressed = path.stat().st_size
+        except OSError:
+            return None
+        with self._lock:
+            self.stats['stored'] += 1
+            self.stats['bytes_raw'] += len(content)
+            self.stats['bytes_compressed'] += compressed
+        return path
+
+    def iter_pages(self, source, start=None, end=None):
+        """(date, path) 목록을 날짜순으로 반환 - slug 없는 일자 페이지만 대상"""
+        pages = []
+        if not self.root.exists():
+            return pages
+        for path in self.root.glob(f"*/*/{source}_*.html.gz"):
+            match = FILENAME_RE.match(path.name)
+            if not match or match.group('source') != source or match.group('slug'):
+                continue
+            page_date = datetime.strptime(match.group('date'), '%Y-%m-%d')
+            if start and page_date < start:
+                continue
+            if end and page_date > end:
+                continue
+            pages.append((page_date, path))
+        pages.sort()
+        return pages
+
+    @staticmethod
+    def read(path):
+        with gzip.open(path, 'rb') as f:
+            return f.read()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+HTML 파서 백엔드 선택 및 페이지 유형별 SoupStrainer 파싱
+- 백엔드: lxml(설치 시) → html.parser 폴백 (HTML_PARSER로 강제 가능)
+- 페이지 유형별로 필요한 요소만 트리로 만들어 파싱 비용/메모리 절감 (HTML_STRAINER=0으로 끔)
+- 선언된 charset(HTTP 헤더 → meta)으로 바로 디코딩해 인코딩 추정 과정 생략
+- PARSE_PROFILE=1이면 페이지별 파싱 시간과 최대 메모리 사용량 기록
+"""
+
+import re
+import threading
+import time
+import tracemalloc
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# 경기 블록처럼 보이는 div class (경기별 컨테이너, div.game-info/match-info)
+GAME_BLOCK_CLASS_RE = re.compile(r'game|score|match', re.I)
+
+
+class GameBlockStrainer(SoupStrainer):
+    """names 요소는 어디서든, div는 class가 경기 블록처럼 보일 때만 남긴다
+    SoupStrainer의 이름/속성 조건은 AND로만 묶여 "h5/table/p 또는 경기 div"를 표현할 수 없어 판정만 바꾼다.
+    div를 모두 남기면 페이지 대부분을 감싼 레이아웃 div 때문에 전체 파싱과 거의 같아진다."""
+
+    def __init__(self, names, block_class_re=GAME_BLOCK_CLASS_RE):
+        super().__init__(list(names) + ['div'])
+        self.block_names = frozenset(names)
+        self.block_class_re = block_class_re
+
+    def keeps(self, name, attrs):
+        if name in self.block_names:
+            return True
+        if name != 'div':
+            return False
+        classes = (attrs or {}).get('class') or ''
+        if not isinstance(classes, str):
+            classes = ' '.join(classes)
+        return bool(self.block_class_re.search(classes))
+
+    def allow_tag_creation(self, nsprefix, name, attrs):
+        # beautifulsoup4 4.13+
+        return self.keeps(name, attrs)
+
+    def search_tag(self, markup_name=None, markup_attrs={}):
+        # beautifulsoup4 4.12: 파싱 중에는 (태그 이름, 속성 dict)로 호출된다
+        if isinstance(markup_name, str):
+            return markup_name if self.keeps(markup_name, markup_attrs) else None
+        return super().search_tag(markup_name, markup_attrs)
+
+
+# 페이지 유형별로 실제 파싱에 쓰이는 요소만 남기는 필터
+STRAINERS = {
+    # scoreTable + 상태 헤더(h5) + 구장/관중 등 부가 정보 문단(p.game-info)
+    # 경기별 div 컨테이너(class에 game/score/match)도 남겨야 scoreTable.find_parent()가 그 경기의
+    # 구장/정보 블록을 찾는다. 레이아웃 div(헤더, 사이드바, 광고 등)는 버린다.
+    'nikkansports': GameBlockStrainer(['h5', 'table', 'p']),
+    # 일자별 스코어 페이지는 경기 링크만 필요
+    'npb_day': SoupStrainer('a'),
+    # 경기별 페이지: score-table, game-status, game-time/start-time
+    'npb_game': SoupStrainer(['table', 'div', 'span']),
+    # 월별 캘린더: tetblmain 테이블
+    'calendar': SoupStrainer('table', attrs={'class': 'tetblmain'}),
+}
+
+_HEADER_CHARSET_RE = re.compile(r'charset=["\']?([\w.:-]+)', re.I)
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w.:-]+)', re.I)
+
+
+def resolve_backend(name=None):
+    """'auto'/None → lxml 우선, 없으면 html.parser"""
+    if name in (None, '', 'auto'):
+        return 'lxml' if LXML_AVAILABLE else 'html.parser'
+    if name == 'lxml' and not LXML_AVAILABLE:
+        return 'html.parser'
+    return name
+
+
+def declared_charset(content, content_type=None):
+    """HTTP Content-Type 헤더 또는 문서 앞부분 meta에서 선언된 charset 반환 (없으면 None)"""
+    if content_type:
+        match = _HEADER_CHARSET_RE.search(content_type)
+        if match:
+            return match.group(1).lower()
+    if isinstance(content, bytes):
+        match = _META_CHARSET_RE.search(content[:4096])
+        if match:
+            return match.group(1).decode('ascii', 'ignore').lower()
+    return None
+
+
+class HtmlParser:
+    """BeautifulSoup 생성기 - 백엔드/스트레이너/charset/프로파일링을 한 곳에서 처리"""
+
+    def __init__(self, backend=None, use_strainers=True, profile=False, logger=None):
+        self.backend = resolve_backend(backend)
+        self.use_strainers = use_strainers
+        self.profile = profile
+        self.logger = logger
+        self.stats = {}
+        self._lock = threading.Lock()
+
+    def parse(self, content, page_type=None, content_type=None):
+        """content(bytes/str)를 페이지 유형에 맞게 파싱"""
+        kwargs = {}
+        strainer = STRAINERS.get(page_type) if self.use_strainers else None
+        if strainer is not None:
+            kwargs['parse_only'] = strainer
+        if isinstance(content, bytes):
+            charset = declared_charset(content, content_type)
+            if charset:
+                kwargs['from_encoding'] = charset
+
+        if not self.profile:
+            return BeautifulSoup(content, self.backend, **kwargs)
+
+        # tracemalloc은 프로세스 전역이므로 병렬 크롤 중에는 근사치
+        tracing = tracemalloc.is_tracing()
+        if not tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        started = time.perf_counter()
+        soup = BeautifulSoup(content, self.backend, **kwargs)
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        if not tracing:
+            tracemalloc.stop()
+        self._record(page_type or 'other', len(content), elapsed, peak)
+        return soup
+
+    def _record(self, page_type, size, elapsed, peak):
+        with self._lock:
+            entry = self.stats.setdefault(page_type, {'pages': 0, 'bytes': 0, 'seconds': 0.0, 'peak_bytes': 0})
+            entry['pages'] += 1
+            entry['bytes'] += size
+            entry['seconds'] += elapsed
+            entry['peak_bytes'] = max(entry['peak_bytes'], peak)
+        if self.logger is not None:
+            self.logger.info(
+                f"⏱️ Parsed {page_type} page ({size / 1024:.1f}KB) in {elapsed * 1000:.1f}ms, peak {peak / 1024:.0f}KB [{self.backend}]"
+            )
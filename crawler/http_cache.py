@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+디스크 기반 HTTP 콘텐츠 캐시
+URL별로 본문과 ETag/Last-Modified를 저장하고, 조건부 GET(304) 재검증과
+'확정된(final)' 과거 날짜 페이지의 무네트워크 응답을 지원한다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+class HttpCache:
+    """URL 키 기반 캐시 - data/cache/http/<aa>/<sha1>.{body,json}"""
+
+    def __init__(self, cache_dir):
+        self.cache_dir = Path(cache_dir)
+        self.stats = {'hits': 0, 'revalidated': 0, 'misses': 0, 'stored': 0, 'bytes_saved': 0}
+        self._lock = threading.Lock()
+
+    def _paths(self, url):
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        base = self.cache_dir / key[:2] / key
+        return base.with_suffix('.body'), base.with_suffix('.json')
+
+    def load(self, url):
+        """캐시 항목 반환 (meta dict + 'body' bytes), 없거나 손상되면 None"""
+        body_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            meta['body'] = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        if meta.get('url') != url:
+            return None
+        return meta
+
+    def store(self, url, response):
+        """200 응답을 원자적으로 저장 (임시 파일 → os.replace)"""
+        body_path, meta_path = self._paths(url)
+        meta = {
+            'url': url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'content_type': response.headers.get('Content-Type'),
+            'fetched_at': time.time(),
+        }
+        try:
+            body_path.parent.mkdir(parents=True, exist_ok=True)
+            suffix = f".tmp{os.getpid()}_{threading.get_ident()}"
+            tmp_body = body_path.with_name(body_path.name + suffix)
+            tmp_meta = meta_path.with_name(meta_path.name + suffix)
+            tmp_body.write_bytes(response.content)
+            with open(tmp_meta, 'w', encoding='utf-8') as f:
+                json.dump(meta, f, ensure_ascii=False)
+            os.replace(tmp_body, body_path)
+            os.replace(tmp_meta, meta_path)
+        except OSError:
+            return
+        self._count('stored')
+
+    @staticmethod
+    def conditional_headers(entry):
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    @staticmethod
+    def is_final(entry, final_since):
+        """final_since(epoch) 이후에 받아 둔 항목이면 더 이상 바뀌지 않는 페이지로 간주"""
+        return final_since is not None and entry.get('fetched_at', 0) >= final_since
+
+    @staticmethod
+    def to_response(entry):
+        """캐시 항목을 requests.Response로 복원"""
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK (cache)'
+        response.url = entry['url']
+        response._content = entry['body']
+        response.headers = CaseInsensitiveDict()
+        if entry.get('content_type'):
+            response.headers['Content-Type'] = entry['content_type']
+        response.from_cache = True
+        return response
+
+    def _count(self, key, nbytes=0):
+        with self._lock:
+            self.stats[key] += 1
+            self.stats['bytes_saved'] += nbytes
+
+    def record_hit(self, entry):
+        self._count('hits', len(entry['body']))
+
+    def record_revalidated(self, entry):
+        self._count('revalidated', len(entry['body']))
+
+    def record_miss(self):
+        self._count('misses')
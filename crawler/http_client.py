@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+크롤러 공용 HTTP 클라이언트
+호스트별 keep-alive 세션 풀을 유지해 요청마다 TCP/TLS 핸드셰이크를 반복하지 않도록 한다.
+네트워크로 나가는 요청은 호스트별 토큰 버킷(rate_limit.HostRateLimiter)을 거친다.
+"""
+
+import threading
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36',
+    'Accept-Language': 'ja,en-US;q=0.8,en;q=0.6',
+}
+
+
+class HttpClient:
+    """호스트(npb.jp, nikkansports.com 등)마다 하나의 pooled Session을 소유하는 클라이언트"""
+
+    def __init__(self, pool_size=10, headers=None, max_per_host=3, cache=None, limiter=None):
+        self.pool_size = max(1, int(pool_size))
+        # 호스트당 동시 요청 상한 (병렬 크롤 시 서버 부하 방지)
+        self.max_per_host = max(1, int(max_per_host))
+        self.headers = dict(DEFAULT_HEADERS)
+        if headers:
+            self.headers.update(headers)
+        # 선택적 디스크 캐시 (http_cache.HttpCache)
+        self.cache = cache
+        # 선택적 요청 속도 제한 (rate_limit.HostRateLimiter) - 캐시 적중은 대상 아님
+        self.limiter = limiter
+        self._sessions = {}
+        self._host_slots = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_of(url):
+        return urlsplit(url).netloc.lower()
+
+    def session_for(self, url):
+        """URL의 호스트 전용 Session 반환 (없으면 생성)"""
+        host = self.host_of(url)
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                session.headers.update(self.headers)
+                # pool_connections: 리다이렉트로 다른 호스트를 거쳐도 원래 풀이 밀려나지 않도록 여유를 둠
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.pool_size)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self._sessions[host] = session
+        return session
+
+    def host_slot(self, url):
+        """호스트별 동시 요청 수를 제한하는 세마포어"""
+        host = self.host_of(url)
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.max_per_host)
+                self._host_slots[host] = slot
+        return slot
+
+    def get(self, url, timeout=15, headers=None, cache='use', final_since=None):
+        """pooled Session으로 GET 요청 (호스트별 동시성/속도 제한 적용)
+
+        cache: 'use'     - 캐시 항목이 있으면 조건부 GET으로 재검증 (304면 캐시 본문 반환)
+               'refresh' - 무조건 새로 받아 캐시 갱신
+               None      - 캐시 미사용
+        final_since: 이 시각(epoch) 이후에 저장된 캐시 항목은 네트워크 없이 바로 반환
+        """
+        use_cache = self.cache is not None and cache is not None
+        entry = self.cache.load(url) if (use_cache and cache == 'use') else None
+        if entry is not None and self.cache.is_final(entry, final_since):
+            self.cache.record_hit(entry)
+            response = self.cache.to_response(entry)
+            # 네트워크를 거치지 않은 응답 (서킷 브레이커 판정에서 제외)
+            response.offline = True
+            return response
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            request_headers.update(self.cache.conditional_headers(entry))
+
+        session = self.session_for(url)
+        with self.host_slot(url):
+            if self.limiter is not None:
+                self.limiter.acquire(url)
+            response = session.get(url, timeout=timeout, headers=request_headers or None)
+        if self.limiter is not None:
+            self.limiter.observe(url, response.status_code, response.headers)
+
+        if use_cache:
+            if entry is not None and response.status_code == 304:
+                self.cache.record_revalidated(entry)
+                return self.cache.to_response(entry)
+            if response.status_code == 200 and response.content:
+                self.cache.record_miss()
+                self.cache.store(url, response)
+        return response
+
+    def connection_stats(self):
+        """호스트별 요청 수/신규 연결 수/재사용 수 집계 (urllib3 커넥션 풀 카운터 기준)"""
+        stats = {}
+        with self._lock:
+            sessions = list(self._sessions.values())
+        for session in sessions:
+            seen = set()
+            for adapter in session.adapters.values():
+                if id(adapter) in seen or not hasattr(adapter, 'poolmanager'):
+                    continue
+                seen.add(id(adapter))
+                pools = adapter.poolmanager.pools
+                for key in list(pools.keys()):
+                    pool = pools.get(key)
+                    if pool is None:
+                        continue
+                    entry = stats.setdefault(pool.host, {'requests': 0, 'connections': 0, 'reused': 0})
+                    entry['requests'] += pool.num_requests
+                    entry['connections'] += pool.num_connections
+        for entry in stats.values():
+            entry['reused'] = max(0, entry['requests'] - entry['connections'])
+        return stats
+
+    def close(self):
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+스코어 페이지 파싱 공용 도구 (미리 컴파일한 정규식/변환 테이블)
+테이블·셀마다 다시 만들던 str.maketrans, 점수/이닝 칸 변환 함수, 중지 표시 검사,
+중복 판정 키를 모듈 수준에 한 번만 만들어 SimpleCrawler/비동기 백엔드가 함께 쓴다.
+"""
+
+import re
+
+# 전각 숫자 → 반각
+FULLWIDTH_DIGITS = str.maketrans('０１２３４５６７８９', '0123456789')
+# 이닝 칸: 전각 숫자 + 끝내기 표시(Ｘ/ｘ/x → X)
+_INNING_CELL = str.maketrans({
+    **{ord(fw): hw for fw, hw in zip('０１２３４５６７８９', '0123456789')},
+    'Ｘ': 'X', 'ｘ': 'X', 'x': 'X',
+})
+
+# 경기 상태 키워드
+DRAW_KEYWORDS = ('引き分け', '引分', '規定により引き分け')
+COLD_KEYWORDS = ('降雨コールド', 'コールドゲーム', '降雨コール')
+INPROGRESS_KEYWORDS = ('試合中', '中断中', 'プレイボール', '攻撃中', '守備中')
+COMPLETION_KEYWORDS = ('試合終了', '終了', 'ゲーム終了', 'GAME SET', 'FINAL', '最終') + DRAW_KEYWORDS
+POSTPONED_KEYWORDS = ('雨天中止', '中止', '延期', 'サスペンデッド', 'ノーゲーム', 'ノーコンテスト', '打切', '打ち切り')
+# 점수 칸에 숫자 대신 들어가는 중지 표시
+SCORE_POSTPONED_MARKERS = ('中止', '雨天', '降雨', 'ノーゲーム', 'ノーコンテスト', '打切', '打ち切り', '延期', 'サスペンデッド')
+STADIUM_MARKERS = ('ドーム', '球場', 'スタジアム', 'パーク')
+
+INNING_RE = re.compile(r'(?:延長)?(\d+)回')
+INNING_HALF_RE = re.compile(r'(?:延長)?(\d+)回([表裏])')
+HALF_RE = re.compile(r'(表|裏)')
+DURATION_RE = re.compile(r'(\d+)時間(\d+)分')
+ATTENDANCE_RE = re.compile(r'(\d{1,3}(?:,\d{3})*)')
+TEMPERATURE_RE = re.compile(r'(\d+)度')
+
+
+def _digits(text):
+    return ''.join(ch for ch in text if ch.isdigit())
+
+
+def convert_jp_number(text):
+    """점수 칸 텍스트(전각 숫자 포함) → int, 숫자가 없으면(중지/미완료) None"""
+    if text is None:
+        return None
+    cleaned = _digits(text.translate(FULLWIDTH_DIGITS))
+    if not cleaned:
+        return None
+    try:
+        return int(cleaned)
+    except ValueError:
+        return None
+
+
+def parse_inning_cell(text):
+    """이닝 칸 텍스트 → int ('1X' 같은 끝내기 표시 포함), 'X'만 있으면 None, 빈칸/기호는 0"""
+    t = text.translate(_INNING_CELL)
+    digits = _digits(t)
+    if digits:
+        return int(digits)
+    if 'X' in t:
+        return None
+    # 완료 경기에서 비어 있거나 기호만 있는 칸은 0으로 취급
+    return 0
+
+
+def has_any(text, keywords):
+    return any(k in text for k in keywords)
+
+
+def is_postponed_score(*score_texts):
+    """점수 칸에 중지/노게임 표시가 있는지"""
+    return has_any(' '.join(score_texts), SCORE_POSTPONED_MARKERS)
+
+
+def is_stadium_text(text):
+    """BeautifulSoup find_all(string=...)용 구장명 판정"""
+    return bool(text) and has_any(text, STADIUM_MARKERS)
+
+
+def _score_token(val):
+    if isinstance(val, int):
+        return f"{val:02d}"
+    if val is None:
+        return 'NA'
+    try:
+        return f"{int(val):02d}"
+    except Exception:
+        return str(val)
+
+
+def symmetric_key(game):
+    """홈/원정 방향과 무관한 중복 판정 키 (game: game_record.Game)"""
+    home_id = int(game.home.id)
+    away_id = int(game.away.id)
+    min_id, max_id = (home_id, away_id) if home_id <= away_id else (away_id, home_id)
+    score_signature = tuple(sorted([
+        _score_token(game.home_score),
+        _score_token(game.away_score)
+    ]))
+    return (game.date, min_id, max_id, score_signature,
+            game.status, game.final_inning, game.game_time)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+호스트별 토큰 버킷 요청 속도 제한
+모든 네트워크 요청(requests/Selenium)이 같은 버킷을 거치며,
+429/5xx 응답이면 속도를 절반으로 낮추고 Retry-After 동안 요청을 멈춘 뒤
+정상 응답이 이어지면 설정한 속도까지 서서히 회복한다.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+
+# 속도를 낮추는 응답 코드 (그 외 5xx도 포함)
+THROTTLE_STATUSES = (429, 503)
+
+
+def parse_retry_after(value, now=None):
+    """Retry-After 헤더(초 또는 HTTP-date)를 대기 초로 변환 (해석 불가 시 None)"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    # HTTP-date 형식은 드물어 email.utils(+socket)는 필요할 때만 import
+    from email.utils import parsedate_to_datetime
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+    return max(0.0, (when - now).total_seconds())
+
+
+class TokenBucket:
+    """초당 rate개 토큰, 최대 burst개까지 적립"""
+
+    def __init__(self, rate, burst):
+        self.base_rate = float(rate)
+        self.rate = float(rate)
+        self.burst = max(1.0, float(burst))
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.stats = {'requests': 0, 'waited': 0.0, 'throttled': 0}
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self):
+        """토큰 하나를 얻을 때까지 대기 - 기다린 시간(초) 반환"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self.blocked_until:
+                    delay = self.blocked_until - now
+                elif self.tokens >= 1:
+                    self.tokens -= 1
+                    self.stats['requests'] += 1
+                    self.stats['waited'] += waited
+                    return waited
+                else:
+                    delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def throttle(self, retry_after=None, min_rate=0.1):
+        """과부하 신호: 속도 절반 + Retry-After(없으면 1/rate초) 동안 정지"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(min_rate, self.rate / 2)
+            self.tokens = 0.0
+            pause = retry_after if retry_after is not None else 1.0 / self.rate
+            self.blocked_until = max(self.blocked_until, now + pause)
+            self.stats['throttled'] += 1
+
+    def recover(self):
+        """정상 응답마다 기본 속도의 10%씩 회복"""
+        if self.rate >= self.base_rate:
+            return
+        with self._lock:
+            self.rate = min(self.base_rate, self.rate + self.base_rate * 0.1)
+
+
+class HostRateLimiter:
+    """호스트별 TokenBucket 모음 (HttpClient, Selenium 경로 공유)"""
+
+    def __init__(self, rate=3.0, burst=6, min_rate=0.1):
+        self.rate = max(0.01, float(rate))
+        self.burst = max(1, int(burst))
+        self.min_rate = min(min_rate, self.rate)
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, url):
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.rate, self.burst)
+                self._buckets[host] = bucket
+        return bucket
+
+    def acquire(self, url):
+        return self.bucket(url).acquire()
+
+    def observe(self, url, status_code, headers=None):
+        """응답 코드에 따라 해당 호스트 속도 조절"""
+        bucket = self.bucket(url)
+        if status_code in THROTTLE_STATUSES or status_code >= 500:
+            retry_after = parse_retry_after((headers or {}).get('Retry-After'))
+            bucket.throttle(retry_after, self.min_rate)
+        elif status_code < 400:
+            bucket.recover()
+
+    def stats(self):
+        """{host: {requests, waited, throttled, rate}}"""
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {host: dict(b.stats, rate=b.rate) for host, b in buckets.items()}
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+재시도/서킷 브레이커
+- RetryPolicy: 지터를 섞은 지수 백오프로 일시적 오류(연결 실패, 타임아웃, 429/5xx) 재시도
+- CircuitBreaker: 소스(npb.jp, nikkansports)별로 연속 실패가 쌓이면 일정 시간 요청을 끊고,
+  그 뒤 한 번만 시험 요청(half-open)을 보내 복구 여부를 확인
+"""
+
+import random
+import threading
+import time
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 요청을 보내지 않음"""
+
+
+def is_retryable_status(status_code):
+    return status_code == 429 or status_code >= 500
+
+
+class RetryPolicy:
+    """attempts회까지 시도, n번째 재시도 전 0~min(max_delay, base_delay*2^n)초 대기 (full jitter)"""
+
+    def __init__(self, attempts=3, base_delay=0.5, max_delay=8.0, sleep=time.sleep):
+        self.attempts = max(1, int(attempts))
+        self.base_delay = max(0.0, float(base_delay))
+        self.max_delay = max(self.base_delay, float(max_delay))
+        self._sleep = sleep
+        self.stats = {'retries': 0}
+        self._lock = threading.Lock()
+
+    def delay(self, retry_index):
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** retry_index)))
+
+    def call(self, func, retry_exceptions=(), retry_result=None):
+        """func() 실행 - retry_exceptions 예외나 retry_result(결과)가 참이면 백오프 후 재시도
+        마지막 시도의 결과/예외를 그대로 돌려준다."""
+        for attempt in range(self.attempts):
+            last = attempt == self.attempts - 1
+            try:
+                result = func()
+            except retry_exceptions:
+                if last:
+                    raise
+            else:
+                if last or retry_result is None or not retry_result(result):
+                    return result
+            with self._lock:
+                self.stats['retries'] += 1
+            self._sleep(self.delay(attempt))
+
+
+class CircuitBreaker:
+    """연속 failure_threshold회 실패 시 reset_timeout초 동안 open"""
+
+    def __init__(self, name, failure_threshold=3, reset_timeout=300.0):
+        self.name = name
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_timeout = float(reset_timeout)
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.stats = {'opened': 0, 'short_circuited': 0, 'failures': 0}
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """요청을 보내도 되는지 - open이면 reset_timeout 경과 후 시험 요청 하나만 허용"""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = HALF_OPEN
+                self._probe_in_flight = False
+            if self.state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self.stats['short_circuited'] += 1
+            return False
+
+    def is_open(self):
+        """시험 요청 시점 전까지는 open으로 간주 (상태 변경 없음)"""
+        with self._lock:
+            if self.state == OPEN:
+                return time.monotonic() - self.opened_at < self.reset_timeout
+            return self.state == HALF_OPEN and self._probe_in_flight
+
+    def record_success(self):
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self._probe_in_flight = False
+
+    def record_skipped(self):
+        """허용됐지만 네트워크를 쓰지 않은 요청 (캐시 적중) - 시험 요청 자리만 반납"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        """실패 기록 - 새로 open 되었으면 True"""
+        with self._lock:
+            self.failures += 1
+            self.stats['failures'] += 1
+            self._probe_in_flight = False
+            if self.state == HALF_OPEN or (self.state == CLOSED and self.failures >= self.failure_threshold):
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+                self.stats['opened'] += 1
+                return True
+            return False
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+닛칸스포츠 scoreTable 한 개의 텍스트 뷰 + 상태 판정
+테이블 전체 텍스트, 바로 앞 h5 헤더, 행별 셀 텍스트를 한 번만 뽑아 두고
+경기 상태/완료/무승부 판정은 이 뷰만 보는 순수 함수로 처리한다 (BeautifulSoup 재탐색 없음).
+구장/경기 시간/관중/날씨는 PageInfoIndex가 페이지당 한 번 모아 테이블별로 돌려준다.
+"""
+
+from collections import Counter
+
+from parsing_primitives import (
+    ATTENDANCE_RE, COLD_KEYWORDS, COMPLETION_KEYWORDS, DRAW_KEYWORDS, DURATION_RE, HALF_RE,
+    INNING_HALF_RE, INNING_RE, INPROGRESS_KEYWORDS, POSTPONED_KEYWORDS, TEMPERATURE_RE, has_any,
+    is_stadium_text,
+)
+
+# 진행 상태가 적히는 셀 클래스
+STATUS_CELL_CLASSES = ('status', 'inning', 'gameStatus')
+COMPLETION_TEXT_KEYWORDS = ('試合終了', 'ゲームセット', '引き分け', 'コールド')
+# 경기 시간/관중/날씨가 적히는 블록
+INFO_TAGS = ('p', 'div')
+INFO_CLASSES = ('game-info', 'match-info')
+
+
+class Cell:
+    __slots__ = ('name', 'classes', 'text')
+
+    def __init__(self, name, classes, text):
+        self.name = name
+        self.classes = classes
+        self.text = text
+
+    def has_class(self, name):
+        return name in self.classes
+
+
+class ScoreTableView:
+    """scoreTable 파싱 결과 (header_text: 앞 h5 텍스트 또는 None, text: 테이블 전체 텍스트, rows: 행별 Cell 목록)"""
+
+    __slots__ = ('table', 'header_text', 'text', 'rows')
+
+    def __init__(self, table, header_text, text, rows):
+        self.table = table
+        self.header_text = header_text
+        self.text = text
+        self.rows = rows
+
+    @classmethod
+    def from_table(cls, table):
+        header = table.find_previous_sibling('h5')
+        rows = [
+            [Cell(cell.name, tuple(cell.get('class') or ()), cell.get_text(strip=True))
+             for cell in tr.find_all(['td', 'th'])]
+            for tr in table.find_all('tr')
+        ]
+        return cls(table, header.get_text() if header else None, table.get_text(' ', strip=True), rows)
+
+    def tds(self, index):
+        """index번째 행의 td 셀 목록"""
+        return [c for c in self.rows[index] if c.name == 'td']
+
+    def cell_text(self, index, class_name):
+        """index번째 행에서 class_name 클래스를 가진 첫 td 텍스트 (없으면 None)"""
+        for c in self.rows[index]:
+            if c.name == 'td' and c.has_class(class_name):
+                return c.text
+        return None
+
+    def status_texts(self):
+        for row in self.rows:
+            for c in row:
+                if any(c.has_class(name) for name in STATUS_CELL_CLASSES):
+                    yield c.text
+
+
+def detect_game_status(view):
+    """경기 상태 정보 (status/inning/inning_half/game_time) - h5 헤더 → 상태 셀 순으로 판정"""
+    status_info = {
+        'status': 'scheduled',  # 기본값: 예정
+        'inning': None,
+        'inning_half': None,
+        'game_time': None
+    }
+
+    # 1. H5 헤더의 [試合中止] / [試合終了] / 무승부·콜드 표시
+    header_text = view.header_text
+    if header_text:
+        if '試合中止' in header_text:
+            status_info['status'] = 'postponed'
+            return status_info
+        if has_any(header_text, DRAW_KEYWORDS) or has_any(header_text, COLD_KEYWORDS):
+            status_info['status'] = 'completed'
+            inning_match = INNING_RE.search(header_text)
+            if inning_match:
+                status_info['inning'] = int(inning_match.group(1))
+            half_match = HALF_RE.search(header_text)
+            if half_match:
+                status_info['inning_half'] = 'top' if half_match.group(1) == '表' else 'bottom'
+        if '試合終了' in header_text:
+            status_info['status'] = 'completed'
+
+    # 2. 상태 셀: "8回裏", "延長10回表" 등은 진행 중
+    for text in view.status_texts():
+        inning_pattern = INNING_HALF_RE.search(text)
+        if inning_pattern:
+            status_info['status'] = 'inprogress'
+            status_info['inning'] = int(inning_pattern.group(1))
+            status_info['inning_half'] = 'top' if inning_pattern.group(2) == '表' else 'bottom'
+            return status_info
+        if has_any(text, INPROGRESS_KEYWORDS):
+            status_info['status'] = 'inprogress'
+            return status_info
+        if has_any(text, COMPLETION_KEYWORDS):
+            status_info['status'] = 'completed'
+        elif has_any(text, POSTPONED_KEYWORDS):
+            status_info['status'] = 'postponed'
+
+    return status_info
+
+
+def detect_completion(view, status_info):
+    """점수는 있는데 상태가 불분명할 때 테이블 텍스트 키워드로만 보수적으로 판정"""
+    if status_info.get('status') == 'completed':
+        return 'completed'
+    if has_any(view.text, COMPLETION_TEXT_KEYWORDS):
+        return 'completed'
+    if has_any(view.text, POSTPONED_KEYWORDS):
+        return 'postponed'
+    return 'scheduled'
+
+
+def has_draw_keyword(view):
+    """引き分け/引分/規定により引き分け 표기 여부 (로그용)"""
+    return has_any(view.text, DRAW_KEYWORDS)
+
+
+def parse_game_info(texts):
+    """game-info 블록 텍스트들 → game_duration/attendance/weather/temperature (뒤 블록이 앞 값을 덮어씀)"""
+    info = {}
+    for text in texts:
+        # 경기 시간 (예: "2時間35分")
+        time_match = DURATION_RE.search(text)
+        if time_match:
+            info['game_duration'] = f"{int(time_match.group(1))}:{int(time_match.group(2)):02d}"
+
+        # 관중 수 (예: "観客 35,000人")
+        attendance_match = ATTENDANCE_RE.search(text)
+        if attendance_match and '観客' in text:
+            info['attendance'] = int(attendance_match.group(1).replace(',', ''))
+
+        if '晴' in text:
+            info['weather'] = '晴れ'
+        elif '曇' in text:
+            info['weather'] = '曇り'
+        elif '雨' in text:
+            info['weather'] = '雨'
+
+        temp_match = TEMPERATURE_RE.search(text)
+        if temp_match:
+            info['temperature'] = int(temp_match.group(1))
+    return info
+
+
+def _is_score_table(node):
+    return node.name == 'table' and 'scoreTable' in (node.get('class') or ())
+
+
+def _split_by_tables(parent):
+    """부모의 자식들을 scoreTable 기준으로 나눈다 → (tables, gaps)
+    gaps[i]는 tables[i] 바로 앞 구간의 노드(gaps[0]은 첫 테이블 앞), gaps[-1]은 마지막 테이블 뒤"""
+    tables, gaps, current = [], [], []
+    for child in parent.children:
+        if _is_score_table(child):
+            tables.append(child)
+            gaps.append(current)
+            current = []
+            continue
+        current.append(child)
+        if child.name is not None:
+            current.extend(child.descendants)
+    gaps.append(current)
+    return tables, gaps
+
+
+class PageInfoIndex:
+    """scoreTable → 같은 부모 컨테이너의 구장명(첫 구장 텍스트)과 game-info 정보
+    테이블들이 공유하는 부모는 한 번만 훑으므로 페이지 크기에 비례하는 비용으로 끝난다.
+    여러 테이블이 한 부모(문서 루트/body, 경기 목록 전체를 감싼 div 등)에 바로 붙어 있으면(그 부모를
+    훑으면 모든 경기가 첫 구장·마지막 정보를 갖게 됨) 테이블 사이 구간을 앞뒤 테이블 중 하나에만 붙인다.
+    구장/정보가 테이블 앞에 오는 페이지(첫 테이블 앞에는 있고 마지막 테이블 뒤에는 없음)는 뒤 테이블,
+    그 밖에는 앞 테이블 몫으로 보고, 구장과 정보는 따로 판단한다."""
+
+    def __init__(self, tables):
+        self._by_parent = {}
+        self._parent_of = {}
+        self._by_table = {}
+        tables = list(tables)
+        parents = [table.find_parent() for table in tables]
+        shared = Counter(id(parent) for parent in parents if parent is not None)
+        for table, parent in zip(tables, parents):
+            if parent is not None and shared[id(parent)] > 1:
+                if id(table) not in self._by_table:
+                    self._index_shared_parent(parent)
+            else:
+                self._add(table, parent)
+
+    def _add(self, table, parent=None):
+        if parent is None:
+            parent = table.find_parent()
+        self._parent_of[id(table)] = parent
+        if parent is not None and id(parent) not in self._by_parent:
+            self._by_parent[id(parent)] = self._scan(parent.descendants)
+
+    def _index_shared_parent(self, parent):
+        tables, gaps = _split_by_tables(parent)
+        found = [self._collect(gap) for gap in gaps]
+        (lead_stadium, lead_info), (tail_stadium, tail_info) = found[0], found[-1]
+        stadium_before = lead_stadium is not None and tail_stadium is None
+        info_before = bool(lead_info) and not tail_info
+        for i, table in enumerate(tables):
+            own_stadium, own_info = self._collect(table.descendants)
+            before, after = found[i], found[i + 1]
+            info = parse_game_info(own_info + (before if info_before else after)[1])
+            info['stadium'] = own_stadium or (before if stadium_before else after)[0]
+            self._by_table[id(table)] = info
+
+    @staticmethod
+    def _collect(nodes):
+        """노드들 → (첫 구장 텍스트 또는 None, game-info 블록 텍스트 목록)"""
+        stadium = None
+        info_texts = []
+        for node in nodes:
+            if node.name is None:
+                if stadium is None and is_stadium_text(node):
+                    stadium = node.strip()
+            elif node.name in INFO_TAGS and any(c in INFO_CLASSES for c in node.get('class') or ()):
+                info_texts.append(node.get_text())
+        return stadium, info_texts
+
+    @classmethod
+    def _scan(cls, nodes):
+        stadium, info_texts = cls._collect(nodes)
+        info = parse_game_info(info_texts)
+        info['stadium'] = stadium
+        return info
+
+    def lookup(self, table):
+        """stadium(없으면 None) + 찾은 game_duration/attendance/weather/temperature"""
+        if id(table) in self._by_table:
+            return self._by_table[id(table)]
+        if id(table) not in self._parent_of:
+            self._add(table)
+        parent = self._parent_of[id(table)]
+        if parent is None:
+            return {'stadium': None}
+        return self._by_parent[id(parent)]
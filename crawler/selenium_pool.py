@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Selenium 드라이버 풀 + 네거티브 캐시
+- DriverPool: 최대 size개의 헤드리스 Chrome을 재사용하고 max_pages 페이지마다 새로 띄움(메모리 누수 방지),
+  close()로 모두 종료
+- NegativeCache: 브라우저로도 받지 못한 URL을 기록해 다음 실행부터 브라우저 로드를 생략
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+
+class DriverPool:
+    """factory()로 만든 WebDriver를 빌려 쓰고 돌려주는 풀"""
+
+    def __init__(self, factory, size=1, max_pages=50, logger=None):
+        self.factory = factory
+        self.size = max(1, int(size))
+        self.max_pages = max(1, int(max_pages))
+        self.logger = logger
+        self.stats = {'launches': 0, 'page_loads': 0, 'recycled': 0, 'failures': 0}
+        self._idle = []
+        self._pages = {}
+        self._count = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def _acquire(self):
+        with self._cond:
+            while True:
+                if self._closed:
+                    return None
+                if self._idle:
+                    return self._idle.pop()
+                if self._count < self.size:
+                    self._count += 1
+                    break
+                self._cond.wait()
+        # 브라우저 기동은 느리므로 락 밖에서
+        try:
+            driver = self.factory()
+        except Exception as e:
+            driver = None
+            if self.logger:
+                self.logger.warning(f"⚠️ Selenium init failed: {e}")
+        with self._cond:
+            if driver is None:
+                self._count -= 1
+                self._cond.notify()
+                return None
+            self.stats['launches'] += 1
+            self._pages[id(driver)] = 0
+        return driver
+
+    def _release(self, driver, broken=False):
+        with self._cond:
+            self._pages[id(driver)] = self._pages.get(id(driver), 0) + 1
+            self.stats['page_loads'] += 1
+            if broken:
+                self.stats['failures'] += 1
+            retire = broken or self._closed or self._pages[id(driver)] >= self.max_pages
+            if retire:
+                self._pages.pop(id(driver), None)
+                self._count -= 1
+                if not broken and not self._closed:
+                    self.stats['recycled'] += 1
+            else:
+                self._idle.append(driver)
+            self._cond.notify()
+        if retire:
+            self._quit(driver)
+
+    @contextmanager
+    def driver(self):
+        """with pool.driver() as driver: ... - 기동 실패나 종료 후에는 None"""
+        driver = self._acquire()
+        if driver is None:
+            yield None
+            return
+        broken = False
+        try:
+            yield driver
+        except BaseException:
+            broken = True
+            raise
+        finally:
+            self._release(driver, broken)
+
+    def _quit(self, driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close(self):
+        """유휴 드라이버 종료 (사용 중인 드라이버는 반납 시 종료)"""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            for driver in idle:
+                self._pages.pop(id(driver), None)
+                self._count -= 1
+            self._cond.notify_all()
+        for driver in idle:
+            self._quit(driver)
+
+
+class NegativeCache:
+    """브라우저 폴백이 실패한 URL 기록 (data/cache/selenium_negative.json)
+    확정된 날짜(final) 페이지는 계속 유지하고, 그 외는 ttl초 뒤 다시 시도한다."""
+
+    def __init__(self, path, ttl=6 * 3600):
+        self.path = Path(path)
+        self.ttl = float(ttl)
+        self.stats = {'skipped': 0, 'added': 0}
+        self._entries = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._entries is None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def contains(self, url):
+        with self._lock:
+            entry = self._load().get(url)
+            if entry is None:
+                return False
+            if not entry.get('final') and time.time() - entry.get('at', 0) >= self.ttl:
+                return False
+            self.stats['skipped'] += 1
+            return True
+
+    def add(self, url, final=False):
+        with self._lock:
+            self._load()[url] = {'at': time.time(), 'final': bool(final)}
+            self.stats['added'] += 1
+            self._dirty = True
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            now = time.time()
+            entries = {
+                url: e for url, e in self._entries.items()
+                if e.get('final') or now - e.get('at', 0) < self.ttl
+            }
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.path.with_name(self.path.name + f".tmp{os.getpid()}")
+                with open(tmp, 'w', encoding='utf-8') as f:
+                    json.dump(entries, f, ensure_ascii=False, indent=2)
+                os.replace(tmp, self.path)
+                self._dirty = False
+            except OSError:
+                pass
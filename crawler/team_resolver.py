@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+팀명 → 팀(teams.Team) 해석기
+정확히 일치하는 표기는 dict로 바로 찾고, 그 외에는 별칭 트라이로 왼쪽에서 가장 먼저,
+같은 위치에서는 가장 긴 별칭을 찾는다 ('北海道日本ハム…' → '日本ハム', '中日…' → '中日').
+dict 순서에 따라 한 글자 별칭('中', '日')이 먼저 걸리던 선형 부분 문자열 검색을 대체한다.
+"""
+
+from teams import ALIASES
+
+_END = ''  # 트라이 노드에서 별칭 끝 표시 (별칭 문자로는 나오지 않는 키)
+_SPACES = str.maketrans('', '', ' 　\xa0')
+
+
+class TeamResolver:
+    """exact dict → 정규화(공백 제거) exact → 트라이 leftmost-longest 순으로 레지스트리 Team 반환
+    aliases: 표기 → Team (기본 teams.ALIASES)"""
+
+    def __init__(self, aliases=None):
+        self.aliases = dict(ALIASES if aliases is None else aliases)
+        self._trie = {}
+        self._by_id = {}
+        for alias, info in self.aliases.items():
+            self._by_id.setdefault(info.id, info)
+            node = self._trie
+            for ch in alias:
+                node = node.setdefault(ch, {})
+            node[_END] = info
+        # 라벨 종류가 적어(수십 개) 결과를 그대로 기억
+        self._memo = {}
+
+    def resolve(self, label):
+        if not label:
+            return None
+        info = self.aliases.get(label)
+        if info is not None:
+            return info
+        if label in self._memo:
+            return self._memo[label]
+        info = self._scan(label.translate(_SPACES))
+        self._memo[label] = info
+        return info
+
+    def by_id(self, team_id):
+        """팀 ID → Team (없으면 None)"""
+        return self._by_id.get(team_id)
+
+    def _scan(self, text):
+        info = self.aliases.get(text)
+        if info is not None:
+            return info
+        trie = self._trie
+        for start in range(len(text)):
+            node = trie
+            found = None
+            for ch in text[start:]:
+                node = node.get(ch)
+                if node is None:
+                    break
+                if _END in node:
+                    found = node[_END]
+            if found is not None:
+                return found
+        return None
+
+
+_default = None
+
+
+def default_resolver():
+    """teams.ALIASES 기반 공용 인스턴스"""
+    global _default
+    if _default is None:
+        _default = TeamResolver()
+    return _default
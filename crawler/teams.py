@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+NPB 팀 레지스트리
+12개 구단을 불변 Team 객체 하나씩으로 정의하고 ID(TEAMS[id]), 약어(BY_ABBR),
+웹사이트 표기 별칭(ALIASES)으로 바로 찾는다. 팀 정보가 필요한 곳은 모두 여기서 가져가므로
+같은 팀은 어디서나 같은 객체이고, 반복문에서는 문자열 대신 객체(is, dict 키)로 비교한다.
+database/create_tables.sql의 teams 시드는 `python crawler/teams.py --sql` 출력이다.
+"""
+
+import sys
+
+CENTRAL_LEAGUE = 'Central'
+PACIFIC_LEAGUE = 'Pacific'
+LEAGUES = (CENTRAL_LEAGUE, PACIFIC_LEAGUE)
+
+
+class Team:
+    """팀 하나 (생성 후 변경 불가)
+    short: games_raw.txt에 쓰는 일본어 표기, stadium: 구장명을 모를 때 쓰는 홈 구장
+    레지스트리 밖 팀(저널 등에서 읽은 비표준 팀)은 id/abbr/name만 있고 나머지는 None"""
+
+    __slots__ = ('id', 'abbr', 'name', 'league', 'short', 'stadium', 'name_en', 'city', 'founded')
+
+    def __init__(self, team_id, abbr, name, league=None, short=None, stadium=None,
+                 name_en=None, city=None, founded=None):
+        set_field = object.__setattr__
+        set_field(self, 'id', team_id)
+        set_field(self, 'abbr', abbr)
+        set_field(self, 'name', name)
+        set_field(self, 'league', league)
+        set_field(self, 'short', short)
+        set_field(self, 'stadium', stadium)
+        set_field(self, 'name_en', name_en)
+        set_field(self, 'city', city)
+        set_field(self, 'founded', founded)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Team is immutable (cannot set {name!r})")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Team is immutable (cannot delete {name!r})")
+
+    def __reduce__(self):
+        # 프로세스 간 전달(pickle) 후에도 같은 인스턴스를 공유
+        return intern_team, (self.id, self.abbr, self.name)
+
+    def __repr__(self):
+        return f"Team({self.id}, {self.abbr!r}, {self.name!r})"
+
+
+# ID 순서 (TEAMS[id]로 찾도록 0번은 비워 둠)
+TEAMS = (
+    None,
+    # 센트럴리그
+    Team(1, 'YOG', '読売ジャイアンツ', CENTRAL_LEAGUE, '巨人', '東京ドーム',
+         'Yomiuri Giants', '東京', 1934),
+    Team(2, 'HAN', '阪神タイガース', CENTRAL_LEAGUE, '阪神', '阪神甲子園球場',
+         'Hanshin Tigers', '西宮', 1935),
+    Team(3, 'YDB', '横浜DeNAベイスターズ', CENTRAL_LEAGUE, 'ＤｅＮＡ', '横浜スタジアム',
+         'Yokohama DeNA BayStars', '横浜', 1950),
+    Team(4, 'HIR', '広島東洋カープ', CENTRAL_LEAGUE, '広島', 'MAZDA Zoom-Zoom スタジアム広島',
+         'Hiroshima Toyo Carp', '広島', 1950),
+    Team(5, 'CHU', '中日ドラゴンズ', CENTRAL_LEAGUE, '中日', 'バンテリンドーム ナゴヤ',
+         'Chunichi Dragons', '名古屋', 1936),
+    Team(6, 'YAK', '東京ヤクルトスワローズ', CENTRAL_LEAGUE, 'ヤクルト', '明治神宮野球場',
+         'Tokyo Yakult Swallows', '東京', 1950),
+    # 퍼시픽리그
+    Team(7, 'SOF', '福岡ソフトバンクホークス', PACIFIC_LEAGUE, 'ソフトバンク', '福岡PayPayドーム',
+         'Fukuoka SoftBank Hawks', '福岡', 1938),
+    Team(8, 'LOT', '千葉ロッテマリーンズ', PACIFIC_LEAGUE, 'ロッテ', 'ZOZOマリンスタジアム',
+         'Chiba Lotte Marines', '千葉', 1950),
+    Team(9, 'RAK', '東北楽天ゴールデンイーグルス', PACIFIC_LEAGUE, '楽天', '楽天モバイルパーク宮城',
+         'Tohoku Rakuten Golden Eagles', '仙台', 2005),
+    Team(10, 'ORI', 'オリックスバファローズ', PACIFIC_LEAGUE, 'オリックス', '京セラドーム大阪',
+         'Orix Buffaloes', '大阪', 1936),
+    Team(11, 'SEI', '埼玉西武ライオンズ', PACIFIC_LEAGUE, '西武', 'ベルーナドーム',
+         'Saitama Seibu Lions', '所沢', 1950),
+    Team(12, 'NIP', '北海道日本ハムファイターズ', PACIFIC_LEAGUE, '日本ハム', 'エスコンフィールドHOKKAIDO',
+         'Hokkaido Nippon-Ham Fighters', '札幌', 1946),
+)
+
+ALL_TEAMS = TEAMS[1:]
+CENTRAL = tuple(team for team in ALL_TEAMS if team.league == CENTRAL_LEAGUE)
+PACIFIC = tuple(team for team in ALL_TEAMS if team.league == PACIFIC_LEAGUE)
+BY_ABBR = {team.abbr: team for team in ALL_TEAMS}
+
+# 웹사이트 표시명 → 팀 (TeamResolver가 트라이로 부분 일치까지 해석)
+ALIASES = {
+    # 센트럴리그
+    'ジャイアンツ': TEAMS[1],
+    '巨人': TEAMS[1],
+    '巨': TEAMS[1],  # NPB 축약형
+    '阪神': TEAMS[2],
+    '神': TEAMS[2],  # NPB 1문자 표기
+    '阪': TEAMS[2],  # NPB 축약형
+    'ＤｅＮＡ': TEAMS[3],
+    'DeNA': TEAMS[3],
+    'デ': TEAMS[3],
+    'Ｄ': TEAMS[3],  # NPB 축약형
+    '中日': TEAMS[5],
+    '中': TEAMS[5],  # NPB 축약형
+    '広島': TEAMS[4],
+    '広': TEAMS[4],  # NPB 축약형
+    'ヤクルト': TEAMS[6],
+    'ヤ': TEAMS[6],  # NPB 축약형
+
+    # 퍼시픽리그
+    'ソフトバンク': TEAMS[7],
+    'ソ': TEAMS[7],  # NPB 축약형
+    'ロッテ': TEAMS[8],
+    'ロ': TEAMS[8],  # NPB 축약형
+    '楽天': TEAMS[9],
+    '楽': TEAMS[9],  # NPB 축약형
+    'オリックス': TEAMS[10],
+    'オ': TEAMS[10],  # NPB 축약형
+    '西武': TEAMS[11],
+    '西': TEAMS[11],  # NPB 축약형
+    '日本ハム': TEAMS[12],
+    '日': TEAMS[12],  # NPB 축약형
+}
+
+
+def by_id(team_id):
+    """팀 ID → 레지스트리 팀 (없으면 None)"""
+    if isinstance(team_id, int) and 0 < team_id < len(TEAMS):
+        return TEAMS[team_id]
+    return None
+
+
+_adhoc = {}
+
+
+def intern_team(team_id, abbr, name):
+    """(id, abbr, name)마다 하나뿐인 Team - 레지스트리 팀과 같으면 그 객체를 그대로 반환"""
+    team = by_id(team_id)
+    if team is not None and team.abbr == abbr and team.name == name:
+        return team
+    key = (team_id, abbr, name)
+    team = _adhoc.get(key)
+    if team is None:
+        team = _adhoc.setdefault(key, Team(team_id, abbr, name))
+    return team
+
+
+def _sql_text(value):
+    return "'" + value.replace("'", "''") + "'"
+
+
+def seed_sql():
+    """database/create_tables.sql의 teams INSERT 문 (team_id를 레지스트리 ID로 고정)"""
+    lines = ["INSERT INTO teams (team_id, team_name_jp, team_name_en, team_abbr, league, city, founded_year, stadium) VALUES"]
+    rows = []
+    for league, members in ((CENTRAL_LEAGUE, CENTRAL), (PACIFIC_LEAGUE, PACIFIC)):
+        rows.append(f"-- {league} League")
+        for team in members:
+            values = ', '.join([
+                str(team.id), _sql_text(team.name), _sql_text(team.name_en), _sql_text(team.abbr),
+                _sql_text(team.league), _sql_text(team.city), str(team.founded), _sql_text(team.stadium),
+            ])
+            rows.append(f"({values})")
+    # 마지막 행만 ';', 나머지는 ',' (주석 행 제외)
+    value_rows = [i for i, row in enumerate(rows) if not row.startswith('--')]
+    for i in value_rows:
+        rows[i] += ';' if i == value_rows[-1] else ','
+    lines.extend(rows)
+    lines.append(f"SELECT setval('teams_team_id_seq', {len(ALL_TEAMS)});")
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    if '--sql' in sys.argv[1:]:
+        print(seed_sql())
+    else:
+        for team in ALL_TEAMS:
+            print(f"{team.id:2} {team.abbr} {team.league:8} {team.name}")
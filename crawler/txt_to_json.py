@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""
+TXT → JSON 변환 (scripts/simple_txt_to_json.js와 같은 출력)
+- games_raw.txt는 games_txt.iter_entries로 한 번만 읽고, 완료 경기 중복 제거도 한 번만 해서
+  games.json / standings.json / dashboard.json이 같은 목록을 쓴다.
+- teams_raw.txt가 없으면 teams 레지스트리를 쓴다 (팀 표기 → 팀도 레지스트리의 short).
+- convert_all()은 만든 데이터를 그대로 돌려줘 파이프라인이 JSON 파일을 다시 읽지 않는다.
+JSON은 Node 버전과 같은 키 순서·숫자 표기(JSON.stringify(data, null, 2))로 쓴다.
+
+Usage:
+  python3 crawler/txt_to_json.py
+"""
+
+import json
+import logging
+import os
+import re
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import games_txt
+from teams import ALL_TEAMS
+
+logger = logging.getLogger('txt_to_json')
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+JST = timezone(timedelta(hours=9))
+
+_INT_RE = re.compile(r'^\s*([+-]?\d+)')
+_INNING_NO_RE = re.compile(r'(\d+)회')
+
+# games_raw.txt의 일본어 표기 → 팀
+LABEL_TO_TEAM = {team.short: team for team in ALL_TEAMS}
+
+
+def _parse_int(text):
+    """JS parseInt처럼 앞쪽 정수만 읽기 (없으면 None)"""
+    match = _INT_RE.match(text or '')
+    return int(match.group(1)) if match else None
+
+
+def _js_number(value):
+    """정수로 떨어지는 float은 int로 (JSON.stringify는 3.0을 3으로 씀)"""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _iso_now():
+    """new Date().toISOString() 형식 (UTC, 밀리초, 'Z')"""
+    return datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+
+def parse_teams(text):
+    """teams_raw.txt (TEAM_ID|TEAM_ABBR|TEAM_NAME|LEAGUE) → 팀 목록"""
+    teams = []
+    for line in text.split('\n'):
+        if line.startswith('#') or not line.strip():
+            continue
+        parts = line.split('|')
+        if len(parts) >= 4:
+            teams.append({
+                'team_id': _parse_int(parts[0]),
+                'team_abbreviation': parts[1],
+                'team_name': parts[2],
+                'league': parts[3],
+            })
+    return teams
+
+
+def registry_teams():
+    """teams_raw.txt가 없을 때 쓰는 레지스트리 팀 목록 (ID 순)"""
+    return [
+        {'team_id': team.id, 'team_abbreviation': team.abbr, 'team_name': team.name, 'league': team.league}
+        for team in ALL_TEAMS
+    ]
+
+
+def _pipe_record(entry):
+    parts = entry.lines[0].strip().split('|')
+    record = {
+        'game_date': parts[0],
+        'home_team_id': _parse_int(parts[1]),
+        'home_team_abbr': parts[2],
+        'home_team_name': parts[3],
+        'away_team_id': _parse_int(parts[4]),
+        'away_team_abbr': parts[5],
+        'away_team_name': parts[6],
+        'home_score': _parse_int(parts[7]),
+        'away_score': _parse_int(parts[8]),
+        'league': parts[9],
+        'game_status': parts[10],
+        'is_draw': parts[11] == '1',
+    }
+    if len(parts) >= 14:
+        record['stadium'] = parts[12] or ''
+        record['scheduled_time'] = parts[13] or ''
+    return record
+
+
+def _final_inning(entry):
+    """경기 줄 뒤 '📊 이닝별' 주석에서 마지막 'N회'"""
+    for raw in entry.lines[1:]:
+        line = raw.strip()
+        if '📊' in line and ('이닝별' in line or 'inning' in line.lower()):
+            numbers = _INNING_NO_RE.findall(line)
+            if numbers:
+                return int(numbers[-1])
+    return None
+
+
+def _game_record(entry, id_to_abbr):
+    """가독 형식 경기 항목(games_txt.TxtGame) → games.json 경기"""
+    status = entry.status
+    away_score, home_score = entry.away_score, entry.home_score
+    # [DRAW] 없는 0-0 완료 경기는 자리표시로 보고 예정 경기로 취급
+    if status == 'completed' and away_score == 0 and home_score == 0 and not entry.is_draw:
+        status = 'scheduled'
+        away_score = home_score = None
+    is_draw = entry.is_draw or (
+        status == 'completed' and away_score is not None and home_score is not None and away_score == home_score
+    )
+
+    away_info = LABEL_TO_TEAM.get(entry.away_label)
+    home_info = LABEL_TO_TEAM.get(entry.home_label)
+    away_id = entry.away_id if entry.away_id is not None else (away_info.id if away_info else None)
+    home_id = entry.home_id if entry.home_id is not None else (home_info.id if home_info else None)
+
+    record = {
+        'game_date': entry.date,
+        'home_team_id': home_id,
+        'home_team_abbr': (id_to_abbr.get(home_id) if home_id is not None else '') or (home_info.abbr if home_info else ''),
+        'home_team_name': entry.home_name or (home_info.name if home_info else entry.home_label),
+        'away_team_id': away_id,
+        'away_team_abbr': (id_to_abbr.get(away_id) if away_id is not None else '') or (away_info.abbr if away_info else ''),
+        'away_team_name': entry.away_name or (away_info.name if away_info else entry.away_label),
+        'home_score': home_score,
+        'away_score': away_score,
+        'league': entry.league,
+        'game_status': status,
+        'is_draw': is_draw,
+    }
+    if entry.info.startswith('@'):
+        venue = entry.info[1:].lstrip()
+        if venue:
+            record['stadium'] = venue
+    if status == 'completed':
+        final_inning = _final_inning(entry)
+        if final_inning is not None:
+            record['final_inning'] = final_inning
+    return record
+
+
+def parse_games(source, id_to_abbr):
+    """games_raw.txt 형식 → 경기 목록 (구 파이프 형식 줄이 하나라도 있으면 파이프 형식 경기만)"""
+    pipe_games = []
+    games = []
+    for entry in games_txt.iter_games(source):
+        if entry.pipe:
+            pipe_games.append(_pipe_record(entry))
+        else:
+            games.append(_game_record(entry, id_to_abbr))
+    return pipe_games or games
+
+
+def parse_upcoming(source, id_to_abbr, today=None):
+    """upcoming_games_raw.txt → 오늘(일본 시간) 이후 예정 경기"""
+    if today is None:
+        today = datetime.now(JST).date().isoformat()
+    return [
+        game for game in parse_games(source, id_to_abbr)
+        if game['game_status'] == 'scheduled' and (not game['game_date'] or game['game_date'] >= today)
+    ]
+
+
+def _key(*values):
+    return '|'.join('' if value is None else str(value) for value in values)
+
+
+def dedupe_games(games):
+    """날짜 + 팀 ID + 점수(+final_inning)가 같은 경기 제거 (더블헤더는 유지)"""
+    seen = {}
+    for game in games:
+        key = _key(game['game_date'], game['home_team_id'], game['away_team_id'],
+                   game['home_score'], game['away_score'], game.get('final_inning'))
+        seen.setdefault(key, game)
+    return list(seen.values())
+
+
+def dedupe_games_symmetric(games):
+    """홈/원정이 뒤바뀌어 두 번 적힌 경기 제거 (팀 ID 순으로 정렬한 키)"""
+    seen = {}
+    for game in games:
+        id_a = game['home_team_id'] or 0
+        id_b = game['away_team_id'] or 0
+        if id_a <= id_b:
+            low, high = game['home_score'], game['away_score']
+        else:
+            low, high = game['away_score'], game['home_score']
+        key = _key(game['game_date'], min(id_a, id_b), max(id_a, id_b), low, high, game.get('final_inning'))
+        seen.setdefault(key, game)
+    return list(seen.values())
+
+
+def completed_games(games):
+    """games.json·순위·대시보드가 함께 쓰는 완료 경기 (중복 제거 후)"""
+    return dedupe_games_symmetric(dedupe_games([g for g in games if g['game_status'] == 'completed']))
+
+
+def games_behind(leader, team):
+    if leader['team_id'] == team['team_id']:
+        return 0
+    return _js_number(((leader['wins'] - team['wins']) + (team['losses'] - leader['losses'])) / 2)
+
+
+def calculate_standings(teams, games):
+    """완료 경기로 리그별 순위표 계산 (승률, 같으면 승수 순)"""
+    team_stats = {}
+    for team in teams:
+        team_stats[team['team_id']] = {
+            'team_id': team['team_id'],
+            'team_abbreviation': team['team_abbreviation'],
+            'team_name': team['team_name'],
+            'league': team['league'],
+            'games_played': 0,
+            'wins': 0,
+            'losses': 0,
+            'draws': 0,
+            'runs_scored': 0,
+            'runs_allowed': 0,
+        }
+
+    for game in games:
+        if game['game_status'] != 'completed' or game['home_score'] is None or game['away_score'] is None:
+            continue
+        home = team_stats.get(game['home_team_id'])
+        away = team_stats.get(game['away_team_id'])
+        if home is None or away is None:
+            continue
+        home['games_played'] += 1
+        away['games_played'] += 1
+        home['runs_scored'] += game['home_score']
+        home['runs_allowed'] += game['away_score']
+        away['runs_scored'] += game['away_score']
+        away['runs_allowed'] += game['home_score']
+        if game['is_draw']:
+            home['draws'] += 1
+            away['draws'] += 1
+        elif game['home_score'] > game['away_score']:
+            home['wins'] += 1
+            away['losses'] += 1
+        else:
+            away['wins'] += 1
+            home['losses'] += 1
+
+    # Node 버전의 Object.values 순서 (정수 ID 오름차순, 나머지는 입력 순)
+    int_ids = sorted(k for k in team_stats if isinstance(k, int) and k >= 0)
+    ordered = [team_stats[k] for k in int_ids] + [s for k, s in team_stats.items() if k not in int_ids]
+    standings = []
+    for stats in ordered:
+        decided = stats['wins'] + stats['losses']
+        standings.append(dict(
+            stats,
+            win_percentage=_js_number(stats['wins'] / decided) if decided > 0 else 0,
+            run_differential=stats['runs_scored'] - stats['runs_allowed'],
+        ))
+
+    leagues = {}
+    for league in ('Central', 'Pacific'):
+        ranked = sorted(
+            (team for team in standings if team['league'] == league),
+            key=lambda team: (-team['win_percentage'], -team['wins']),
+        )
+        ranked = [dict(team, position_rank=rank) for rank, team in enumerate(ranked, 1)]
+        for team in ranked:
+            team['games_behind'] = games_behind(ranked[0], team)
+        leagues[league] = ranked
+
+    return {
+        'updated_at': _iso_now(),
+        'central_league': {'standings': leagues['Central']},
+        'pacific_league': {'standings': leagues['Pacific']},
+    }
+
+
+def generate_dashboard(games):
+    """대시보드 (오늘/최근 7일 경기 수, 고득점 경기 상위 5개)"""
+    now = datetime.now(timezone.utc)
+    today = now.date().isoformat()
+    week_ago = (now - timedelta(days=7)).date().isoformat()
+
+    high_scoring = []
+    for game in games:
+        home_score, away_score = game['home_score'], game['away_score']
+        high_scoring.append({
+            'game_date': game['game_date'],
+            'home_team': game['home_team_abbr'],
+            'away_team': game['away_team_abbr'],
+            'home_score': home_score,
+            'away_score': away_score,
+            'total_score': None if home_score is None or away_score is None else home_score + away_score,
+        })
+    high_scoring.sort(key=lambda game: -1 if game['total_score'] is None else game['total_score'], reverse=True)
+
+    return {
+        'generated_at': _iso_now(),
+        'season_stats': {
+            'total_games': len(games),
+            'today_games': sum(1 for game in games if game['game_date'] == today),
+            'week_games': sum(1 for game in games if game['game_date'] >= week_ago),
+        },
+        'highlights': {
+            'high_scoring_games': high_scoring[:5],
+        },
+    }
+
+
+def save_json(path, data):
+    """JSON.stringify(data, null, 2)와 같은 형식으로 원자적 저장"""
+    path = Path(path)
+    tmp = path.with_name(path.name + f".tmp{os.getpid()}")
+    try:
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(data, ensure_ascii=False, indent=2))
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.error(f"❌ Error saving {path.name}: {e}")
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        return False
+    logger.info(f"✅ {path.name} saved ({int(path.stat().st_size / 1024 + 0.5)}KB)")
+    return True
+
+
+def _read_text(path):
+    if not path.exists():
+        logger.info(f"⚠️ File not found: {path.name}")
+        return None
+    return path.read_text(encoding='utf-8')
+
+
+def convert_all(simple_dir=None, output_dir=None):
+    """data/simple/*.txt → data/*.json
+    반환: teams, games(파싱한 전체 경기), completed(중복 제거한 완료 경기), upcoming, standings,
+    dashboard, saved(저장한 필수 파일 수), success(필수 4개 모두 저장)"""
+    simple_dir = Path(simple_dir) if simple_dir else PROJECT_ROOT / 'data' / 'simple'
+    output_dir = Path(output_dir) if output_dir else PROJECT_ROOT / 'data'
+    result = {'teams': None, 'games': None, 'completed': None, 'upcoming': None,
+              'standings': None, 'dashboard': None, 'saved': 0, 'success': False}
+
+    logger.info('🔄 Starting Simple TXT to JSON conversion...')
+    logger.info(f"📁 TXT source: {simple_dir}")
+    logger.info(f"📁 JSON target: {output_dir}")
+
+    logger.info('1️⃣ Converting teams...')
+    teams_text = _read_text(simple_dir / 'teams_raw.txt')
+    teams = parse_teams(teams_text) if teams_text is not None else registry_teams()
+    id_to_abbr = {team['team_id']: team['team_abbreviation'] for team in teams if team['team_id'] is not None}
+    result['teams'] = teams
+    if save_json(output_dir / 'teams.json', teams):
+        result['saved'] += 1
+
+    logger.info('2️⃣ Converting games...')
+    games_file = simple_dir / 'games_raw.txt'
+    if games_file.exists():
+        result['games'] = parse_games(games_file, id_to_abbr)
+        result['completed'] = completed_games(result['games'])
+        if save_json(output_dir / 'games.json', result['completed']):
+            result['saved'] += 1
+    else:
+        logger.info(f"⚠️ File not found: {games_file.name}")
+
+    logger.info('2️⃣-β Converting upcoming games (optional)...')
+    upcoming_file = simple_dir / 'upcoming_games_raw.txt'
+    if upcoming_file.exists():
+        result['upcoming'] = parse_upcoming(upcoming_file, id_to_abbr)
+        save_json(output_dir / 'upcoming.json', result['upcoming'])
+
+    logger.info('3️⃣ Calculating standings...')
+    if result['games'] is not None:
+        result['standings'] = calculate_standings(teams, result['completed'])
+        if save_json(output_dir / 'standings.json', result['standings']):
+            result['saved'] += 1
+
+        logger.info('4️⃣ Generating dashboard...')
+        result['dashboard'] = generate_dashboard(result['completed'])
+        if save_json(output_dir / 'dashboard.json', result['dashboard']):
+            result['saved'] += 1
+
+    result['success'] = result['saved'] == 4
+    logger.info('📊 Conversion Summary:')
+    logger.info(f"✅ Successfully converted: {result['saved']}/4 files")
+    central = sum(1 for team in teams if team['league'] == 'Central')
+    pacific = sum(1 for team in teams if team['league'] == 'Pacific')
+    logger.info(f"📈 Teams: {len(teams)} total ({central} Central, {pacific} Pacific)")
+    if result['games'] is not None:
+        logger.info(f"⚾ Games: {len(result['games'])} games processed")
+        logger.info(f"🤝 Draws: {sum(1 for game in result['games'] if game['is_draw'])} games")
+    logger.info('🎉 All conversions completed successfully!' if result['success'] else '⚠️ Some conversions failed')
+    return result
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    raise SystemExit(0 if convert_all()['success'] else 1)
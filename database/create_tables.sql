@@ -88,19 +88,20 @@ CREATE INDEX idx_game_innings_game ON game_innings(game_id);
 INSERT INTO seasons (year, start_date, end_date, total_games)
 VALUES (2025, '2025-03-28', '2025-10-31', 143);
 
--- Insert teams data
-INSERT INTO teams (team_name_jp, team_name_en, team_abbr, league, city, founded_year, stadium) VALUES
+-- Insert teams data (generated from crawler/teams.py: python crawler/teams.py --sql)
+INSERT INTO teams (team_id, team_name_jp, team_name_en, team_abbr, league, city, founded_year, stadium) VALUES
 -- Central League
-('読売ジャイアンツ', 'Yomiuri Giants', 'YOG', 'Central', '東京', 1934, '東京ドーム'),
-('阪神タイガース', 'Hanshin Tigers', 'HAN', 'Central', '西宮', 1935, '阪神甲子園球場'),
-('中日ドラゴンズ', 'Chunichi Dragons', 'CHU', 'Central', '名古屋', 1936, 'バンテリンドーム ナゴヤ'),
-('横浜DeNAベイスターズ', 'Yokohama DeNA BayStars', 'YDB', 'Central', '横浜', 1950, '横浜スタジアム'),
-('広島東洋カープ', 'Hiroshima Toyo Carp', 'HIR', 'Central', '広島', 1950, 'MAZDA Zoom-Zoom スタジアム広島'),
-('東京ヤクルトスワローズ', 'Tokyo Yakult Swallows', 'YAK', 'Central', '東京', 1950, '明治神宮野球場'),
+(1, '読売ジャイアンツ', 'Yomiuri Giants', 'YOG', 'Central', '東京', 1934, '東京ドーム'),
+(2, '阪神タイガース', 'Hanshin Tigers', 'HAN', 'Central', '西宮', 1935, '阪神甲子園球場'),
+(3, '横浜DeNAベイスターズ', 'Yokohama DeNA BayStars', 'YDB', 'Central', '横浜', 1950, '横浜スタジアム'),
+(4, '広島東洋カープ', 'Hiroshima Toyo Carp', 'HIR', 'Central', '広島', 1950, 'MAZDA Zoom-Zoom スタジアム広島'),
+(5, '中日ドラゴンズ', 'Chunichi Dragons', 'CHU', 'Central', '名古屋', 1936, 'バンテリンドーム ナゴヤ'),
+(6, '東京ヤクルトスワローズ', 'Tokyo Yakult Swallows', 'YAK', 'Central', '東京', 1950, '明治神宮野球場'),
 -- Pacific League
-('福岡ソフトバンクホークス', 'Fukuoka SoftBank Hawks', 'SOF', 'Pacific', '福岡', 1938, '福岡PayPayドーム'),
-('千葉ロッテマリーンズ', 'Chiba Lotte Marines', 'LOT', 'Pacific', '千葉', 1950, 'ZOZOマリンスタジアム'),
-('埼玉西武ライオンズ', 'Saitama Seibu Lions', 'SEI', 'Pacific', '所沢', 1950, 'ベルーナドーム'),
-('オリックスバファローズ', 'Orix Buffaloes', 'ORI', 'Pacific', '大阪', 1936, '京セラドーム大阪'),
-('北海道日本ハムファイターズ', 'Hokkaido Nippon-Ham Fighters', 'NIP', 'Pacific', '札幌', 1946, 'エスコンフィールドHOKKAIDO'),
-('東北楽天ゴールデンイーグルス', 'Tohoku Rakuten Golden Eagles', 'RAK', 'Pacific', '仙台', 2005, '楽天モバイルパーク宮城');
\ No newline at end of file
+(7, '福岡ソフトバンクホークス', 'Fukuoka SoftBank Hawks', 'SOF', 'Pacific', '福岡', 1938, '福岡PayPayドーム'),
+(8, '千葉ロッテマリーンズ', 'Chiba Lotte Marines', 'LOT', 'Pacific', '千葉', 1950, 'ZOZOマリンスタジアム'),
+(9, '東北楽天ゴールデンイーグルス', 'Tohoku Rakuten Golden Eagles', 'RAK', 'Pacific', '仙台', 2005, '楽天モバイルパーク宮城'),
+(10, 'オリックスバファローズ', 'Orix Buffaloes', 'ORI', 'Pacific', '大阪', 1936, '京セラドーム大阪'),
+(11, '埼玉西武ライオンズ', 'Saitama Seibu Lions', 'SEI', 'Pacific', '所沢', 1950, 'ベルーナドーム'),
+(12, '北海道日本ハムファイターズ', 'Hokkaido Nippon-Ham Fighters', 'NIP', 'Pacific', '札幌', 1946, 'エスコンフィールドHOKKAIDO');
+SELECT setval('teams_team_id_seq', 12);
\ No newline at end of file
@@ -3,6 +3,16 @@
 NPB 2025 정확한 분석 - 공식 규칙에 따른 데이터 검증
 """
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / 'crawler'))
+from games_index import GamesIndex, index_file_for  # noqa: E402
+from games_txt import iter_games_between  # noqa: E402
+from team_resolver import default_resolver  # noqa: E402
+from teams import ALL_TEAMS, BY_ABBR, CENTRAL, PACIFIC  # noqa: E402
+
+
 def analyze_npb_2025_properly():
     games_file = "data/simple/games_raw.txt"
     
@@ -16,11 +26,10 @@ def analyze_npb_2025_properly():
     print("   • 총 교류전 경기 수: 108경기")
     print()
     
-    # 팀별 통계 초기화
+    # 팀별 통계 초기화 (레지스트리 Team이 키)
     team_stats = {}
-    teams = ['CHU', 'HAN', 'HIR', 'LOT', 'NIP', 'ORI', 'RAK', 'SEI', 'SOF', 'YAK', 'YDB', 'YOG']
     
-    for team in teams:
+    for team in ALL_TEAMS:
         team_stats[team] = {
             'total_games': 0,
             'league_games': 0,
@@ -30,39 +39,32 @@ def analyze_npb_2025_properly():
             'draws': 0,
             'runs_for': 0,
             'runs_against': 0,
-            'league': 'Central' if team in ['CHU', 'HAN', 'HIR', 'YAK', 'YDB', 'YOG'] else 'Pacific'
+            'league': team.league
         }
     
-    central_teams = ['CHU', 'HAN', 'HIR', 'YAK', 'YDB', 'YOG']
-    pacific_teams = ['LOT', 'NIP', 'ORI', 'RAK', 'SEI', 'SOF']
+    central_teams = sorted(CENTRAL, key=lambda team: team.abbr)
+    pacific_teams = sorted(PACIFIC, key=lambda team: team.abbr)
     
     total_games = 0
     league_games_count = 0
     inter_games_count = 0
     may_june_games = 0  # 5-6월 경기 수
     
-    with open(games_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-                
-            parts = line.split('|')
-            if len(parts) < 12:
+    # 날짜 인덱스로 9월 2일까지의 블록만 읽어 팀 약어까지 해석 (점수 없는 예정/연기 경기는 제외)
+    with GamesIndex(games_file, index_file_for(games_file, "data/cache")) as index:
+        for game in iter_games_between(index, end="2025-09-02", resolver=default_resolver()):
+            if game.home_score is None or game.away_score is None:
                 continue
             
-            # 9월 2일까지만 계산
-            game_date = parts[0]
-            if game_date > "2025-09-02":
-                continue
+            game_date = game.date
                 
             total_games += 1
             
-            home_team = parts[2]
-            away_team = parts[5]
-            home_score = int(parts[7])
-            away_score = int(parts[8])
-            is_draw = int(parts[11])
+            home_team = BY_ABBR.get(game.home_abbr)
+            away_team = BY_ABBR.get(game.away_abbr)
+            home_score = game.home_score
+            away_score = game.away_score
+            is_draw = game.is_draw
             
             # 5-6월 경기인지 확인
             month = int(game_date.split('-')[1])
@@ -71,8 +73,7 @@ def analyze_npb_2025_properly():
             
             # 인터리그 vs 리그내 경기 판단
             is_inter_league = False
-            if (home_team in central_teams and away_team in pacific_teams) or \
-               (home_team in pacific_teams and away_team in central_teams):
+            if home_team is not None and away_team is not None and home_team.league != away_team.league:
                 is_inter_league = True
                 inter_games_count += 1
             else:
@@ -91,7 +92,7 @@ def analyze_npb_2025_properly():
                     team_stats[team]['league_games'] += 1
                 
                 # 승패무 및 득실점 계산
-                if team == home_team:
+                if team is home_team:
                     opponent_score = away_score
                     team_score = home_score
                 else:
@@ -150,9 +151,9 @@ def analyze_npb_2025_properly():
     
     central_match_count = 0
     for team in central_teams:
-        if team in team_stats and team in official_central:
+        if team in team_stats and team.abbr in official_central:
             stats = team_stats[team]
-            official = official_central[team]
+            official = official_central[team.abbr]
             
             total_diff = stats['total_games'] - official['total']
             win_diff = stats['wins'] - official['wins']
@@ -163,7 +164,7 @@ def analyze_npb_2025_properly():
             if status == "✅":
                 central_match_count += 1
             
-            print(f"{team:5} | {stats['total_games']:6} | {official['total']:4} | {total_diff:+3} | {stats['wins']:3} | {official['wins']:4} | {stats['losses']:3} | {official['losses']:4} | {stats['draws']:3} | {official['draws']:4} | {status}")
+            print(f"{team.abbr:5} | {stats['total_games']:6} | {official['total']:4} | {total_diff:+3} | {stats['wins']:3} | {official['wins']:4} | {stats['losses']:3} | {official['losses']:4} | {stats['draws']:3} | {official['draws']:4} | {status}")
     
     print()
     print("🏆 Pacific League 분석:")
@@ -172,9 +173,9 @@ def analyze_npb_2025_properly():
     
     pacific_match_count = 0
     for team in pacific_teams:
-        if team in team_stats and team in official_pacific:
+        if team in team_stats and team.abbr in official_pacific:
             stats = team_stats[team]
-            official = official_pacific[team]
+            official = official_pacific[team.abbr]
             
             total_diff = stats['total_games'] - official['total']
             win_diff = stats['wins'] - official['wins']
@@ -185,7 +186,7 @@ def analyze_npb_2025_properly():
             if status == "✅":
                 pacific_match_count += 1
             
-            print(f"{team:5} | {stats['total_games']:6} | {official['total']:4} | {total_diff:+3} | {stats['wins']:3} | {official['wins']:4} | {stats['losses']:3} | {official['losses']:4} | {stats['draws']:3} | {official['draws']:4} | {status}")
+            print(f"{team.abbr:5} | {stats['total_games']:6} | {official['total']:4} | {total_diff:+3} | {stats['wins']:3} | {official['wins']:4} | {stats['losses']:3} | {official['losses']:4} | {stats['draws']:3} | {official['draws']:4} | {status}")
     
     print()
     print("🎯 최종 평가:")
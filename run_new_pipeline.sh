@@ -1,10 +1,10 @@
 #!/bin/bash
 
 # NPB 완전 새로운 Pipeline 실행 스크립트
-# 신규 파이프라인: 웹 크롤링 → TXT → JavaScript → JSON
+# 신규 파이프라인: 웹 크롤링 → TXT → JSON (한 프로세스)
 
 echo "🚀 Starting NPB NEW Pipeline"
-echo "🔄 Flow: Web Crawling → TXT → JavaScript → JSON"
+echo "🔄 Flow: Web Crawling → TXT → JSON"
 echo ""
 
 # 기본값: 7일
@@ -19,12 +19,16 @@ if [ "$1" = "--help" ] || [ "$1" = "-h" ]; then
     echo "  --test         테스트 모드 (3일)"
     echo "  --quick        빠른 모드 (1일)"
     echo "  --skip-crawl   크롤링 건너뛰고 변환만 수행"
+    echo "  --workers N    N개 워커로 날짜 병렬 크롤링"
+    echo "  --force        games_raw.txt에서 확정된 날짜도 다시 크롤링"
+    echo "  --resume       중단된 크롤을 저널(data/cache/crawl_journal.jsonl)에서 이어받기"
     echo ""
     echo "예시:"
     echo "  $0                # 기본 7일"
     echo "  $0 14             # 14일"
     echo "  $0 --full-season  # 전체 시즌"
     echo "  $0 --test         # 테스트 모드"
+    echo "  $0 --full-season --workers 6  # 전체 시즌 병렬 크롤링"
     exit 0
 fi
 
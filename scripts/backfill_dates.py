@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """
 Backfill specific dates by calling SimpleCrawler.crawl_date and merging into TXT.
+All dates are merged in a single pass at the end (only their date blocks are rewritten).
 Usage:
   python3 scripts/backfill_dates.py 2025-03-28 2025-03-29 ...
 """
@@ -13,30 +14,41 @@ from pathlib import Path
 ROOT = Path(__file__).parent.parent
 
 def load_crawler():
-    spec = spec_from_file_location('simple_crawler', str(ROOT / 'crawler' / 'simple_crawler.py'))
+    # crawler_core는 crawler/ 디렉토리의 형제 모듈(http_client 등)을 import 함
+    crawler_dir = str(ROOT / 'crawler')
+    if crawler_dir not in sys.path:
+        sys.path.insert(0, crawler_dir)
+    spec = spec_from_file_location('crawler_core', str(ROOT / 'crawler' / 'crawler_core.py'))
     mod = module_from_spec(spec)
     assert spec.loader is not None
     spec.loader.exec_module(mod)
     return mod.SimpleCrawler()
 
 def main(argv):
-    if not argv:
+    if not argv or '--help' in argv or '-h' in argv:
         print('Usage: python3 scripts/backfill_dates.py YYYY-MM-DD [YYYY-MM-DD ...]')
-        return 1
-    sc = load_crawler()
-    total = 0
+        return 0 if argv else 1
+    # 날짜부터 검증하고, 크롤할 날짜가 있을 때만 크롤러를 로드
+    dates = []
     for d in argv:
         try:
-            dt = datetime.strptime(d, '%Y-%m-%d')
+            dates.append((d, datetime.strptime(d, '%Y-%m-%d')))
         except ValueError:
             print(f'Invalid date: {d}')
-            continue
+    if not dates:
+        print('Total backfilled: 0')
+        return 0
+    sc = load_crawler()
+    backfilled = []
+    for d, dt in dates:
         games = sc.crawl_date(dt)
         print(f'{d}: {len(games)} games')
-        if games:
-            sc.save_games_to_txt(games)
-            total += len(games)
-    print(f'Total backfilled: {total}')
+        backfilled.extend(games)
+    if backfilled:
+        sc.save_games_to_txt(backfilled)
+    print(f'Total backfilled: {len(backfilled)}')
+    sc.log_network_summary()
+    sc.close()
     return 0
 
 if __name__ == '__main__':
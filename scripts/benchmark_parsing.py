@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+"""
+파싱 경로 마이크로 벤치마크 (네트워크 없음)
+data/simple/games_raw.txt 한 시즌 분량을 입력으로 기존 구현과 새 구현을 비교한다.
+닛칸스포츠 테이블 파싱은 data/raw/html 아카이브가 있으면 그 페이지를, 없으면
+games_raw.txt로 만든 같은 구조의 페이지를 사용한다.
+스트레이너 비교는 합성 페이지에 헤더/사이드바/푸터 레이아웃을 씌워 페이지 전체 파싱 시간과 남는 트리 메모리를 잰다.
+
+경기 레코드 메모리는 한 시즌을 연도만 바꿔 여러 시즌으로 늘려 dict와 Game(__slots__)을 비교한다.
+
+Usage:
+  python3 scripts/benchmark_parsing.py [--repeat N] [--seasons N]
+"""
+
+import logging
+import re
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+RAW = ROOT / 'data' / 'simple' / 'games_raw.txt'
+ARCHIVE = ROOT / 'data' / 'raw' / 'html'
+sys.path.insert(0, str(ROOT / 'crawler'))
+
+from team_resolver import TeamResolver  # noqa: E402
+from teams import ALIASES  # noqa: E402
+
+GAME_LINE_RE = re.compile(r'^(.+?)\s+(?:\d+-\d+|vs)\s+(.+?)\s+\(')
+SCORE_LINE_RE = re.compile(r'^(.+?)\s+(?:(\d+)-(\d+)|vs)\s+(.+?)\s+\(')
+
+
+def timed(func, repeat):
+    """repeat회 실행 중 가장 빠른 시간(초)과 마지막 결과"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def season_team_labels():
+    """한 시즌의 팀 표기: TXT 라벨 + 닛칸스포츠식 정식 명칭 + 캘린더식 한 글자 표기"""
+    labels = []
+    short_by_id = {}
+    for alias, team in ALIASES.items():
+        if len(alias) == 1:
+            short_by_id.setdefault(team.id, alias)
+    with open(RAW, 'r', encoding='utf-8') as f:
+        for line in f:
+            match = GAME_LINE_RE.match(line.strip()) if not line.startswith('#') else None
+            if not match:
+                continue
+            for label in match.groups():
+                labels.append(label)
+                team = ALIASES.get(label)
+                if team:
+                    labels.append(team.name)
+                    labels.append(short_by_id.get(team.id, label))
+    return labels
+
+
+def linear_scan(teams, team_name):
+    """기존 SimpleCrawler.get_team_info (dict 순서대로 부분 문자열 검사)"""
+    for key, info in teams.items():
+        if key in team_name:
+            return info
+    return None
+
+
+def bench_team_resolution(repeat):
+    labels = season_team_labels()
+    teams = dict(ALIASES)
+
+    old_time, old_results = timed(lambda: [linear_scan(teams, label) for label in labels], repeat)
+
+    def resolve_all():
+        # 실행마다 새 인스턴스 (메모 효과는 실행 내부에서만)
+        resolver = TeamResolver(teams)
+        return [resolver.resolve(label) for label in labels]
+
+    new_time, new_results = timed(resolve_all, repeat)
+
+    diffs = sorted({
+        (label, getattr(old, 'abbr', None), getattr(new, 'abbr', None))
+        for label, old, new in zip(labels, old_results, new_results)
+        if old is not new
+    })
+    print(f"🏷️  Team resolution: {len(labels)} labels")
+    print(f"   linear scan : {old_time * 1000:8.2f} ms ({old_time / len(labels) * 1e6:.2f} µs/label)")
+    print(f"   resolver    : {new_time * 1000:8.2f} ms ({new_time / len(labels) * 1e6:.2f} µs/label)"
+          f"  x{old_time / new_time:.1f}")
+    if diffs:
+        print(f"   ⚠️ {len(diffs)} labels resolve differently (label, linear, resolver):")
+        for diff in diffs:
+            print(f"     {diff}")
+    else:
+        print("   ✅ identical results")
+
+
+def legacy_convert_jp_number(text):
+    """기존 parse_nikkansports_page 내부 함수 (테이블마다 재정의, 호출마다 maketrans)"""
+    if text is None:
+        return None
+    trans = str.maketrans('０１２３４５６７８９', '0123456789')
+    t = text.translate(trans)
+    t = t.replace('\u2014', '-').replace('\u2013', '-').replace('－', '-').replace('—', '-').strip()
+    if not any(ch.isdigit() for ch in t):
+        return None
+    cleaned = ''.join(ch for ch in t if ch.isdigit())
+    if cleaned == '':
+        return None
+    try:
+        return int(cleaned)
+    except Exception:
+        return None
+
+
+def legacy_parse_inning_cell(raw_text):
+    """기존 extract_detailed_game_info 내부 함수 (칸마다 maketrans)"""
+    t = raw_text.translate(str.maketrans('０１２３４５６７８９', '0123456789'))
+    t = t.replace('\u2014', '-').replace('－', '-').replace('—', '-')
+    t = t.replace('Ｘ', 'X').replace('ｘ', 'X').replace('x', 'X').strip()
+    digits = ''.join(ch for ch in t if ch.isdigit())
+    if digits:
+        return int(digits)
+    if 'X' in t:
+        return None
+    return 0
+
+
+def legacy_table_walks(table):
+    """기존 상태/완료/무승부 판정이 테이블마다 하던 BeautifulSoup 탐색"""
+    header = table.find_previous_sibling('h5')
+    header_text = header.get_text() if header else ''
+    status_texts = [e.get_text(strip=True) for e in table.find_all(['td', 'th'], class_=['status', 'inning', 'gameStatus'])]
+    rows = table.find_all('tr')
+    cells = [[c.get_text(strip=True) for c in row.find_all(['th', 'td'])] for row in rows[:3]]
+    # determine_completion_status, 무승부 키워드 확인에서 각각 전체 텍스트
+    return header_text, status_texts, cells, table.get_text(' ', strip=True), table.get_text(' ', strip=True)
+
+
+def legacy_parent_scans(table, is_stadium_text):
+    """기존 extract_detailed_game_info가 완료 경기마다 하던 부모 컨테이너 재탐색 두 번"""
+    parent = table.find_parent()
+    stadiums = parent.find_all(string=is_stadium_text)
+    infos = [e.get_text() for e in parent.find_all(['p', 'div'], class_=['game-info', 'match-info'])]
+    return stadiums[:1], infos
+
+
+def split_runs(runs, innings=9):
+    """총점을 이닝별 득점으로 나눔 (재현 가능한 분포)"""
+    cells = [0] * innings
+    for i in range(runs):
+        cells[(i * 5 + runs) % innings] += 1
+    return cells
+
+
+def synthetic_season_pages():
+    """games_raw.txt의 날짜별 경기로 닛칸스포츠 스코어 페이지 구조를 재현"""
+    days = defaultdict(list)
+    current = None
+    with open(RAW, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith('# 20'):
+                current = line[2:12]
+                continue
+            match = SCORE_LINE_RE.match(line) if current and not line.startswith('#') else None
+            if match:
+                days[current].append(match.groups())
+    pages = []
+    for date_str, games in sorted(days.items()):
+        parts = ['<html><head><meta charset="utf-8"></head><body><div id="main">']
+        for index, (away, away_runs, home_runs, home) in enumerate(games):
+            if away_runs is None:
+                parts.append(
+                    '<h5>[試合中止]</h5><table class="scoreTable"><tr><th>チーム</th><th>R</th></tr>'
+                    f'<tr><td class="team">{away}</td><td class="totalScore">中止</td></tr>'
+                    f'<tr><td class="team">{home}</td><td class="totalScore">中止</td></tr></table>')
+                continue
+            away_cells = split_runs(int(away_runs))
+            home_cells = split_runs(int(home_runs))
+            if int(home_runs) > int(away_runs) and home_cells[-1] == 0:
+                home_cells[-1] = 'X'
+            header = '<tr><th>チーム</th>' + ''.join(f'<th>{i}</th>' for i in range(1, 10)) + '<th>R</th><th>H</th><th>E</th></tr>'
+
+            def row(team, cells, runs):
+                # 일부 페이지는 전각 숫자로 점수를 표기
+                total = runs.translate(str.maketrans('0123456789', '０１２３４５６７８９')) if index % 3 == 0 else runs
+                return (f'<tr><td class="team">{team}</td>' + ''.join(f'<td>{c}</td>' for c in cells)
+                        + f'<td class="totalScore">{total}</td><td>8</td><td>1</td></tr>')
+
+            parts.append(f'<h5>[試合終了]</h5><table class="scoreTable">{header}'
+                         f'{row(away, away_cells, away_runs)}{row(home, home_cells, home_runs)}</table>')
+            parts.append('<p class="game-info">東京ドーム 観客 41,234人 2時間55分 晴 22度</p>')
+        parts.append('</div></body></html>')
+        pages.append((datetime.strptime(date_str, '%Y-%m-%d'), ''.join(parts).encode('utf-8')))
+    return pages
+
+
+def season_pages():
+    """(date, html bytes, 출처) - 아카이브 우선"""
+    from html_archive import HtmlArchive
+    archived = HtmlArchive(ARCHIVE).iter_pages('nikkansports')
+    if archived:
+        return [(d, HtmlArchive.read(path)) for d, path in archived], f"archive ({ARCHIVE})"
+    return synthetic_season_pages(), f"synthetic from {RAW.name}"
+
+
+def layout_chrome():
+    """실제 스코어 페이지처럼 본문을 감싸는 레이아웃 (헤더 내비게이션, 뉴스 사이드바, 순위표, 푸터)"""
+    nav = ''.join(f'<li class="gnav-item"><a href="/section/{i}/">セクション{i}</a></li>' for i in range(120))
+    news = ''.join(
+        f'<div class="news-item"><a href="/news/{i}.html"><img src="/img/{i}.jpg" alt="">'
+        f'<span class="news-title">ニュース見出し {i}</span><span class="news-date">4月{i % 30 + 1}日</span></a></div>'
+        for i in range(60))
+    standings = ''.join(f'<tr><td>{i}</td><td>チーム{i}</td><td>{20 - i}</td><td>{i}</td></tr>' for i in range(1, 13))
+    footer = ''.join(f'<li><a href="/site/{i}/">リンク{i}</a></li>' for i in range(80))
+    head = (f'<div class="l-wrapper"><header class="l-header"><div class="gnav"><ul>{nav}</ul></div></header>'
+            f'<div class="l-contents"><div class="l-main">')
+    tail = (f'</div><div class="l-side"><div class="ranking"><table>{standings}</table></div>'
+            f'<div class="news-list">{news}</div></div></div>'
+            f'<footer class="l-footer"><ul>{footer}</ul><p class="copyright">(C) Nikkan Sports</p></footer></div>')
+    return head, tail
+
+
+def bench_strainers(repeat):
+    """닛칸스포츠 페이지 파싱: 스트레이너 없음 / div 전체 유지 / 경기 블록 div만 유지"""
+    try:
+        from bs4 import BeautifulSoup, SoupStrainer
+        from html_parsing import STRAINERS, declared_charset
+        from crawler_core import SimpleCrawler
+    except ImportError as e:
+        print(f"⏭️  Strainer comparison skipped: {e}")
+        return
+    crawler = SimpleCrawler()
+    if crawler.parser is None:
+        print("⏭️  Strainer comparison skipped: crawling dependencies are missing")
+        return
+    crawler.logger.setLevel(logging.WARNING)
+
+    pages, origin = season_pages()
+    if origin.startswith('synthetic'):
+        # 합성 페이지는 경기 블록뿐이라 레이아웃을 씌워 실제 페이지 크기에 가깝게 만든다
+        head, tail = layout_chrome()
+        pages = [(d, content.replace(b'<body>', b'<body>' + head.encode('utf-8'), 1)
+                  .replace(b'</body>', tail.encode('utf-8') + b'</body>', 1)) for d, content in pages]
+        origin += ' + page layout'
+    encodings = [declared_charset(content) for _, content in pages]
+    size = sum(len(content) for _, content in pages)
+    print(f"🧹 Nikkansports strainers: {len(pages)} pages, {size / len(pages) / 1024:.1f} KB/page ({origin}, {crawler.parser.backend})")
+
+    baseline = None
+    for label, strainer in (
+        ('no strainer   ', None),
+        ('all divs      ', SoupStrainer(['div', 'h5', 'table', 'p'])),
+        ('game-block div', STRAINERS['nikkansports']),
+    ):
+        def parse_all():
+            return [BeautifulSoup(content, crawler.parser.backend, parse_only=strainer, from_encoding=charset)
+                    for (_, content), charset in zip(pages, encodings)]
+
+        parse_time, soups = timed(parse_all, repeat)
+        kept, _ = retained_bytes(parse_all)
+        nodes = sum(1 for soup in soups for _ in soup.descendants)
+        games = [game.to_dict() for (d, _), soup in zip(pages, soups) for game in crawler.parse_nikkansports_page(soup, d)]
+        if baseline is None:
+            baseline = (parse_time, kept, games)
+            gain = ''
+        else:
+            same = '✅ same games' if games == baseline[2] else '⚠️ games differ'
+            gain = f"  time x{parse_time / baseline[0]:.2f}, memory x{kept / baseline[1]:.2f}  {same}"
+        print(f"   {label}: {parse_time / len(pages) * 1000:6.2f} ms/page  {kept / len(pages) / 1024:7.1f} KB/page"
+              f"  {nodes / len(pages):7.0f} nodes/page{gain}")
+
+
+def bench_table_parsing(repeat):
+    try:
+        from crawler_core import SimpleCrawler
+    except ImportError as e:
+        print(f"⏭️  Table parsing skipped: {e}")
+        return
+    crawler = SimpleCrawler()
+    if crawler.parser is None:
+        print("⏭️  Table parsing skipped: crawling dependencies are missing")
+        return
+    crawler.logger.setLevel(logging.WARNING)
+
+    pages, origin = season_pages()
+    # HTML → soup 변환은 제외하고 테이블 파싱만 측정
+    soups = [(d, crawler.parser.parse(content, 'nikkansports')) for d, content in pages]
+    tables = [t for _, soup in soups for t in soup.find_all('table', class_='scoreTable')]
+    if not tables:
+        print("⏭️  Table parsing skipped: no scoreTable")
+        return
+
+    page_time, games = timed(lambda: [g for d, soup in soups for g in crawler.parse_nikkansports_page(soup, d)], repeat)
+    print(f"🧮 Nikkansports tables: {len(tables)} tables / {len(pages)} pages ({origin})")
+    print(f"   parse_nikkansports_page : {page_time * 1000:8.2f} ms ({page_time / len(tables) * 1e6:.1f} µs/table, {len(games)} games)")
+
+    try:
+        import parsing_primitives as pp
+    except ImportError:
+        return
+    try:
+        from score_table import PageInfoIndex, ScoreTableView, detect_completion, detect_game_status, has_draw_keyword
+    except ImportError:
+        ScoreTableView = None
+    if ScoreTableView is not None:
+        old_time, _ = timed(lambda: [legacy_table_walks(t) for t in tables], repeat)
+        new_time, views = timed(lambda: [ScoreTableView.from_table(t) for t in tables], repeat)
+
+        def detect_all():
+            for view in views:
+                info = detect_game_status(view)
+                detect_completion(view, info)
+                has_draw_keyword(view)
+
+        detect_time, _ = timed(detect_all, repeat)
+        print(f"   table text   : repeated get_text {old_time / len(tables) * 1e6:.1f} µs/table"
+              f" → ScoreTableView {new_time / len(tables) * 1e6:.1f} µs/table")
+        print(f"   detectors    : {detect_time / len(tables) * 1e6:.2f} µs/table (status + completion + draw over a view)")
+
+        page_tables = [soup.find_all('table', class_='scoreTable') for _, soup in soups]
+        old_time, _ = timed(lambda: [legacy_parent_scans(t, pp.is_stadium_text) for t in tables], repeat)
+
+        def index_all():
+            for group in page_tables:
+                index = PageInfoIndex(group)
+                for table in group:
+                    index.lookup(table)
+
+        new_time, _ = timed(index_all, repeat)
+        print(f"   stadium/info : parent rescans {old_time / len(tables) * 1e6:.1f} µs/table"
+              f" → PageInfoIndex {new_time / len(tables) * 1e6:.1f} µs/table")
+    score_texts = []
+    inning_texts = []
+    for table in tables:
+        for row in table.find_all('tr')[1:3]:
+            for cell in row.find_all('td'):
+                text = cell.get_text(strip=True)
+                (score_texts if 'totalScore' in (cell.get('class') or []) else inning_texts).append(text)
+
+    for label, texts, old, new in (
+        ('score cells ', score_texts, legacy_convert_jp_number, pp.convert_jp_number),
+        ('inning cells', inning_texts, legacy_parse_inning_cell, pp.parse_inning_cell),
+    ):
+        old_time, old_results = timed(lambda: [old(t) for t in texts], repeat)
+        new_time, new_results = timed(lambda: [new(t) for t in texts], repeat)
+        same = '✅' if old_results == new_results else '⚠️ differs'
+        print(f"   {label}: {len(texts)} cells  inline {old_time * 1000:.2f} ms → primitives {new_time * 1000:.2f} ms"
+              f"  x{old_time / new_time:.1f} {same}")
+
+
+def season_game_rows():
+    """games_raw.txt 한 시즌 → Game 생성 인자 (date, home, away, 점수, 리그, 상태, 무승부, 이닝, 구장)"""
+    from games_txt import iter_games
+    from team_resolver import default_resolver
+
+    resolver = default_resolver()
+    rows = []
+    for game in iter_games(RAW, resolver):
+        if game.home_id is None or game.away_id is None:
+            continue
+        home = resolver.by_id(game.home_id)
+        away = resolver.by_id(game.away_id)
+        if home is None or away is None:
+            continue
+        stadium = game.info[2:].split(' ⏱️')[0] if game.info.startswith('@ ') else None
+        rows.append((game.date, home, away, game.home_score, game.away_score, game.league,
+                     game.status, game.is_draw, game.innings_away, game.innings_home, stadium))
+    return rows
+
+
+def retained_bytes(build):
+    """build()가 반환한 객체가 붙잡고 있는 메모리 (tracemalloc)"""
+    tracemalloc.start()
+    records = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, len(records)
+
+
+def bench_game_memory(seasons):
+    from game_record import Game
+
+    rows = season_game_rows()
+    if not rows:
+        print("⏭️  Game record memory skipped: no games")
+        return
+
+    def games():
+        # 시즌마다 날짜 문자열은 새로 만든다 (크롤러의 strftime과 같은 조건)
+        return [Game(f"{int(date[:4]) - season}{date[4:]}", home, away, hs, as_, league, status, draw, ia, ih,
+                     stadium=stadium, final_inning=len(ih) if ih else None)
+                for season in range(seasons)
+                for date, home, away, hs, as_, league, status, draw, ia, ih, stadium in rows]
+
+    def dicts():
+        # 기존 크롤러 경기 dict와 같은 키 (Game.to_dict는 이닝 목록을 새로 만든다)
+        return [game.to_dict() for game in games()]
+
+    dict_bytes, count = retained_bytes(dicts)
+    game_bytes, _ = retained_bytes(games)
+    print(f"🧠 Game records: {count} games ({seasons} seasons of {len(rows)})")
+    print(f"   dict (32 keys)  : {dict_bytes / 1e6:8.2f} MB ({dict_bytes / count:.0f} B/game)")
+    print(f"   Game (__slots__): {game_bytes / 1e6:8.2f} MB ({game_bytes / count:.0f} B/game)  x{dict_bytes / game_bytes:.1f} smaller")
+
+
+def main(argv):
+    repeat = 5
+    seasons = 5
+    if '--repeat' in argv:
+        repeat = max(1, int(argv[argv.index('--repeat') + 1]))
+    if '--seasons' in argv:
+        seasons = max(1, int(argv[argv.index('--seasons') + 1]))
+    if not RAW.exists():
+        print(f"❌ {RAW} not found")
+        return 1
+    bench_team_resolution(repeat)
+    bench_strainers(repeat)
+    bench_table_parsing(repeat)
+    bench_game_memory(seasons)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+크롤 저널(--resume) 점검 (네트워크 없음)
+임시 디렉토리의 저널로 강제 종료 상황을 흉내 내, 이어받은 뒤 기록한 날짜가 빠지지 않는지 확인한다.
+- 마지막 줄이 쓰다 만 채로 끝난 저널에 새 날짜 추가 (잘린 줄만 버리고 새 날짜는 남아야 함)
+- 개행으로 끝나는 정상 저널, 잘린 줄 하나뿐인 저널, 없는 저널에 추가
+
+Usage:
+  python3 scripts/check_crawl_journal.py
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / 'crawler'))
+
+GAME = {'away_team': 'YAK', 'home_team': 'YOG', 'away_score': 3, 'home_score': 4}
+
+# (이름, 미리 써 둘 내용, 이어받은 뒤 추가할 날짜, load()가 돌려줘야 할 날짜)
+CASES = (
+    ('partial last line', '{"date": "2025-04-01", "games": []}\n{"date": "2025-04-02", "ga',
+     ('2025-04-03',), ('2025-04-01', '2025-04-03')),
+    ('complete last line', '{"date": "2025-04-01", "games": []}\n',
+     ('2025-04-03',), ('2025-04-01', '2025-04-03')),
+    ('only a partial line', '{"date": "2025-04-01", "ga',
+     ('2025-04-03', '2025-04-04'), ('2025-04-03', '2025-04-04')),
+    ('no journal yet', None,
+     ('2025-04-03',), ('2025-04-03',)),
+)
+
+
+def check_case(journal_cls, workdir, name, initial, appends, expected):
+    path = Path(workdir) / f"{name.replace(' ', '_')}.jsonl"
+    if initial is not None:
+        path.write_text(initial, encoding='utf-8')
+    # 재시작한 프로세스처럼 새 인스턴스로 이어 쓴다
+    journal = journal_cls(path)
+    for date_str in appends:
+        journal.append(date_str, [GAME])
+    loaded = journal_cls(path).load()
+    failures = []
+    if sorted(loaded) != list(expected):
+        failures.append(f"{name}: load() returned {sorted(loaded)}, expected {list(expected)}")
+    for date_str in appends:
+        if date_str in loaded and loaded[date_str] != [GAME]:
+            failures.append(f"{name}: {date_str} games changed: {loaded[date_str]}")
+    if not path.read_text(encoding='utf-8').endswith('\n'):
+        failures.append(f"{name}: journal does not end with a newline")
+    mark = '❌' if failures else '✅'
+    print(f"   {mark} {name}: {len(loaded)} dates after resume")
+    return failures
+
+
+def main(argv):
+    from crawl_journal import CrawlJournal
+
+    print("📓 Crawl journal resume check")
+    failures = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, initial, appends, expected in CASES:
+            failures += check_case(CrawlJournal, workdir, name, initial, appends, expected)
+
+    if failures:
+        print(f"❌ {len(failures)} crawl journal check(s) failed:")
+        for failure in failures:
+            print(f"   {failure}")
+        return 1
+    print("✅ Crawl journal checks passed")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
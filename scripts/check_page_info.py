@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+닛칸스포츠 경기별 구장/경기 정보 점검 (네트워크 없음)
+여러 경기가 있는 스코어 페이지를 운영 경로 그대로(SimpleCrawler.parse_html + 'nikkansports' 스트레이너)
+파싱해, 경기마다 자기 구장·경기 시간·관중·날씨·기온을 받는지 확인한다.
+- 경기별 div 컨테이너가 있는 페이지 (스트레이너가 컨테이너를 지우면 다른 경기의 구장/정보를 읽음)
+- 모든 경기를 div 하나가 감싼 페이지 (그 div를 통째로 훑으면 모든 경기가 첫 구장을 받음)
+- 컨테이너 없이 테이블이 나란히 있는 페이지 (PageInfoIndex의 테이블 사이 구간 폴백)
+  구장/정보가 테이블 뒤에 오는 배치와, 구장이 테이블 앞에 오는 배치(앞 경기 구장을 받으면 실패)
+
+Usage:
+  python3 scripts/check_page_info.py
+"""
+
+import logging
+import sys
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / 'crawler'))
+
+# (원정, 홈, 구장, 정보 문단, 기대값: game_duration, attendance, weather, temperature)
+GAMES = (
+    ('ヤクルト', '巨人', '東京ドーム', '観客 41,234人 2時間55分 晴 22度', ('2:55', 41234, '晴れ', 22)),
+    ('阪神', '広島', 'MAZDA Zoom-Zoom スタジアム広島', '観客 30,112人 3時間05分 雨 18度', ('3:05', 30112, '雨', 18)),
+    ('楽天', 'オリックス', '京セラドーム大阪', '観客 25,004人 2時間41分 曇 20度', ('2:41', 25004, '曇り', 20)),
+)
+
+
+def game_html(away, home, stadium, info, stadium_first=False):
+    header = '<tr><th>チーム</th>' + ''.join(f'<th>{i}</th>' for i in range(1, 10)) + '<th>R</th><th>H</th><th>E</th></tr>'
+
+    def row(team, runs):
+        return (f'<tr><td class="team">{team}</td>' + '<td>0</td>' * 8
+                + f'<td>{runs}</td><td class="totalScore">{runs}</td><td>8</td><td>0</td></tr>')
+
+    table = f'<h5>[試合終了]</h5><table class="scoreTable">{header}{row(away, 1)}{row(home, 2)}</table>'
+    if stadium_first:
+        return f'<p class="stadium">{stadium}</p>{table}<p class="game-info">{info}</p>'
+    return f'{table}<p class="stadium">{stadium}</p><p class="game-info">{info}</p>'
+
+
+def page(container, stadium_first):
+    """container: 'per-game'(경기마다 div.game), 'shared'(모든 경기를 감싼 div.score-list 하나), None(body에 바로)"""
+    games = [game_html(*game[:4], stadium_first=stadium_first) for game in GAMES]
+    if container == 'per-game':
+        body = ''.join(f'<div class="game">{html}</div>' for html in games)
+    elif container == 'shared':
+        body = f'<div class="score-list">{"".join(games)}</div>'
+    else:
+        body = ''.join(games)
+    # 레이아웃 div(내비게이션, 광고)는 스트레이너가 버려야 한다
+    chrome = '<div class="nav"><ul><li><a href="/">東京ドーム</a></li></ul></div><div class="ad"></div>'
+    return (f'<html><head><meta charset="utf-8"></head><body>{chrome}<div class="l-main">{body}</div>'
+            f'</body></html>').encode('utf-8')
+
+
+def check_layout(crawler, label, content):
+    response = SimpleNamespace(content=content, headers={'Content-Type': 'text/html; charset=utf-8'})
+    soup = crawler.parse_html(response, 'nikkansports')
+    games = crawler.parse_nikkansports_page(soup, datetime(2025, 4, 1))
+    failures = []
+    if len(games) != len(GAMES):
+        return [f"{label}: parsed {len(games)} games, expected {len(GAMES)}"]
+    seen = set()
+    for game, (_, _, stadium, _, expected) in zip(games, GAMES):
+        got = (game.stadium, game.game_duration, game.attendance, game.weather, game.temperature)
+        want = (stadium,) + expected
+        if got != want:
+            failures.append(f"{label}: {game!r} got {got}, expected {want}")
+        seen.add(got)
+    if len(seen) != len(GAMES):
+        failures.append(f"{label}: games share stadium/info values ({len(seen)} distinct of {len(GAMES)})")
+    mark = '❌' if failures else '✅'
+    print(f"   {mark} {label}: {len(games)} games, {len(seen)} distinct stadium/info")
+    return failures
+
+
+def main(argv):
+    from crawler_core import SimpleCrawler
+
+    crawler = SimpleCrawler()
+    if crawler.parser is None:
+        print("⏭️  Skipped: crawling dependencies (requests, beautifulsoup4) are missing")
+        return 0
+    crawler.logger.setLevel(logging.WARNING)
+    print(f"🏟️  Nikkansports page info check (strainers {'on' if crawler.parser.use_strainers else 'off'}, {crawler.parser.backend})")
+    # 컨테이너 안에서는 구장을 테이블 앞에 둔다 - 컨테이너가 사라지면 뒤 경기 구장을 읽어 실패
+    failures = check_layout(crawler, 'per-game div containers', page('per-game', stadium_first=True))
+    failures += check_layout(crawler, 'one container for all games, stadium first', page('shared', stadium_first=True))
+    failures += check_layout(crawler, 'tables without containers', page(None, stadium_first=False))
+    failures += check_layout(crawler, 'tables without containers, stadium first', page(None, stadium_first=True))
+    crawler.close()
+
+    if failures:
+        print(f"❌ {len(failures)} page info check(s) failed:")
+        for failure in failures:
+            print(f"   {failure}")
+        return 1
+    print("✅ Page info checks passed")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+기동 시간 점검 (네트워크 없음)
+1) 크롤러 모듈과 이를 쓰는 스크립트를 import만 했을 때 무거운 의존성(requests, bs4, selenium,
+   webdriver_manager)이 올라오지 않는지, 로그 디렉토리가 새로 생기지 않는지 확인한다.
+2) --help 같이 크롤하지 않는 실행의 기동 시간을 새 프로세스로 재고, 빈 인터프리터(python -c pass)
+   대비 추가 시간이 예산(기본 100ms)을 넘으면 실패로 끝난다.
+
+Usage:
+  python3 scripts/check_startup.py [--repeat N] [--budget-ms MS]
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+HEAVY_MODULES = ('requests', 'bs4', 'selenium', 'webdriver_manager')
+
+# import만 해 보는 모듈 (crawler/ 와 저장소 루트를 sys.path에 추가)
+IMPORT_TARGETS = ('crawler_core', 'crawler_cli', 'simple_crawler', 'backfill_dates', 'test_single_date')
+
+# 크롤하지 않고 끝나는 실행 (도움말, 인자 검증 실패)
+STARTUP_COMMANDS = (
+    ['crawler/simple_crawler.py', '--help'],
+    ['crawler/simple_crawler.py', '--date', 'not-a-date'],
+    ['crawler/simple_crawler.py', '--workers', 'x'],
+    ['scripts/backfill_dates.py', '--help'],
+)
+
+_IMPORT_PROBE = """
+import sys
+sys.path[:0] = [{crawler!r}, {scripts!r}, {root!r}]
+import {module}
+print(' '.join(name for name in {heavy!r} if name in sys.modules))
+"""
+
+
+def check_imports():
+    """모듈마다 새 프로세스에서 import → 무거운 의존성이 올라온 모듈 목록"""
+    failures = []
+    logs_dir = ROOT / 'logs'
+    logs_existed = logs_dir.exists()
+    for module in IMPORT_TARGETS:
+        probe = _IMPORT_PROBE.format(
+            crawler=str(ROOT / 'crawler'), scripts=str(ROOT / 'scripts'), root=str(ROOT),
+            module=module, heavy=HEAVY_MODULES,
+        )
+        result = subprocess.run([sys.executable, '-c', probe], cwd=ROOT, capture_output=True, text=True)
+        if result.returncode != 0:
+            failures.append(f"{module}: import failed ({result.stderr.strip().splitlines()[-1:]})")
+            continue
+        # 의존성 안내 print가 있을 수 있어 마지막 줄만 본다
+        lines = result.stdout.strip().splitlines()
+        loaded = lines[-1] if lines else ''
+        mark = '❌' if loaded else '✅'
+        print(f"   {mark} import {module}: {'loads ' + loaded if loaded else 'no heavy dependencies'}")
+        if loaded:
+            failures.append(f"{module}: imports {loaded}")
+    if not logs_existed and logs_dir.exists():
+        failures.append("importing crawler modules created logs/")
+    return failures
+
+
+def timed_run(args, repeat):
+    """새 프로세스 실행 repeat회의 중앙값(ms)"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run([sys.executable] + args, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def check_startup(repeat, budget_ms):
+    failures = []
+    baseline = timed_run(['-c', 'pass'], repeat)
+    print(f"   python -c pass: {baseline:6.1f} ms (interpreter baseline)")
+    for args in STARTUP_COMMANDS:
+        elapsed = timed_run(args, repeat)
+        extra = elapsed - baseline
+        mark = '✅' if extra <= budget_ms else '❌'
+        print(f"   {mark} {' '.join(args)}: {elapsed:6.1f} ms (+{extra:.1f} ms)")
+        if extra > budget_ms:
+            failures.append(f"{' '.join(args)}: +{extra:.1f} ms over interpreter start (budget {budget_ms:.0f} ms)")
+    return failures
+
+
+def main(argv):
+    repeat = 5
+    budget_ms = 100.0
+    if '--repeat' in argv:
+        repeat = max(1, int(argv[argv.index('--repeat') + 1]))
+    if '--budget-ms' in argv:
+        budget_ms = float(argv[argv.index('--budget-ms') + 1])
+
+    print("📦 Import check (heavy dependencies must load lazily)")
+    failures = check_imports()
+    print(f"⏱️  Startup check (median of {repeat}, budget +{budget_ms:.0f} ms)")
+    failures += check_startup(repeat, budget_ms)
+
+    if failures:
+        print(f"❌ {len(failures)} startup check(s) failed:")
+        for failure in failures:
+            print(f"   {failure}")
+        return 1
+    print("✅ Startup checks passed")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -5,30 +5,21 @@ JSON 데이터를 TXT 형식으로 역변환하여 크롤링 데이터 시뮬레
 
 import json
 import random
+import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'crawler'))
+from teams import ALL_TEAMS  # noqa: E402
+
 def create_full_season_data():
     """143경기 시즌을 시뮬레이션하는 TXT 데이터 생성"""
     project_root = Path(__file__).parent.parent
     data_dir = project_root / "data" / "simple"
     data_dir.mkdir(parents=True, exist_ok=True)
     
-    # NPB 팀 정보
-    teams = [
-        {"id": 1, "abbr": "YOG", "name": "読売ジャイアンツ", "league": "Central"},
-        {"id": 2, "abbr": "HAN", "name": "阪神タイガース", "league": "Central"},
-        {"id": 3, "abbr": "YDB", "name": "横浜DeNAベイスターズ", "league": "Central"},
-        {"id": 4, "abbr": "HIR", "name": "広島東洋カープ", "league": "Central"},
-        {"id": 5, "abbr": "CHU", "name": "中日ドラゴンズ", "league": "Central"},
-        {"id": 6, "abbr": "YAK", "name": "東京ヤクルトスワローズ", "league": "Central"},
-        {"id": 7, "abbr": "SOF", "name": "福岡ソフトバンクホークス", "league": "Pacific"},
-        {"id": 8, "abbr": "LOT", "name": "千葉ロッテマリーンズ", "league": "Pacific"},
-        {"id": 9, "abbr": "RAK", "name": "東北楽天ゴールデンイーグルス", "league": "Pacific"},
-        {"id": 10, "abbr": "ORI", "name": "オリックスバファローズ", "league": "Pacific"},
-        {"id": 11, "abbr": "SEI", "name": "埼玉西武ライオンズ", "league": "Pacific"},
-        {"id": 12, "abbr": "NIP", "name": "北海道日本ハムファイターズ", "league": "Pacific"}
-    ]
+    # NPB 팀 정보 (teams 레지스트리)
+    teams = ALL_TEAMS
     
     # 기존 JSON 데이터 읽기
     games_file = project_root / "data" / "games.json"
@@ -79,7 +70,7 @@ def create_full_season_data():
                 # 랜덤 팀 선택
                 home_team = random.choice(teams)
                 # 다른 리그나 같은 리그의 다른 팀 선택
-                away_team = random.choice([t for t in teams if t["id"] != home_team["id"]])
+                away_team = random.choice([t for t in teams if t is not home_team])
                 
                 # 랜덤 스코어 생성
                 home_score = random.randint(0, 15)
@@ -91,7 +82,7 @@ def create_full_season_data():
                     away_score = home_score + random.choice([-1, 1])
                     is_draw = False
                 
-                line = f"{date_str}|{home_team['id']}|{home_team['abbr']}|{home_team['name']}|{away_team['id']}|{away_team['abbr']}|{away_team['name']}|{home_score}|{away_score}|{home_team['league']}|completed|{'1' if is_draw else '0'}"
+                line = f"{date_str}|{home_team.id}|{home_team.abbr}|{home_team.name}|{away_team.id}|{away_team.abbr}|{away_team.name}|{home_score}|{away_score}|{home_team.league}|completed|{'1' if is_draw else '0'}"
                 lines.append(line)
             
             current_date += timedelta(days=1)
@@ -1,18 +1,24 @@
 #!/usr/bin/env python3
 """
 완전 새로운 NPB Pipeline
-웹 크롤링 → TXT 저장 → JavaScript 처리 → JSON 저장
+웹 크롤링 → TXT 저장 → JSON 변환 → 검증/요약
+모든 단계를 한 프로세스에서 실행한다 (크롤러 SimpleCrawler, 변환기 txt_to_json을 직접 호출).
+크롤러/변환기 로그는 파이프라인 로그로 바로 흘러가고, 팀 레지스트리와 변환한 경기 데이터는
+다음 단계가 그대로 이어받는다. 단계별 소요 시간은 각 단계 끝과 최종 요약에 남긴다.
 """
 
 import sys
-import os
-import subprocess
+import time
 from pathlib import Path
 import logging
 from datetime import datetime
 
 # 프로젝트 경로 설정
 project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / 'crawler'))
+
+# (단계 이름, 소요 초, 성공 여부)
+stage_times = []
 
 def setup_logging():
     """New Pipeline 전용 로깅 설정"""
@@ -31,82 +37,74 @@ def setup_logging():
     )
     return logging.getLogger('new_pipeline')
 
-def run_web_crawler(mode="7", use_legacy=False):
+def run_stage(label, func, *args, **kwargs):
+    """단계 하나 실행 + 소요 시간 기록 (func 반환값을 그대로 돌려줌)"""
+    started = time.perf_counter()
+    result = func(*args, **kwargs)
+    elapsed = time.perf_counter() - started
+    ok = result.get('success', False) if isinstance(result, dict) else bool(result)
+    stage_times.append((label, elapsed, ok))
+    logger.info(f"⏱️ {label}: {elapsed:.2f}s")
+    return result
+
+def run_web_crawler(mode="7", use_legacy=False, workers=None, force=False, resume=False):
     """웹 크롤링 실행 (TXT 직접 저장)
-    기본: 이닝별 정보 포함(simple_crawler.py) 사용
-    --legacy-crawler 옵션으로 min_results_crawler 사용 가능
+    이닝별 정보를 포함하는 crawler_core.SimpleCrawler를 같은 프로세스에서 실행
     """
     if mode == "full-season":
         logger.info("🕷️ Starting FULL SEASON web crawling (from March 28)...")
-        timeout = 1800  # 30분 (전체 시즌)
     else:
         logger.info(f"🕷️ Starting web crawling for {mode} days...")
-        timeout = 300   # 5분 (일반)
 
-    try:
-        if use_legacy:
-            crawler_path = project_root / 'crawler' / 'min_results_crawler.py'
-        else:
-            # 기본으로 이닝별 정보를 포함하는 simple_crawler 사용
-            crawler_path = project_root / 'crawler' / 'simple_crawler.py'
+    if use_legacy:
+        # --legacy-crawler가 쓰던 min_results_crawler.py는 저장소에 없음
+        logger.error("❌ Legacy crawler (crawler/min_results_crawler.py) is not available")
+        return False
 
+    from crawler_core import SimpleCrawler
+
+    crawler = None
+    try:
+        # workers: 날짜 병렬 크롤, force: games_raw.txt에서 확정된 날짜도 다시 크롤,
+        # resume: 중단된 크롤을 저널에서 이어받기
+        crawler = SimpleCrawler(workers=workers, force=force, resume=resume)
         if mode == "full-season":
-            cmd = ['python3', str(crawler_path), '--full-season']
+            games_count = crawler.crawl_full_season("2025-03-28")
         else:
             # 최근 데이터만 수집하여 기존 데이터 보호
-            cmd = ['python3', str(crawler_path), str(mode)]
-
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout
-        )
-
-        if result.returncode == 0:
-            logger.info("✅ Web crawling completed successfully")
-            if result.stdout:
-                logger.info(f"Crawler output: {result.stdout}")
-            if result.stderr:
-                logger.info(f"Crawler stderr: {result.stderr}")
-            return True
-        else:
-            logger.error(f"❌ Web crawling failed (exit {result.returncode})")
-            if result.stdout:
-                logger.error(f"Crawler stdout: {result.stdout}")
-            if result.stderr:
-                logger.error(f"Crawler stderr: {result.stderr}")
-            return False
-
+            games_count = crawler.crawl_multiple_days(int(mode))
+        crawler.log_network_summary()
     except Exception as e:
         logger.error(f"❌ Web crawling error: {e}")
+        logger.error("   Completed dates are journaled; rerun with --resume to continue")
+        return False
+    finally:
+        if crawler is not None:
+            crawler.close()
+
+    if games_count is None or games_count < 0:
+        logger.error("❌ Web crawling failed")
         return False
+    logger.info(f"✅ Web crawling completed successfully ({games_count} games)")
+    return True
 
 def convert_txt_to_json():
-    """TXT → JavaScript 처리 → JSON 저장"""
-    logger.info("🔄 Converting TXT to JSON via JavaScript...")
-    
+    """TXT → JSON 저장 (순위/대시보드 계산 포함) - 변환 결과를 반환해 요약 단계가 이어서 씀"""
+    logger.info("🔄 Converting TXT to JSON...")
+
+    import txt_to_json
+
     try:
-        cmd = ['node', str(project_root / 'scripts' / 'simple_txt_to_json.js')]
-        
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
-        
-        if result.returncode == 0:
-            logger.info("✅ TXT to JSON conversion completed")
-            logger.info(f"Conversion output: {result.stdout}")
-            return True
-        else:
-            logger.error(f"❌ TXT to JSON conversion failed: {result.stderr}")
-            return False
-            
+        conversion = txt_to_json.convert_all()
     except Exception as e:
         logger.error(f"❌ TXT to JSON conversion error: {e}")
-        return False
+        return None
+
+    if conversion['success']:
+        logger.info("✅ TXT to JSON conversion completed")
+    else:
+        logger.error(f"❌ TXT to JSON conversion failed ({conversion['saved']}/4 files saved)")
+    return conversion
 
 def validate_output_files():
     """출력 파일들 검증"""
@@ -134,58 +132,52 @@ def validate_output_files():
     
     return valid_files == len(required_files)
 
-def generate_final_summary():
-    """최종 파이프라인 요약 생성"""
+def generate_final_summary(conversion=None):
+    """최종 파이프라인 요약 생성 (변환 단계 결과를 그대로 사용, JSON 재파싱 없음)"""
     logger.info("📊 Generating final pipeline summary...")
     
     try:
-        import json
-        
         summary = []
         summary.append("=" * 80)
         summary.append(f"NPB 완전 새로운 Pipeline 완료 - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         summary.append("=" * 80)
         summary.append("")
         summary.append("🚀 Pipeline 플로우:")
-        summary.append("  웹 크롤링 → TXT 저장 → JavaScript 처리 → JSON 저장")
+        summary.append("  웹 크롤링 → TXT 저장 → JSON 변환 (한 프로세스)")
         summary.append("  📝 간단하고 빠른 파이프라인!")
         summary.append("")
         
-        # JSON 데이터 검증
-        data_dir = project_root / 'data'
-        
-        # 순위표 정보
-        standings_file = data_dir / 'standings.json'
-        if standings_file.exists():
-            with open(standings_file, 'r', encoding='utf-8') as f:
-                standings_data = json.load(f)
-                central_teams = len(standings_data.get('central_league', {}).get('standings', []))
-                pacific_teams = len(standings_data.get('pacific_league', {}).get('standings', []))
+        if conversion:
+            # 순위표 정보
+            standings = conversion.get('standings')
+            if standings:
+                central_teams = len(standings['central_league']['standings'])
+                pacific_teams = len(standings['pacific_league']['standings'])
                 summary.append(f"📊 순위 계산: 센트럴 {central_teams}팀, 퍼시픽 {pacific_teams}팀")
-        
-        # 경기 정보
-        games_file = data_dir / 'games.json'
-        if games_file.exists():
-            with open(games_file, 'r', encoding='utf-8') as f:
-                games_data = json.load(f)
-                total_games = len(games_data) if isinstance(games_data, list) else 0
-                draws = sum(1 for game in games_data if game.get('is_draw', False)) if isinstance(games_data, list) else 0
-                summary.append(f"⚾ 경기 데이터: {total_games}경기 (무승부 {draws}경기)")
-        
-        # 대시보드 정보
-        dashboard_file = data_dir / 'dashboard.json'
-        if dashboard_file.exists():
-            with open(dashboard_file, 'r', encoding='utf-8') as f:
-                dashboard_data = json.load(f)
-                today_games = dashboard_data.get('season_stats', {}).get('today_games', 0)
-                week_games = dashboard_data.get('season_stats', {}).get('week_games', 0)
+            
+            # 경기 정보 (games.json과 같은 완료 경기 목록)
+            games = conversion.get('completed')
+            if games is not None:
+                draws = sum(1 for game in games if game.get('is_draw', False))
+                summary.append(f"⚾ 경기 데이터: {len(games)}경기 (무승부 {draws}경기)")
+            
+            # 대시보드 정보
+            dashboard = conversion.get('dashboard')
+            if dashboard:
+                today_games = dashboard['season_stats']['today_games']
+                week_games = dashboard['season_stats']['week_games']
                 summary.append(f"📈 대시보드: 오늘 {today_games}경기, 이번주 {week_games}경기")
         
+        summary.append("")
+        summary.append("⏱️ 단계별 소요 시간:")
+        for label, elapsed, ok in stage_times:
+            summary.append(f"  {'✅' if ok else '❌'} {label}: {elapsed:.2f}s")
+        summary.append(f"  합계: {sum(elapsed for _, elapsed, _ in stage_times):.2f}s")
         summary.append("")
         summary.append("🎯 파이프라인 완료:")
         summary.append("  ✅ 웹 크롤링으로 실시간 데이터 수집")
         summary.append("  ✅ TXT 형식으로 데이터 저장")
-        summary.append("  ✅ JavaScript로 순위 계산")
+        summary.append("  ✅ 순위/대시보드 계산")
         summary.append("  ✅ JSON 파일 생성 (index.html 호환)")
         summary.append("  ✅ 외부 의존성 최소화")
         summary.append("")
@@ -213,7 +205,7 @@ def main():
     logger = setup_logging()
     
     logger.info("🚀 Starting NPB NEW PIPELINE")
-    logger.info("🔄 Flow: Web Crawling → TXT → JavaScript → JSON")
+    logger.info("🔄 Flow: Web Crawling → TXT → JSON (in-process)")
     
     success_count = 0
     total_steps = 4
@@ -229,6 +221,26 @@ def main():
     if '--legacy-crawler' in args:
         use_legacy = True
         args = [a for a in args if a != '--legacy-crawler']
+
+    force = False
+    if '--force' in args:
+        force = True
+        args = [a for a in args if a != '--force']
+
+    resume = False
+    if '--resume' in args:
+        resume = True
+        args = [a for a in args if a != '--resume']
+
+    workers = None
+    if '--workers' in args:
+        idx = args.index('--workers')
+        try:
+            workers = int(args[idx + 1])
+        except (IndexError, ValueError):
+            logger.error("Invalid --workers value")
+            sys.exit(1)
+        args = args[:idx] + args[idx + 2:]
     
     # 크롤링 모드 설정
     crawl_mode = "7"  # 기본 7일
@@ -255,22 +267,24 @@ def main():
             logger.info("Step 1/4: Full season web crawling (from March 28)")
         else:
             logger.info(f"Step 1/4: Web crawling ({crawl_mode} days)")
-        if run_web_crawler(crawl_mode, use_legacy=use_legacy):
+        if run_stage("Web crawling", run_web_crawler, crawl_mode, use_legacy=use_legacy,
+                     workers=workers, force=force, resume=resume):
             success_count += 1
     
-    # Step 2: TXT → JSON 변환 (JavaScript 처리)  
+    # Step 2: TXT → JSON 변환
     logger.info("Step 2/4: TXT to JSON conversion")
-    if convert_txt_to_json():
+    conversion = run_stage("TXT to JSON", convert_txt_to_json)
+    if conversion and conversion['success']:
         success_count += 1
     
     # Step 3: 출력 파일 검증
     logger.info("Step 3/4: Output file validation")
-    if validate_output_files():
+    if run_stage("Validation", validate_output_files):
         success_count += 1
     
     # Step 4: 최종 요약
     logger.info("Step 4/4: Final summary generation")
-    if generate_final_summary():
+    if run_stage("Summary", generate_final_summary, conversion):
         success_count += 1
     
     # 최종 결과
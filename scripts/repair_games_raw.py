@@ -4,112 +4,127 @@ Repair data/simple/games_raw.txt
 
 Goals:
 - Fix malformed game lines using meta IDs (home/away abbr, league)
+- For lines without meta, resolve team labels (crawler/team_resolver.py) and fix the league
 - Preserve date headers, game line, and meta line
 - Keep inning detail lines ("# 📊 이닝별: ...")
 - Drop hits/errors lines ("# 📊 안타...", "# 📊 실책...")
 - Preserve existing [DRAW]/[SCHEDULED]/[POSTPONED] tags without inventing new ones
 
 This script rewrites the file in-place.
+With --from/--to (YYYY-MM-DD) only those date blocks are repaired; the date index
+(data/cache/games_raw.txt.idx.json) locates them and the other blocks are copied as-is.
 """
 
+import os
 import re
+import sys
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
 RAW = ROOT / 'data' / 'simple' / 'games_raw.txt'
+CACHE = ROOT / 'data' / 'cache'
+
+sys.path.insert(0, str(ROOT / 'crawler'))
+from games_index import GamesIndex, index_file_for  # noqa: E402
+from games_txt import iter_entries, rewrite_dates  # noqa: E402
+from team_resolver import default_resolver  # noqa: E402
+from teams import by_id  # noqa: E402
+
+
+def is_hits_errors_line(line):
+    s = line.strip()
+    return s.startswith('# 📊 안타') or s.startswith('# 📊 실책')
+
+
+def repair_game(game, resolver):
+    """경기 항목 하나 → 고친 줄 목록"""
+    lines = [raw.rstrip('\r\n') for raw in game.lines]
+    s = lines[0].strip()
+    if game.pipe:
+        return lines
+
+    if game.away_id is not None:
+        # 메타 줄의 ID로 약어/리그 복원 (teams 레지스트리)
+        away, home = by_id(game.away_id), by_id(game.home_id)
+        away_abbr = away.abbr if away else 'UNK'
+        home_abbr = home.abbr if home else 'UNK'
+        league = home.league if home else 'Central'
+
+        # Flags from original line
+        draw_flag = ' [DRAW]' if '[DRAW]' in s else ''
+        status_flag = ''
+        if '[SCHEDULED]' in s:
+            status_flag = ' [SCHEDULED]'
+        elif '[POSTPONED]' in s:
+            status_flag = ' [POSTPONED]'
+
+        # Preserve trailing venue/time piece (starting with @ if exists)
+        mtrail = re.search(r'(\s@\s.*)$', s)
+        trail = mtrail.group(1) if mtrail else ''
+
+        # Determine core: score or vs
+        core = f"{game.away_score}-{game.home_score}" if game.away_score is not None else 'vs'
+        lines[0] = f"{away_abbr} {core} {home_abbr} ({league}){draw_flag}{status_flag}{trail}"
+    elif game.league in ('Central', 'Pacific'):
+        # No meta: keep the line, but fix the league from the resolved home team
+        away_info = resolver.resolve(game.away_label)
+        home_info = resolver.resolve(game.home_label)
+        if away_info and home_info and game.league != home_info.league:
+            lines[0] = lines[0].replace(f"({game.league})", f"({home_info.league})", 1)
+
+    return [lines[0]] + [line for line in lines[1:] if not is_hits_errors_line(line)]
 
-ID_TO_TEAM = {
-    1: {'abbr': 'YOG', 'league': 'Central'},
-    2: {'abbr': 'HAN', 'league': 'Central'},
-    3: {'abbr': 'YDB', 'league': 'Central'},
-    4: {'abbr': 'HIR', 'league': 'Central'},
-    5: {'abbr': 'CHU', 'league': 'Central'},
-    6: {'abbr': 'YAK', 'league': 'Central'},
-    7: {'abbr': 'SOF', 'league': 'Pacific'},
-    8: {'abbr': 'LOT', 'league': 'Pacific'},
-    9: {'abbr': 'RAK', 'league': 'Pacific'},
-    10: {'abbr': 'ORI', 'league': 'Pacific'},
-    11: {'abbr': 'SEI', 'league': 'Pacific'},
-    12: {'abbr': 'NIP', 'league': 'Pacific'},
-}
 
 def sanitize_file():
-    text = RAW.read_text(encoding='utf-8')
-    lines = text.splitlines()
-    out = []
-
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        s = line.strip()
-
-        # Keep date headers as-is
-        if s.startswith('# ') and re.match(r'^#\s*\d{4}-\d{2}-\d{2}$', s):
-            out.append(line)
-            i += 1
-            continue
-
-        # Drop hits/errors lines
-        if s.startswith('# 📊 안타') or s.startswith('# 📊 실책'):
-            i += 1
-            continue
-
-        # Keep inning detail and any other non-game comment lines as-is
-        if s.startswith('# '):
-            out.append(line)
-            i += 1
-            continue
-
-        # Attempt to pair a game line with following meta line
-        if s and not s.startswith('#'):
-            next_line = lines[i+1] if i+1 < len(lines) else ''
-            mmeta = re.match(r'^#\s*(\d+)\|(\d+)\|([^|]+)\|([^|]+)\s*$', next_line.strip())
-            # Extract score from the current line if present
-            mscore = re.search(r'(\d+)-(\d+)', s)
-            score_str = None
-            if mscore:
-                score_str = f"{mscore.group(1)}-{mscore.group(2)}"
-
-            if mmeta:
-                away_id = int(mmeta.group(1))
-                home_id = int(mmeta.group(2))
-                away_abbr = ID_TO_TEAM.get(away_id, {}).get('abbr', 'UNK')
-                home_abbr = ID_TO_TEAM.get(home_id, {}).get('abbr', 'UNK')
-                league = ID_TO_TEAM.get(home_id, {}).get('league', 'Central')
-
-                # Flags from original line
-                draw_flag = ' [DRAW]' if '[DRAW]' in s else ''
-                status_flag = ''
-                if '[SCHEDULED]' in s:
-                    status_flag = ' [SCHEDULED]'
-                elif '[POSTPONED]' in s:
-                    status_flag = ' [POSTPONED]'
-
-                # Preserve trailing venue/time piece (starting with @ if exists)
-                mtrail = re.search(r'(\s@\s.*)$', s)
-                trail = mtrail.group(1) if mtrail else ''
-
-                # Determine core: score or vs
-                core = score_str if score_str else 'vs'
-
-                fixed = f"{away_abbr} {core} {home_abbr} ({league}){draw_flag}{status_flag}{trail}"
-                out.append(fixed)
-                out.append(next_line)
-                i += 2
-                continue
-
-            # If no meta, keep line as-is
-            out.append(line)
-            i += 1
-            continue
-
-        # Default: passthrough
-        out.append(line)
-        i += 1
-
-    RAW.write_text('\n'.join(out) + '\n', encoding='utf-8')
+    resolver = default_resolver()
+    tmp = RAW.with_name(RAW.name + f".tmp{os.getpid()}")
+    # 한 줄씩 읽어 임시 파일에 쓴 뒤 교체
+    with open(tmp, 'w', encoding='utf-8') as out:
+        for entry in iter_entries(RAW):
+            if entry.kind == 'game':
+                lines = repair_game(entry, resolver)
+            else:
+                # 날짜 헤더/이닝별 등 주석은 그대로, 안타·실책 줄만 제거
+                lines = [raw.rstrip('\r\n') for raw in entry.lines if not is_hits_errors_line(raw)]
+            for line in lines:
+                out.write(line + '\n')
+    os.replace(tmp, RAW)
+
+
+def repair_dates(start=None, end=None):
+    """start~end 날짜 블록의 경기만 고쳐 쓴다 (반환: 고친 날짜 수)"""
+    resolver = default_resolver()
+    index_file = index_file_for(RAW, CACHE)
+    with GamesIndex(RAW, index_file) as index:
+        dates = index.dates(start, end)
+    if not dates:
+        return 0
+
+    def merge(date, games):
+        for game in games:
+            game.lines = [line + '\n' for line in repair_game(game, resolver)]
+        return games
+
+    rewrite_dates(RAW, dates, merge, index_file=index_file)
+    return len(dates)
+
+
+def parse_args(argv):
+    start = end = None
+    it = iter(argv)
+    for arg in it:
+        if arg == '--from':
+            start = next(it, None)
+        elif arg == '--to':
+            end = next(it, None)
+    return start, end
 
-if __name__ == '__main__':
-    sanitize_file()
-    print('✅ Repaired games_raw.txt (removed hits/errors; fixed team abbr/league using IDs).')
 
+if __name__ == '__main__':
+    start, end = parse_args(sys.argv[1:])
+    if start or end:
+        count = repair_dates(start, end)
+        print(f'✅ Repaired {count} date blocks of games_raw.txt ({start or "..."} ~ {end or "..."}).')
+    else:
+        sanitize_file()
+        print('✅ Repaired games_raw.txt (removed hits/errors; fixed team abbr/league using IDs).')
@@ -4,7 +4,7 @@
 """
 import sys
 sys.path.insert(0, 'crawler')
-from simple_crawler import SimpleCrawler
+from crawler_core import SimpleCrawler
 from datetime import datetime
 
 def test_single_date():
@@ -20,8 +20,8 @@ def test_single_date():
     if games:
         print("\n🎮 Game results:")
         for i, game in enumerate(games, 1):
-            print(f"{i}. {game['home_team_abbr']} {game['home_score']}-{game['away_score']} {game['away_team_abbr']} ({game['league']})")
-            if game['is_draw']:
+            print(f"{i}. {game.home.abbr} {game.home_score}-{game.away_score} {game.away.abbr} ({game.league})")
+            if game.is_draw:
                 print("   🤝 DRAW")
     
     return games
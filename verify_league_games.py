@@ -3,27 +3,27 @@
 리그 내 경기와 인터리그 경기를 분리해서 정확한 기록 계산
 """
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / 'crawler'))
+from games_index import GamesIndex, index_file_for  # noqa: E402
+from games_txt import iter_games_between  # noqa: E402
+from team_resolver import default_resolver  # noqa: E402
+from teams import ALL_TEAMS, BY_ABBR, CENTRAL, PACIFIC  # noqa: E402
+
+
 def analyze_league_games():
     games_file = "data/simple/games_raw.txt"
     
-    # 팀별 통계 초기화
+    # 팀별 통계 초기화 (레지스트리 Team이 키)
     team_stats = {
-        'CHU': {'league_games': 0, 'inter_games': 0, 'total_games': 0, 'wins': 0, 'losses': 0, 'draws': 0, 'league': 'Central'},
-        'HAN': {'league_games': 0, 'inter_games': 0, 'total_games': 0, 'wins': 0, 'losses': 0, 'draws': 0, 'league': 'Central'},
-        'HIR': {'league_games': 0, 'inter_games': 0, 'total_games': 0, 'wins': 0, 'losses': 0, 'draws': 0, 'league': 'Central'},
-        'YAK': {'league_games': 0, 'inter_games': 0, 'total_games': 0, 'wins': 0, 'losses': 0, 'draws': 0, 'league': 'Central'},
-        'YDB': {'league_games': 0, 'inter_games': 0, 'total_games': 0, 'wins': 0, 'losses': 0, 'draws': 0, 'league': 'Central'},
-        'YOG': {'league_games': 0, 'inter_games': 0, 'total_games': 0, 'wins': 0, 'losses': 0, 'draws': 0, 'league': 'Central'},
-        'LOT': {'league_games': 0, 'inter_games': 0, 'total_games': 0, 'wins': 0, 'losses': 0, 'draws': 0, 'league': 'Pacific'},
-        'NIP': {'league_games': 0, 'inter_games': 0, 'total_games': 0, 'wins': 0, 'losses': 0, 'draws': 0, 'league': 'Pacific'},
-        'ORI': {'league_games': 0, 'inter_games': 0, 'total_games': 0, 'wins': 0, 'losses': 0, 'draws': 0, 'league': 'Pacific'},
-        'RAK': {'league_games': 0, 'inter_games': 0, 'total_games': 0, 'wins': 0, 'losses': 0, 'draws': 0, 'league': 'Pacific'},
-        'SEI': {'league_games': 0, 'inter_games': 0, 'total_games': 0, 'wins': 0, 'losses': 0, 'draws': 0, 'league': 'Pacific'},
-        'SOF': {'league_games': 0, 'inter_games': 0, 'total_games': 0, 'wins': 0, 'losses': 0, 'draws': 0, 'league': 'Pacific'}
+        team: {'league_games': 0, 'inter_games': 0, 'total_games': 0, 'wins': 0, 'losses': 0, 'draws': 0, 'league': team.league}
+        for team in ALL_TEAMS
     }
     
-    central_teams = ['CHU', 'HAN', 'HIR', 'YAK', 'YDB', 'YOG']
-    pacific_teams = ['LOT', 'NIP', 'ORI', 'RAK', 'SEI', 'SOF']
+    central_teams = sorted(CENTRAL, key=lambda team: team.abbr)
+    pacific_teams = sorted(PACIFIC, key=lambda team: team.abbr)
     
     print("🔍 NPB 2025 리그 내/인터리그 경기 분석 (9월 2일까지)")
     print("=" * 70)
@@ -31,31 +31,21 @@ def analyze_league_games():
     league_games = 0
     inter_games = 0
     
-    with open(games_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-                
-            parts = line.split('|')
-            if len(parts) < 12:
-                continue
-            
-            # 9월 2일까지만 계산
-            game_date = parts[0]
-            if game_date > "2025-09-02":
+    # 날짜 인덱스로 9월 2일까지의 블록만 읽어 팀 약어까지 해석 (점수 없는 예정/연기 경기는 제외)
+    with GamesIndex(games_file, index_file_for(games_file, "data/cache")) as index:
+        for game in iter_games_between(index, end="2025-09-02", resolver=default_resolver()):
+            if game.home_score is None or game.away_score is None:
                 continue
                 
-            home_team = parts[2]
-            away_team = parts[5]
-            home_score = int(parts[7])
-            away_score = int(parts[8])
-            is_draw = int(parts[11])
+            home_team = BY_ABBR.get(game.home_abbr)
+            away_team = BY_ABBR.get(game.away_abbr)
+            home_score = game.home_score
+            away_score = game.away_score
+            is_draw = game.is_draw
             
             # 인터리그 vs 리그내 경기 판단
             is_inter_league = False
-            if (home_team in central_teams and away_team in pacific_teams) or \
-               (home_team in pacific_teams and away_team in central_teams):
+            if home_team is not None and away_team is not None and home_team.league != away_team.league:
                 is_inter_league = True
                 inter_games += 1
             else:
@@ -74,7 +64,7 @@ def analyze_league_games():
                     team_stats[team]['league_games'] += 1
                 
                 # 승패무 계산
-                if team == home_team:
+                if team is home_team:
                     opponent_score = away_score
                     team_score = home_score
                 else:
@@ -118,13 +108,13 @@ def analyze_league_games():
     
     for team in central_teams:
         stats = team_stats[team]
-        if team in official_central:
-            official = official_central[team]
+        if team.abbr in official_central:
+            official = official_central[team.abbr]
             match_status = "✅" if (stats['total_games'] == official['total'] and 
                                    stats['wins'] == official['wins'] and 
                                    stats['losses'] == official['losses'] and 
                                    stats['draws'] == official['draws']) else "❌"
-            print(f"{team:5} | {stats['total_games']:6} | {stats['league_games']:6} | {stats['inter_games']:4} | {stats['wins']:3} | {stats['losses']:3} | {stats['draws']:2} | {match_status} {official['total']}-{official['wins']}-{official['losses']}-{official['draws']}")
+            print(f"{team.abbr:5} | {stats['total_games']:6} | {stats['league_games']:6} | {stats['inter_games']:4} | {stats['wins']:3} | {stats['losses']:3} | {stats['draws']:2} | {match_status} {official['total']}-{official['wins']}-{official['losses']}-{official['draws']}")
     
     print(f"\n📊 Pacific League 비교:")
     print("팀    | 총경기 | 리그내 | 인터 | 승  | 패  | 무 | 공식(총-승-패-무)")
@@ -132,13 +122,13 @@ def analyze_league_games():
     
     for team in pacific_teams:
         stats = team_stats[team]
-        if team in official_pacific:
-            official = official_pacific[team]
+        if team.abbr in official_pacific:
+            official = official_pacific[team.abbr]
             match_status = "✅" if (stats['total_games'] == official['total'] and 
                                    stats['wins'] == official['wins'] and 
                                    stats['losses'] == official['losses'] and 
                                    stats['draws'] == official['draws']) else "❌"
-            print(f"{team:5} | {stats['total_games']:6} | {stats['league_games']:6} | {stats['inter_games']:4} | {stats['wins']:3} | {stats['losses']:3} | {stats['draws']:2} | {match_status} {official['total']}-{official['wins']}-{official['losses']}-{official['draws']}")
+            print(f"{team.abbr:5} | {stats['total_games']:6} | {stats['league_games']:6} | {stats['inter_games']:4} | {stats['wins']:3} | {stats['losses']:3} | {stats['draws']:2} | {match_status} {official['total']}-{official['wins']}-{official['losses']}-{official['draws']}")
 
 if __name__ == "__main__":
     analyze_league_games()
\ No newline at end of file
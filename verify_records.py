@@ -3,14 +3,22 @@
 팀별 실제 승패 기록 정확히 계산
 """
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / 'crawler'))
+from games_txt import iter_games  # noqa: E402
+from team_resolver import default_resolver  # noqa: E402
+from teams import ALL_TEAMS, BY_ABBR, CENTRAL, PACIFIC  # noqa: E402
+
+
 def verify_team_records():
     games_file = "data/simple/games_raw.txt"
     
-    # 팀별 통계 초기화
+    # 팀별 통계 초기화 (레지스트리 Team이 키)
     team_stats = {}
-    teams = ['CHU', 'HAN', 'HIR', 'LOT', 'NIP', 'ORI', 'RAK', 'SEI', 'SOF', 'YAK', 'YDB', 'YOG']
     
-    for team in teams:
+    for team in ALL_TEAMS:
         team_stats[team] = {
             'games': 0,
             'wins': 0,
@@ -23,21 +31,17 @@ def verify_team_records():
     print("🔍 NPB 2025 시즌 정확한 팀별 기록 검증")
     print("=" * 60)
     
+    # 가독/파이프 형식 모두 한 줄씩 읽어 팀 약어까지 해석 (점수 없는 예정/연기 경기는 제외)
     with open(games_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-                
-            parts = line.split('|')
-            if len(parts) < 12:
+        for game in iter_games(f, default_resolver()):
+            if game.home_score is None or game.away_score is None:
                 continue
                 
-            home_team = parts[2]
-            away_team = parts[5]
-            home_score = int(parts[7])
-            away_score = int(parts[8])
-            is_draw = int(parts[11])
+            home_team = BY_ABBR.get(game.home_abbr)
+            away_team = BY_ABBR.get(game.away_abbr)
+            home_score = game.home_score
+            away_score = game.away_score
+            is_draw = game.is_draw
             
             # 홈팀 기록
             if home_team in team_stats:
@@ -66,8 +70,8 @@ def verify_team_records():
                     team_stats[away_team]['losses'] += 1
     
     # Central League 팀들
-    central_teams = ['CHU', 'HAN', 'HIR', 'YAK', 'YDB', 'YOG']
-    pacific_teams = ['LOT', 'NIP', 'ORI', 'RAK', 'SEI', 'SOF']
+    central_teams = sorted(CENTRAL, key=lambda team: team.abbr)
+    pacific_teams = sorted(PACIFIC, key=lambda team: team.abbr)
     
     print("\n📊 Central League")
     print("팀    | 경기 | 승  | 패  | 무 | 승률   | 득점 | 실점 | 득실차")
@@ -79,7 +83,7 @@ def verify_team_records():
         stats = team_stats[team]
         win_pct = stats['wins'] / (stats['wins'] + stats['losses']) if stats['wins'] + stats['losses'] > 0 else 0
         diff = stats['runs_for'] - stats['runs_against']
-        print(f"{team:5} | {stats['games']:4} | {stats['wins']:3} | {stats['losses']:3} | {stats['draws']:2} | {win_pct:.3f} | {stats['runs_for']:4} | {stats['runs_against']:4} | {diff:+4}")
+        print(f"{team.abbr:5} | {stats['games']:4} | {stats['wins']:3} | {stats['losses']:3} | {stats['draws']:2} | {win_pct:.3f} | {stats['runs_for']:4} | {stats['runs_against']:4} | {diff:+4}")
     
     print(f"\n📊 Pacific League")
     print("팀    | 경기 | 승  | 패  | 무 | 승률   | 득점 | 실점 | 득실차")
@@ -91,7 +95,7 @@ def verify_team_records():
         stats = team_stats[team]
         win_pct = stats['wins'] / (stats['wins'] + stats['losses']) if stats['wins'] + stats['losses'] > 0 else 0
         diff = stats['runs_for'] - stats['runs_against']
-        print(f"{team:5} | {stats['games']:4} | {stats['wins']:3} | {stats['losses']:3} | {stats['draws']:2} | {win_pct:.3f} | {stats['runs_for']:4} | {stats['runs_against']:4} | {diff:+4}")
+        print(f"{team.abbr:5} | {stats['games']:4} | {stats['wins']:3} | {stats['losses']:3} | {stats['draws']:2} | {win_pct:.3f} | {stats['runs_for']:4} | {stats['runs_against']:4} | {diff:+4}")
     
     # 총합 검증
     total_games = sum(stats['games'] for stats in team_stats.values()) // 2  # 한 경기는 2팀이 참여하므로 2로 나누기
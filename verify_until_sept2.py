@@ -3,14 +3,23 @@
 9월 2일까지의 정확한 NPB 성적 계산
 """
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / 'crawler'))
+from games_index import GamesIndex, index_file_for  # noqa: E402
+from games_txt import iter_games_between  # noqa: E402
+from team_resolver import default_resolver  # noqa: E402
+from teams import ALL_TEAMS, BY_ABBR, CENTRAL, PACIFIC  # noqa: E402
+
+
 def calculate_records_until_sept2():
     games_file = "data/simple/games_raw.txt"
     
-    # 팀별 통계 초기화
+    # 팀별 통계 초기화 (레지스트리 Team이 키)
     team_stats = {}
-    teams = ['CHU', 'HAN', 'HIR', 'LOT', 'NIP', 'ORI', 'RAK', 'SEI', 'SOF', 'YAK', 'YDB', 'YOG']
     
-    for team in teams:
+    for team in ALL_TEAMS:
         team_stats[team] = {
             'games': 0,
             'wins': 0,
@@ -23,26 +32,17 @@ def calculate_records_until_sept2():
     print("🔍 NPB 2025 시즌 9월 2일까지 정확한 기록")
     print("=" * 60)
     
-    with open(games_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-                
-            parts = line.split('|')
-            if len(parts) < 12:
-                continue
-            
-            # 9월 2일까지만 계산
-            game_date = parts[0]
-            if game_date > "2025-09-02":
+    # 날짜 인덱스로 9월 2일까지의 블록만 읽어 팀 약어까지 해석 (점수 없는 예정/연기 경기는 제외)
+    with GamesIndex(games_file, index_file_for(games_file, "data/cache")) as index:
+        for game in iter_games_between(index, end="2025-09-02", resolver=default_resolver()):
+            if game.home_score is None or game.away_score is None:
                 continue
                 
-            home_team = parts[2]
-            away_team = parts[5]
-            home_score = int(parts[7])
-            away_score = int(parts[8])
-            is_draw = int(parts[11])
+            home_team = BY_ABBR.get(game.home_abbr)
+            away_team = BY_ABBR.get(game.away_abbr)
+            home_score = game.home_score
+            away_score = game.away_score
+            is_draw = game.is_draw
             
             # 홈팀 기록
             if home_team in team_stats:
@@ -71,8 +71,8 @@ def calculate_records_until_sept2():
                     team_stats[away_team]['losses'] += 1
     
     # Central League 팀들
-    central_teams = ['CHU', 'HAN', 'HIR', 'YAK', 'YDB', 'YOG']
-    pacific_teams = ['LOT', 'NIP', 'ORI', 'RAK', 'SEI', 'SOF']
+    central_teams = sorted(CENTRAL, key=lambda team: team.abbr)
+    pacific_teams = sorted(PACIFIC, key=lambda team: team.abbr)
     
     print("\n📊 Central League (9월 2일까지)")
     print("팀     | 경기 | 승  | 패  | 무 | 승률   | 공식승률과 비교")
@@ -94,15 +94,15 @@ def calculate_records_until_sept2():
         stats = team_stats[team]
         win_pct = stats['wins'] / (stats['wins'] + stats['losses']) if stats['wins'] + stats['losses'] > 0 else 0
         
-        if team in official_central:
-            official = official_central[team]
+        if team.abbr in official_central:
+            official = official_central[team.abbr]
             match_status = "✅" if (stats['games'] == official['games'] and 
                                    stats['wins'] == official['wins'] and 
                                    stats['losses'] == official['losses'] and 
                                    stats['draws'] == official['draws']) else "❌"
-            print(f"{team:6} | {stats['games']:4} | {stats['wins']:3} | {stats['losses']:3} | {stats['draws']:2} | {win_pct:.3f} | {match_status} 공식: {official['games']}-{official['wins']}-{official['losses']}-{official['draws']}")
+            print(f"{team.abbr:6} | {stats['games']:4} | {stats['wins']:3} | {stats['losses']:3} | {stats['draws']:2} | {win_pct:.3f} | {match_status} 공식: {official['games']}-{official['wins']}-{official['losses']}-{official['draws']}")
         else:
-            print(f"{team:6} | {stats['games']:4} | {stats['wins']:3} | {stats['losses']:3} | {stats['draws']:2} | {win_pct:.3f}")
+            print(f"{team.abbr:6} | {stats['games']:4} | {stats['wins']:3} | {stats['losses']:3} | {stats['draws']:2} | {win_pct:.3f}")
     
     print(f"\n📊 Pacific League (9월 2일까지)")
     print("팀     | 경기 | 승  | 패  | 무 | 승률   | 공식승률과 비교")
@@ -124,15 +124,15 @@ def calculate_records_until_sept2():
         stats = team_stats[team]
         win_pct = stats['wins'] / (stats['wins'] + stats['losses']) if stats['wins'] + stats['losses'] > 0 else 0
         
-        if team in official_pacific:
-            official = official_pacific[team]
+        if team.abbr in official_pacific:
+            official = official_pacific[team.abbr]
             match_status = "✅" if (stats['games'] == official['games'] and 
                                    stats['wins'] == official['wins'] and 
                                    stats['losses'] == official['losses'] and 
                                    stats['draws'] == official['draws']) else "❌"
-            print(f"{team:6} | {stats['games']:4} | {stats['wins']:3} | {stats['losses']:3} | {stats['draws']:2} | {win_pct:.3f} | {match_status} 공식: {official['games']}-{official['wins']}-{official['losses']}-{official['draws']}")
+            print(f"{team.abbr:6} | {stats['games']:4} | {stats['wins']:3} | {stats['losses']:3} | {stats['draws']:2} | {win_pct:.3f} | {match_status} 공식: {official['games']}-{official['wins']}-{official['losses']}-{official['draws']}")
         else:
-            print(f"{team:6} | {stats['games']:4} | {stats['wins']:3} | {stats['losses']:3} | {stats['draws']:2} | {win_pct:.3f}")
+            print(f"{team.abbr:6} | {stats['games']:4} | {stats['wins']:3} | {stats['losses']:3} | {stats['draws']:2} | {win_pct:.3f}")
     
     # 총합 검증
     total_games_until_sept2 = sum(stats['games'] for stats in team_stats.values()) // 2